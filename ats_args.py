@@ -0,0 +1,203 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_args.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines command line argument parsers of ats_coverage commands.
+'''
+
+from __future__ import annotations
+
+from os import cpu_count
+from argparse import ArgumentParser, ArgumentTypeError, Namespace
+
+from ats_core import CORES
+from ats_report import REPORT_WRITERS
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__ = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__ = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__ = '5.0.0'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+def _jobs_type(value: str) -> int:
+    '''
+        Converts the jobs argument (0 means one job per CPU).
+
+        :param value: Argument value.
+        :return: Number of worker processes.
+        :exceptions:
+            | ArgumentTypeError: The value is not a non-negative integer.
+    '''
+    if not value.isdigit():
+        raise ArgumentTypeError(f'invalid jobs value {value!r}')
+
+    return int(value) or cpu_count() or 1
+
+
+def _shard_type(value: str) -> tuple[int, int]:
+    '''
+        Converts the shard argument i/n (shard number i of n shards).
+
+        :param value: Argument value.
+        :return: Shard number (1 based) and number of shards.
+        :exceptions:
+            | ArgumentTypeError: The value is not i/n with 1 <= i <= n.
+    '''
+    index, _, total = value.partition('/')
+
+    if not index.isdigit() or not total.isdigit() or not 1 <= int(index) <= int(total):
+        raise ArgumentTypeError(f'invalid shard value {value!r}, expected i/n with 1 <= i <= n')
+
+    return int(index), int(total)
+
+
+def parse_args(args: list[str]) -> Namespace:
+    '''
+        Parses command line arguments.
+
+        :param args: Command line arguments without the program name.
+        :return: Parsed arguments.
+        :exceptions: None.
+    '''
+    parser = ArgumentParser(prog='ats_coverage', description='Python code coverage automation')
+    parser.add_argument(
+        'projects', nargs='*',
+        help='project names, paths or glob patterns (default: projects option in config)'
+    )
+    parser.add_argument(
+        '-j', '--jobs', type=_jobs_type, default=1,
+        help='run test modules in N worker processes (0 = one per CPU)'
+    )
+    parser.add_argument(
+        '-i', '--incremental', action='store_true',
+        help='record per-test contexts and rerun only tests affected by changes'
+    )
+    parser.add_argument(
+        '-s', '--shard', type=_shard_type, metavar='I/N',
+        help='run only shard I of N (by test module) into a shard data file'
+    )
+    parser.add_argument(
+        '-w', '--watch', action='store_true',
+        help='stay resident and rerun affected tests on every change (Ctrl+C to stop)'
+    )
+    parser.add_argument(
+        '-c', '--core', choices=CORES,
+        help='coverage core (sysmon has the lowest overhead on Python 3.12+)'
+    )
+    parser.add_argument(
+        '-n', '--no-cache', action='store_true',
+        help='always run tests instead of reusing outputs of an identical run'
+    )
+    parser.add_argument(
+        '-t', '--trace-events', metavar='FILE',
+        help='write phase timing as Chrome trace-event JSON'
+    )
+    parser.add_argument(
+        '-o', '--overhead', action='store_true',
+        help='also run tests without coverage and report tracer overhead'
+    )
+    parser.add_argument(
+        '-r', '--report', action='append', metavar='KIND',
+        help=f'build report artifact ({", ".join(REPORT_WRITERS)}), may be repeated or comma separated'
+    )
+    parser.add_argument(
+        '-d', '--from-data', action='store_true',
+        help='do not run tests, update tables from the saved data file'
+    )
+    parser.add_argument(
+        '-x', '--contexts', action='store_true',
+        help='record per-test contexts and index tests covering each line (who-covers)'
+    )
+    parser.add_argument(
+        '-b', '--batch-jobs', type=_jobs_type, default='0',
+        help='run up to N projects concurrently when several are given (0 = one per CPU)'
+    )
+
+    return parser.parse_args(args)
+
+
+def parse_combine_args(args: list[str]) -> Namespace:
+    '''
+        Parses command line arguments of the combine subcommand.
+
+        :param args: Command line arguments after the subcommand name.
+        :return: Parsed arguments.
+        :exceptions: None.
+    '''
+    parser = ArgumentParser(
+        prog='ats_coverage combine', description='Merge shard data files and update docs'
+    )
+    parser.add_argument('project', help='project name (package directory or module)')
+    parser.add_argument('datafiles', nargs='+', help='shard coverage data files')
+    parser.add_argument(
+        '-t', '--trace-events', metavar='FILE',
+        help='write phase timing as Chrome trace-event JSON'
+    )
+    parser.add_argument(
+        '-r', '--report', action='append', metavar='KIND',
+        help=f'build report artifact ({", ".join(REPORT_WRITERS)}), may be repeated or comma separated'
+    )
+
+    return parser.parse_args(args)
+
+
+def parse_history_args(args: list[str]) -> Namespace:
+    '''
+        Parses command line arguments of the history subcommand.
+
+        :param args: Command line arguments after the subcommand name.
+        :return: Parsed arguments.
+        :exceptions: None.
+    '''
+    parser = ArgumentParser(
+        prog='ats_coverage history', description='Query coverage history of recorded runs'
+    )
+    parser.add_argument('project', help='project name (package directory or module)')
+    parser.add_argument('--runs', type=int, default=10, help='number of latest runs in trends')
+    parser.add_argument('--module', default='*', help='glob pattern of module paths in trends')
+    parser.add_argument(
+        '--drops', action='store_true', help='list largest coverage drops between two runs'
+    )
+    parser.add_argument('--from', dest='old', type=int, metavar='RUN', help='earlier run (default: previous)')
+    parser.add_argument('--to', dest='new', type=int, metavar='RUN', help='later run (default: latest)')
+    parser.add_argument('--limit', type=int, default=10, help='maximum number of drops')
+
+    return parser.parse_args(args)
+
+
+def parse_who_covers_args(args: list[str]) -> Namespace:
+    '''
+        Parses command line arguments of the who-covers subcommand.
+
+        :param args: Command line arguments after the subcommand name.
+        :return: Parsed arguments.
+        :exceptions: None.
+    '''
+    parser = ArgumentParser(
+        prog='ats_coverage who-covers', description='List tests covering a source line'
+    )
+    parser.add_argument('project', help='project name (package directory or module)')
+    parser.add_argument(
+        'targets', nargs='+', metavar='FILE[:LINE]',
+        help='source line (or file for number of covering tests per line)'
+    )
+
+    return parser.parse_args(args)
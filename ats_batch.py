@@ -0,0 +1,225 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_batch.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines batch runs of several projects in worker processes.
+'''
+
+from __future__ import annotations
+
+from sys import path as sys_path, stdout, stderr
+from os import chdir, close, dup, dup2, getcwd
+from os.path import abspath, isdir, split
+from glob import glob
+from time import perf_counter
+from tempfile import TemporaryFile
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from multiprocessing import get_context
+
+from ats_summary import CoverageSummary
+from ats_timing import TIMER, phase
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__ = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__ = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__ = '5.0.0'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+GLOB_CHARS: str = '*?['
+EXIT_CRASHED: int = 1
+
+ProjectRunner = Callable[[str], tuple[int, CoverageSummary | None]]
+DocsUpdater = Callable[[str, CoverageSummary], list[str]]
+
+
+def expand_projects(patterns: list[str]) -> list[str]:
+    '''
+        Expands project names and glob patterns (package directories or modules).
+
+        :param patterns: Project names, paths or glob patterns.
+        :return: Projects in the given order without duplicates.
+        :exceptions:
+            | ValueError: A pattern matches no project.
+    '''
+    projects: list[str] = []
+
+    for pattern in patterns:
+        if not any(char in pattern for char in GLOB_CHARS):
+            matches: list[str] = [pattern.rstrip('/') or pattern]
+        else:
+            matches = [
+                match.removesuffix('.py') for match in sorted(glob(pattern))
+                if isdir(match) or match.endswith('.py')
+            ]
+
+            if not matches:
+                raise ValueError(f'No project matches {pattern}')
+
+        projects.extend(match for match in matches if match not in projects)
+
+    return projects
+
+
+def _run_project(
+    root: str, pro_name: str, runner: ProjectRunner
+) -> tuple[int, CoverageSummary | None, str, float, list[tuple[str, float, float, float, int, int]]]:
+    '''
+        Runs one project in its root directory (runs in worker process).
+
+        Output of the run (including output of test and report workers)
+        is captured at file descriptor level and returned as text.
+
+        :param root: Absolute project root directory.
+        :param pro_name: Project name in the root directory.
+        :param runner: Runs project in current directory and returns exit code and summary.
+        :return: Tuple containing exit code, summary (None on failure),
+                 captured output, timer origin and recorded phases.
+        :exceptions: None.
+    '''
+    chdir(root)
+    sys_path.insert(0, root)
+    TIMER.reset()
+
+    with TemporaryFile('w+', encoding='utf-8', errors='replace') as log:
+        saved: tuple[int, int] = dup(1), dup(2)
+        dup2(log.fileno(), 1)
+        dup2(log.fileno(), 2)
+
+        try:
+            code, summary = runner(pro_name)
+
+        finally:
+            stdout.flush()
+            stderr.flush()
+            dup2(saved[0], 1)
+            dup2(saved[1], 2)
+            close(saved[0])
+            close(saved[1])
+
+        log.seek(0)
+        output: str = log.read()
+
+    return code, summary, output, TIMER.origin, TIMER.phases
+
+
+def _write_results(results: list[tuple[str, int, float]], elapsed: float) -> None:
+    '''
+        Writes exit code and wall time per project.
+
+        :param results: Project, exit code and wall seconds in finishing order.
+        :param elapsed: Wall seconds of the whole batch.
+        :exceptions: None.
+    '''
+    failed: int = sum(1 for _, code, _ in results if code)
+    width: int = max(len(label) for label, *_ in results)
+    stdout.write(f'\n--- Batch: {len(results)} projects, {failed} failed in {elapsed:.3f}s ---\n')
+    stdout.write(f'{"Project":<{width}}  {"Exit":>4}  {"Wall":>9}\n')
+
+    for label, code, wall in results:
+        stdout.write(f'{label:<{width}}  {code:>4}  {wall:>8.3f}s\n')
+
+
+def run_batch(
+    projects: list[str], runner: ProjectRunner, updater: DocsUpdater, workers: int
+) -> int:
+    '''
+        Runs projects concurrently in worker processes and updates their docs.
+
+        Projects sharing a root directory share its tests, README.md and
+        reports, so they run one after another; projects of different
+        roots run in parallel. Docs of a project are updated in the main
+        process as soon as its run finishes.
+
+        :param projects: Project paths (root directory and project name).
+        :param runner: Picklable runner of one project in current directory.
+        :param updater: Updates docs of project in current directory and returns changed paths.
+        :param workers: Maximum number of concurrent projects.
+        :return: Aggregate exit code (0 if every project succeeded, else the highest code).
+        :exceptions: None.
+    '''
+    queues: dict[str, list[tuple[str, str]]] = {}
+    results: list[tuple[str, int, float]] = []
+
+    for project in projects:
+        root, pro_name = split(project)
+
+        if not isdir(root or '.'):
+            stderr.write(f'ats_coverage: {project}: Directory with name {root} does not exist\n')
+            results.append((project, 128, 0.0))
+            continue
+
+        queues.setdefault(abspath(root or '.'), []).append((project, pro_name))
+
+    start: float = perf_counter()
+    limit: int = max(1, min(workers, len(queues)))
+    ready: list[str] = list(queues)
+    running: dict[Future, tuple[str, str, str, float]] = {}
+    cwd: str = getcwd()
+
+    with ProcessPoolExecutor(
+        max_workers=limit, mp_context=get_context('spawn'), max_tasks_per_child=1
+    ) as pool:
+        while ready or running:
+            while ready and len(running) < limit:
+                root: str = ready.pop(0)
+                label, pro_name = queues[root].pop(0)
+                future: Future = pool.submit(_run_project, root, pro_name, runner)
+                running[future] = (root, label, pro_name, perf_counter())
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                root, label, pro_name, started = running.pop(future)
+                stdout.write(f'\n=== {label} ===\n')
+
+                try:
+                    code, summary, output, origin, phases = future.result()
+                    stdout.write(output)
+                    TIMER.merge(phases, origin, f'{label}: ')
+
+                except Exception as exc:
+                    stderr.write(f'ats_coverage: {label}: {exc!r}\n')
+                    code, summary = EXIT_CRASHED, None
+
+                if summary is not None:
+                    try:
+                        chdir(root)
+
+                        with phase(f'{label}: update_docs'):
+                            changed: list[str] = updater(pro_name, summary)
+
+                        stdout.write(f'\n--- Docs: {", ".join(changed) if changed else "unchanged"} ---\n')
+
+                    except (ValueError, TypeError) as err:
+                        stderr.write(f'ats_coverage: {label}: {err}\n')
+                        code = max(code, 128)
+
+                    finally:
+                        chdir(cwd)
+
+                results.append((label, code, perf_counter() - started))
+
+                if queues[root]:
+                    ready.append(root)
+
+    _write_results(results, perf_counter() - start)
+
+    return max(code for _, code, _ in results)
@@ -0,0 +1,254 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_cache.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines whole-run result cache keyed on source, test and config content.
+'''
+
+from __future__ import annotations
+
+from sys import stdout, stderr, version_info
+from os import utime
+from os.path import relpath
+from json import load, dump
+from hashlib import sha1
+from pathlib import Path
+from shutil import copy2, copytree, rmtree
+from functools import cache
+
+from coverage import __version__ as coverage_version
+
+from ats_impact import STATE_DIR, fingerprint_files
+from ats_report import REPORT_BANNERS
+from ats_summary import CACHED_KEY
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__ = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__ = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__ = '5.0.0'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+CACHE_DIR: str = f'{STATE_DIR}/cache'
+CACHE_SIZE: int = 200 * 1024 * 1024
+CACHE_ARTIFACTS: dict[str, str] = {
+    'json': '{pro_name}.json', 'xml': '{pro_name}.xml', 'html': 'htmlcov'
+}
+
+
+@cache
+def tool_fingerprint() -> str:
+    '''
+        Hashes source files of the tool (ats_*.py modules next to this one).
+
+        Any change of the tool code changes cache keys, so results of an
+        older tool are never reused.
+
+        :return: Hex digest of module names and contents.
+        :exceptions: None.
+    '''
+    digest = sha1()
+
+    for path in sorted(Path(__file__).resolve().parent.glob('ats_*.py')):
+        digest.update(f'{path.name}\0'.encode('utf-8'))
+        digest.update(path.read_bytes())
+
+    return digest.hexdigest()
+
+
+def _tree_size(path: Path) -> int:
+    '''
+        Sums sizes of files under path.
+
+        :param path: Cache entry directory.
+        :return: Size in bytes.
+        :exceptions: None.
+    '''
+    return sum(item.stat().st_size for item in path.rglob('*') if item.is_file())
+
+
+def _copy(source: Path, target: Path) -> None:
+    '''
+        Copies file or directory, replacing an existing target.
+
+        :param source: File or directory to copy.
+        :param target: Destination path.
+        :exceptions:
+            | OSError: Copying failed.
+    '''
+    if source.is_dir():
+        rmtree(target, ignore_errors=True)
+        copytree(source, target)
+    else:
+        copy2(source, target)
+
+
+class ResultCache:
+    '''
+        Defines class ResultCache with size bounded LRU run results.
+        Stores summary, terminal output, report artifacts, data file and test
+        durations per fingerprint.
+
+        It defines:
+
+            :attributes:
+                | cache_dir - Cache directory.
+                | max_bytes - Size bound of all entries.
+            :methods:
+                | __init__ - Initials ResultCache constructor.
+                | key - Computes fingerprint of project, tests, config and tool sources.
+                | lookup - Restores cached run outputs if present.
+                | store - Stores run outputs and evicts least recently used entries.
+                | _evict - Removes least recently used entries above size bound.
+    '''
+
+    def __init__(self, max_bytes: int = CACHE_SIZE, cache_dir: str = CACHE_DIR) -> None:
+        '''
+            Initials ResultCache constructor.
+
+            :param max_bytes: Size bound of all entries.
+            :param cache_dir: Cache directory.
+            :exceptions: None.
+        '''
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes: int = max_bytes
+
+    def key(self, pro_name: str) -> str:
+        '''
+            Computes fingerprint of project, tests, config and tool sources.
+
+            :param pro_name: Project name.
+            :return: Cache key.
+            :exceptions: None.
+        '''
+        digest = sha1(
+            f'{pro_name}\0{tool_fingerprint()}\0{coverage_version}\0{version_info[:2]}\0'.encode('utf-8')
+        )
+
+        for path, file_hash in sorted(
+            (relpath(path), file_hash) for path, file_hash in fingerprint_files(pro_name).items()
+        ):
+            digest.update(f'{path}\0{file_hash}\0'.encode('utf-8'))
+
+        return digest.hexdigest()
+
+    def lookup(
+        self, key: str, pro_name: str, data_file: str, kinds: list[str], durations: str | None = None
+    ) -> dict[str, object] | None:
+        '''
+            Restores cached run outputs if present.
+
+            :param key: Cache key.
+            :param pro_name: Project name.
+            :param data_file: Coverage data file to restore.
+            :param kinds: Report kinds to restore.
+            :param durations: Test durations file to restore or None.
+            :return: Cached summary marked as cached or None on miss.
+            :exceptions: None.
+        '''
+        entry: Path = self.cache_dir / key
+
+        try:
+            with open(entry / 'entry.json', 'r', encoding='utf-8') as entry_file:
+                cached: dict[str, object] = load(entry_file)
+
+            if not set(kinds) <= set(cached['kinds']):
+                return None
+
+            _copy(entry / 'data', Path(data_file))
+
+            if durations is not None:
+                _copy(entry / 'durations', Path(durations))
+
+            for kind in kinds:
+                if kind in CACHE_ARTIFACTS:
+                    target: str = CACHE_ARTIFACTS[kind].format(pro_name=pro_name)
+                    _copy(entry / kind, Path(target))
+
+            utime(entry)
+
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        for kind in kinds:
+            title, target = REPORT_BANNERS[kind]
+            stdout.write(f'\n--- {title} ---\n')
+            stdout.write(cached['outputs'].get(kind, ''))
+
+            if target:
+                stdout.write(f'\n--- {title} restored to {target.format(pro_name=pro_name)} ---\n')
+
+        return {**cached['summary'], CACHED_KEY: True}
+
+    def store(
+        self, key: str, pro_name: str, data_file: str,
+        summary: dict[str, object], outputs: dict[str, str], durations: str | None = None
+    ) -> None:
+        '''
+            Stores run outputs and evicts least recently used entries.
+
+            :param key: Cache key.
+            :param pro_name: Project name.
+            :param data_file: Coverage data file of the run.
+            :param summary: Coverage data report in dict format.
+            :param outputs: Terminal output per built report kind.
+            :param durations: Test durations file of the run or None.
+            :exceptions: None.
+        '''
+        entry: Path = self.cache_dir / key
+
+        try:
+            entry.mkdir(parents=True, exist_ok=True)
+            _copy(Path(data_file), entry / 'data')
+
+            if durations is not None:
+                _copy(Path(durations), entry / 'durations')
+
+            for kind in outputs:
+                if kind in CACHE_ARTIFACTS:
+                    _copy(Path(CACHE_ARTIFACTS[kind].format(pro_name=pro_name)), entry / kind)
+
+            with open(entry / 'entry.json', 'w', encoding='utf-8') as entry_file:
+                dump({'kinds': list(outputs), 'outputs': outputs, 'summary': summary}, entry_file)
+
+        except OSError as exc:
+            stderr.write(f'{exc}\n')
+            rmtree(entry, ignore_errors=True)
+            return
+
+        self._evict()
+
+    def _evict(self) -> None:
+        '''
+            Removes least recently used entries above size bound.
+
+            :exceptions: None.
+        '''
+        entries: list[tuple[float, int, Path]] = sorted(
+            (entry.stat().st_mtime, _tree_size(entry), entry)
+            for entry in self.cache_dir.iterdir() if entry.is_dir()
+        )
+        total: int = sum(size for _, size, _ in entries)
+
+        for _, size, entry in entries[:-1]:
+            if total <= self.max_bytes:
+                break
+
+            rmtree(entry, ignore_errors=True)
+            total -= size
@@ -0,0 +1,132 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_cli.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines fast-start command line entry point and refresh subcommand.
+    Only commands which run tests import coverage and unittest. Running
+    ats_coverage.py as a script imports them before this entry point, so
+    fast refresh needs the installed ats_coverage command or ats_cli.py.
+'''
+
+from __future__ import annotations
+
+from sys import stdout, stderr, argv, exit as sys_exit
+from os.path import isfile
+
+from ats_config import load_config, tree_options
+from ats_summary import CoverageSummary, summary_file
+from ats_timing import phase
+from ats_updater import load_report, update_docs
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__ = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__ = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__ = '5.0.0'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+STARTUP_BUDGET: float = 0.050
+REFRESH_USAGE: str = 'Usage: ats_coverage refresh <project_name>...'
+
+
+def refresh_docs(pro_name: str, config: dict[str, str]) -> list[str]:
+    '''
+        Updates README.md, index.rst and coverage_table.csv from saved summary.
+
+        The summary saved by the last docs update is read. If there is no
+        saved summary, the JSON report of the project is read with a
+        warning, as it may be older than the last run.
+
+        :param pro_name: Project name.
+        :param config: Options from the [ats_coverage] section.
+        :return: Paths of changed files.
+        :exceptions:
+            | TypeError:  The parameter pro_name type validation failed.
+            | ValueError: The report or project does not exist.
+            | ValueError: The report has no coverage summary.
+            | ValueError: Invalid tree option.
+    '''
+    report_file: str = summary_file(pro_name)
+
+    if not isfile(report_file):
+        report_file = f'{pro_name}.json'
+
+        if isfile(report_file):
+            stderr.write(
+                f'ats_coverage: no saved summary {summary_file(pro_name)}, '
+                f'refreshing from {report_file} which may be older than the last run\n'
+            )
+
+    report: dict[str, object] = load_report(report_file)
+
+    try:
+        summary: CoverageSummary = CoverageSummary.from_report(report)
+
+    except KeyError as exc:
+        raise ValueError(f'Report {report_file} has no coverage summary') from exc
+
+    with phase('update_docs'):
+        return update_docs(pro_name, summary, tree_options=tree_options(config))
+
+
+def refresh(args: list[str]) -> None:
+    '''
+        Updates docs of every project given to the refresh subcommand.
+
+        Arguments are project names only, so argparse is not imported.
+
+        :param args: Command line arguments after the subcommand name.
+        :exceptions:
+            | ValueError: No project, an option or invalid report or project.
+    '''
+    if not args or any(arg.startswith('-') for arg in args):
+        raise ValueError(REFRESH_USAGE)
+
+    config: dict[str, str] = load_config()
+
+    for pro_name in args:
+        changed: list[str] = refresh_docs(pro_name, config)
+        stdout.write(f'--- Docs {pro_name}: {", ".join(changed) if changed else "unchanged"} ---\n')
+
+
+def main() -> None:
+    '''
+        Main execution flow (other commands are delegated to ats_commands).
+
+        :exceptions: None.
+    '''
+    if argv[1:2] != ['refresh']:
+        # pylint: disable=import-outside-toplevel
+        from ats_commands import main as run_main
+
+        run_main(argv[1:])
+        return
+
+    try:
+        refresh(argv[2:])
+
+    except (ValueError, TypeError) as err:
+        stderr.write(f'ats_coverage: {err}\n')
+        sys_exit(128)
+
+    sys_exit(0)
+
+
+if __name__ == "__main__":
+    main()
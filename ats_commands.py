@@ -0,0 +1,343 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_commands.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines subcommand handlers (history, who-covers, combine, batch and
+    watch) and main flow of commands running tests. The refresh subcommand
+    is handled by ats_cli without importing this module.
+'''
+
+from __future__ import annotations
+
+from sys import stdout, stderr, exit as sys_exit
+from functools import partial
+from sqlite3 import Error as SQLiteError
+from argparse import Namespace
+
+from coverage import CoverageData
+
+from ats_args import parse_args, parse_combine_args, parse_history_args, parse_who_covers_args
+from ats_batch import expand_projects, run_batch
+from ats_cache import ResultCache, CACHE_SIZE
+from ats_config import load_config, config_list, config_bool, config_int, tree_options
+from ats_coverage import combine_coverage, run_coverage, summarize_data
+from ats_covers import CoverIndex, write_who_covers
+from ats_history import HISTORY_FILE, HistoryStore, glob_to_like, write_drops, write_trends
+from ats_report import plan_reports
+from ats_summary import CoverageSummary
+from ats_timing import TIMER, phase
+from ats_updater import check_exists, update_docs
+from ats_watch import CoverageWatcher
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__ = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__ = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__ = '5.0.0'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+def _make_cache(options: Namespace, config: dict[str, str]) -> ResultCache | None:
+    '''
+        Creates result cache unless disabled on command line or in config.
+
+        :param options: Parsed command line arguments.
+        :param config: Options from the [ats_coverage] section.
+        :return: Result cache or None if caching is disabled.
+        :exceptions:
+            | ValueError: Invalid cache or cache_size option.
+    '''
+    if options.no_cache or not config_bool(config, 'cache', True):
+        return None
+
+    size: str = config.get('cache_size', '')
+
+    if size and not size.isdigit():
+        raise ValueError(f'Option cache_size must be a number of MiB, not {size!r}')
+
+    return ResultCache(int(size) * 1024 * 1024 if size else CACHE_SIZE)
+
+
+def _run_batch_project(options: Namespace, pro_name: str) -> tuple[int, CoverageSummary | None]:
+    '''
+        Runs one project of a batch in current directory (runs in worker process).
+
+        :param options: Parsed command line arguments.
+        :param pro_name: Project name.
+        :return: Exit code and summary (None on failure).
+        :exceptions: None.
+    '''
+    try:
+        config: dict[str, str] = load_config()
+
+        if options.from_data:
+            return 0, summarize_data(pro_name)
+
+        report_data: dict[str, object] = run_coverage(
+            pro_name, jobs=options.jobs, incremental=options.incremental,
+            reports=plan_reports(options.report, config_list(config, 'reports')),
+            core=options.core or config.get('core'), overhead=options.overhead,
+            cache=_make_cache(options, config), slowest=config_int(config, 'slowest', 10),
+            contexts=options.contexts or config_bool(config, 'contexts', False)
+        )
+
+    except (ValueError, TypeError) as err:
+        stderr.write(f'ats_coverage: {err}\n')
+        return 128, None
+
+    if not report_data:
+        stderr.write('ats_coverage: failed to generate coverage report\n')
+        return 129, None
+
+    return 0, CoverageSummary.from_report(report_data)
+
+
+def _record_history(config: dict[str, str], pro_name: str, summary: CoverageSummary) -> None:
+    '''
+        Appends run summaries to the history store unless disabled in config
+        or replayed from the result cache.
+
+        :param config: Options from the [ats_coverage] section.
+        :param pro_name: Project name.
+        :param summary: Summary model of the run.
+        :exceptions:
+            | ValueError: Invalid history option.
+    '''
+    if not config_bool(config, 'history', True):
+        return
+
+    if summary.cached:
+        stdout.write('\n--- History: cached result, no run recorded ---\n')
+        return
+
+    with phase('history'):
+        run_id: int | None = HistoryStore().record(pro_name, summary)
+
+    if run_id is not None:
+        stdout.write(f'\n--- History: run {run_id} recorded in {HISTORY_FILE} ---\n')
+
+
+def _update_batch_docs(options: Namespace, pro_name: str, summary: CoverageSummary) -> list[str]:
+    '''
+        Updates docs and history of one batch project in current directory.
+
+        :param options: Parsed command line arguments.
+        :param pro_name: Project name.
+        :param summary: Summary model of the project run.
+        :return: Paths of changed files.
+        :exceptions:
+            | ValueError: The file or directory with name does not exist.
+    '''
+    config: dict[str, str] = load_config()
+    changed: list[str] = update_docs(pro_name, summary, tree_options=tree_options(config))
+
+    if not options.from_data:
+        _record_history(config, pro_name, summary)
+
+    return changed
+
+
+def _report_timing(trace_events: str | None) -> None:
+    '''
+        Writes phase timing summary and optional trace-event file.
+
+        :param trace_events: Chrome trace-event JSON file path or None.
+        :exceptions: None.
+    '''
+    TIMER.write_summary(stdout)
+
+    if trace_events:
+        try:
+            TIMER.write_trace(trace_events)
+            stdout.write(f'\n--- Trace events saved to {trace_events} ---\n')
+
+        except OSError as exc:
+            stderr.write(f'{exc}\n')
+
+
+def _query_history(args: list[str]) -> None:
+    '''
+        Writes trends or drops of the history subcommand.
+
+        :param args: Command line arguments after the subcommand name.
+        :exceptions:
+            | ValueError: No history recorded or fewer than two runs for drops.
+    '''
+    options: Namespace = parse_history_args(args)
+    check_exists(HISTORY_FILE)
+    store = HistoryStore()
+
+    try:
+        if options.drops:
+            write_drops(stdout, store, options.project, options.old, options.new, options.limit)
+        else:
+            write_trends(stdout, store, options.project, options.runs, glob_to_like(options.module))
+
+    except SQLiteError as exc:
+        raise ValueError(f'Cannot read history {HISTORY_FILE}: {exc}') from exc
+
+
+def _query_who_covers(args: list[str]) -> None:
+    '''
+        Writes tests covering lines of the who-covers subcommand.
+
+        The index is rebuilt from the data file when it is missing or older.
+
+        :param args: Command line arguments after the subcommand name.
+        :exceptions:
+            | ValueError: No data file, no per-test contexts or target not measured.
+    '''
+    options: Namespace = parse_who_covers_args(args)
+    data_file: str = f'.coverage.{options.project}'
+    check_exists(data_file)
+    index = CoverIndex(data_file)
+
+    try:
+        if not index.is_current():
+            data = CoverageData(basename=data_file)
+            data.read()
+
+            if not any(data.measured_contexts()):
+                raise ValueError(f'{data_file} has no per-test contexts, run with --contexts')
+
+            index.build(data)
+
+        for target in options.targets:
+            if not write_who_covers(stdout, index, target):
+                raise ValueError(f'{target} is not measured in {data_file}')
+
+    except SQLiteError as exc:
+        raise ValueError(f'Cannot read index {index.path}: {exc}') from exc
+
+
+def main(args: list[str]) -> None:
+    '''
+        Main execution flow of commands running or reading coverage.
+
+        :param args: Command line arguments without the program name.
+        :exceptions: None.
+    '''
+    try:
+        config: dict[str, str] = load_config()
+
+        if not args and not config_list(config, 'projects'):
+            stderr.write(
+                'Usage: ats_coverage [--jobs N] [--incremental] [--shard I/N] [--watch] [--no-cache] '
+                '[--core CORE] [--report KIND] [--from-data] [--contexts] [--batch-jobs N] '
+                '[--trace-events FILE] <project_name>...\n'
+                '       ats_coverage combine [--report KIND] [--trace-events FILE] '
+                '<project_name> <datafiles...>\n'
+                '       ats_coverage history [--runs N] [--module GLOB] [--drops] '
+                '[--from RUN] [--to RUN] <project_name>\n'
+                '       ats_coverage who-covers <project_name> <file>[:<line>]...\n'
+                '       ats_coverage refresh <project_name>...\n'
+            )
+            sys_exit(128)
+
+        if args[:1] == ['history']:
+            _query_history(args[1:])
+            sys_exit(0)
+
+        if args[:1] == ['who-covers']:
+            _query_who_covers(args[1:])
+            sys_exit(0)
+
+        if args[:1] == ['combine']:
+            options: Namespace = parse_combine_args(args[1:])
+            project_name: str = options.project
+            reports: dict[str, list[str]] = plan_reports(options.report, config_list(config, 'reports'))
+            report_data: dict[str, object] | CoverageSummary = combine_coverage(
+                project_name, options.datafiles, reports
+            )
+            record: bool = True
+        else:
+            options = parse_args(args)
+            projects: list[str] = expand_projects(options.projects or config_list(config, 'projects') or [])
+
+            if not projects:
+                raise ValueError('No project given on command line or in config')
+
+            if len(projects) > 1:
+                if options.watch or options.shard is not None:
+                    raise ValueError('Batch runs cannot watch or run shards')
+
+                code: int = run_batch(
+                    projects, partial(_run_batch_project, options), partial(_update_batch_docs, options),
+                    options.batch_jobs
+                )
+                _report_timing(options.trace_events)
+                sys_exit(code)
+
+            project_name = projects[0]
+            reports = plan_reports(options.report, config_list(config, 'reports'))
+
+            if options.watch:
+                watcher = CoverageWatcher(
+                    project_name, reports, options.core or config.get('core'), tree_options(config)
+                )
+
+                try:
+                    watcher.run_forever()
+
+                except KeyboardInterrupt:
+                    stdout.write('\n--- Watch stopped ---\n')
+
+                sys_exit(0)
+
+            record = not options.from_data
+
+            if options.from_data:
+                report_data = summarize_data(project_name)
+            else:
+                report_data = run_coverage(
+                    project_name, jobs=options.jobs, incremental=options.incremental, reports=reports,
+                    core=options.core or config.get('core'), overhead=options.overhead,
+                    shard=options.shard, cache=_make_cache(options, config),
+                    slowest=config_int(config, 'slowest', 10),
+                    contexts=options.contexts or config_bool(config, 'contexts', False)
+                )
+
+            if options.shard is not None and not options.from_data:
+                _report_timing(options.trace_events)
+                sys_exit(0)
+
+        if report_data:
+            summary: CoverageSummary = (
+                report_data if isinstance(report_data, CoverageSummary)
+                else CoverageSummary.from_report(report_data)
+            )
+            del report_data
+
+            with phase('update_docs'):
+                changed = update_docs(project_name, summary, tree_options=tree_options(config))
+
+            stdout.write(f'\n--- Docs: {", ".join(changed) if changed else "unchanged"} ---\n')
+
+            if record:
+                _record_history(config, project_name, summary)
+
+            _report_timing(options.trace_events)
+            sys_exit(0)
+
+        stderr.write('ats_coverage: failed to generate coverage report\n')
+        sys_exit(129)
+
+    except (ValueError, TypeError) as err:
+        stderr.write(f'ats_coverage: {err}\n')
+        sys_exit(128)
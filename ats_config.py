@@ -0,0 +1,149 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_config.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines loading of ats_coverage options from the coverage config file.
+'''
+
+from __future__ import annotations
+
+from sys import stderr
+from os.path import isfile
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__ = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__ = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__ = '5.0.0'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+CONFIG_FILE: str = '.coveragerc'
+STATE_DIR: str = '.ats_coverage'
+CONFIG_SECTION: str = 'ats_coverage'
+BOOLEAN_STATES: dict[str, bool] = {
+    '1': True, 'yes': True, 'true': True, 'on': True, '0': False, 'no': False, 'false': False, 'off': False
+}
+
+
+def load_config(config_file: str = CONFIG_FILE) -> dict[str, str]:
+    '''
+        Loads [ats_coverage] section from coverage config file.
+
+        configparser is imported only if the file exists, it is not needed
+        to start the refresh command of a project without config.
+
+        :param config_file: Coverage config file path.
+        :return: Options from the section (empty if file or section missing).
+        :exceptions: None.
+    '''
+    if not isfile(config_file):
+        return {}
+
+    # pylint: disable=import-outside-toplevel
+    from configparser import ConfigParser, Error as ConfigError
+
+    parser = ConfigParser(interpolation=None)
+
+    try:
+        parser.read(config_file, encoding='utf-8')
+
+    except (ConfigError, UnicodeDecodeError) as exc:
+        stderr.write(f'{exc}\n')
+        return {}
+
+    if not parser.has_section(CONFIG_SECTION):
+        return {}
+
+    return dict(parser.items(CONFIG_SECTION))
+
+
+def config_list(config: dict[str, str], key: str) -> list[str] | None:
+    '''
+        Gets comma or newline separated list option.
+
+        :param config: Options from the [ats_coverage] section.
+        :param key: Option name.
+        :return: List of non empty items or None if option is not set.
+        :exceptions: None.
+    '''
+    if key not in config:
+        return None
+
+    return [item.strip() for item in config[key].replace('\n', ',').split(',') if item.strip()]
+
+
+def config_bool(config: dict[str, str], key: str, default: bool) -> bool:
+    '''
+        Gets boolean option (1/0, yes/no, true/false, on/off).
+
+        :param config: Options from the [ats_coverage] section.
+        :param key: Option name.
+        :param default: Value if option is not set.
+        :return: Option value.
+        :exceptions:
+            | ValueError: Option is not a boolean.
+    '''
+    if key not in config:
+        return default
+
+    value: str = config[key].strip().lower()
+
+    if value not in BOOLEAN_STATES:
+        raise ValueError(f'Option {key} must be a boolean, not {config[key]!r}')
+
+    return BOOLEAN_STATES[value]
+
+
+def config_int(config: dict[str, str], key: str, default: int | None = None) -> int | None:
+    '''
+        Gets non negative integer option.
+
+        :param config: Options from the [ats_coverage] section.
+        :param key: Option name.
+        :param default: Value if option is not set.
+        :return: Option value.
+        :exceptions:
+            | ValueError: Option is not a non negative integer.
+    '''
+    value: str = config.get(key, '').strip()
+
+    if not value:
+        return default
+
+    if not value.isdigit():
+        raise ValueError(f'Option {key} must be a number, not {config[key]!r}')
+
+    return int(value)
+
+
+def tree_options(config: dict[str, str]) -> dict[str, object]:
+    '''
+        Gets package tree options from config.
+
+        :param config: Options from the [ats_coverage] section.
+        :return: TreeWalker arguments.
+        :exceptions:
+            | ValueError: Invalid tree_gitignore, tree_max_depth or tree_max_entries_per_dir option.
+    '''
+    return {
+        'excludes': config_list(config, 'tree_exclude'),
+        'gitignore': config_bool(config, 'tree_gitignore', True),
+        'max_depth': config_int(config, 'tree_max_depth'),
+        'max_entries_per_dir': config_int(config, 'tree_max_entries_per_dir'),
+    }
@@ -0,0 +1,100 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_core.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines selection of the coverage measurement core (tracer backend).
+'''
+
+from __future__ import annotations
+
+from sys import version_info
+from importlib.util import find_spec
+
+from coverage import Coverage
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__ = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__ = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__ = '5.0.0'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+CORES: tuple[str, ...] = ('ctrace', 'pytrace', 'sysmon')
+TRACER_CORES: dict[str, str] = {
+    'CTracer': 'ctrace', 'PyTracer': 'pytrace', 'SysMonitor': 'sysmon'
+}
+
+
+def check_core(core: str) -> str:
+    '''
+        Validates core name given on command line or in config.
+
+        :param core: Core name.
+        :return: Validated core name.
+        :exceptions:
+            | ValueError: Unknown core.
+    '''
+    if core not in CORES:
+        raise ValueError(f'Unknown core {core}, expected one of {", ".join(CORES)}')
+
+    return core
+
+
+def resolve_core(core: str | None, branch: bool, contexts: bool) -> tuple[str | None, str]:
+    '''
+        Resolves requested core, falling back when a feature is incompatible.
+
+        :param core: Requested core or None for the coverage default.
+        :param branch: Branch measurement is enabled.
+        :param contexts: Per-test contexts are recorded.
+        :return: Tuple containing core to use (None for default) and fallback reason.
+        :exceptions: None.
+    '''
+    reason: str = ''
+
+    if core == 'sysmon':
+        if version_info < (3, 12):
+            reason = 'sys.monitoring needs Python 3.12+'
+        elif branch and version_info < (3, 14):
+            reason = 'sysmon measures branches only on Python 3.14+'
+        elif contexts:
+            reason = 'sysmon does not support per-test contexts'
+
+        if reason:
+            core = 'ctrace'
+
+    if core == 'ctrace' and find_spec('coverage.tracer') is None:
+        reason = f'{reason}, ' if reason else ''
+        reason += 'C tracer is not available'
+        core = 'pytrace'
+
+    return core, reason
+
+
+def core_in_use(cov: Coverage) -> str:
+    '''
+        Gets core used by a started (or stopped) coverage instance.
+
+        :param cov: Coverage instance which collected data.
+        :return: Core name (tracer class name if not known).
+        :exceptions: None.
+    '''
+    tracer: str = str(dict(cov.sys_info()).get('core', '-none-'))
+
+    return TRACER_CORES.get(tracer, tracer)
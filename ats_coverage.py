@@ -21,19 +21,36 @@ Info
 
 from __future__ import annotations
 
-from sys import stdout, stderr, modules, argv, gettrace, settrace, exit as sys_exit
+from sys import stdout, modules, gettrace, settrace
+from importlib import import_module
+from time import perf_counter
 from pathlib import Path
 from unittest import TestLoader, TestSuite, TextTestRunner
 
-from coverage import Coverage
+from coverage import Coverage, CoverageData
+from coverage.results import Analysis
 
-from ats_updater import (
-    check_exists,
-    load_report,
-    update_readme,
-    update_structure,
-    update_index_coverage,
+from ats_cache import ResultCache
+from ats_config import STATE_DIR
+from ats_core import check_core, resolve_core, core_in_use
+from ats_covers import index_covers
+from ats_impact import ImpactPlan, plan_incremental
+from ats_manifest import DiscoveryManifest, TestWants
+from ats_report import REPORT_WRITERS, SHARED_ANALYSIS, analyze_once, build_reports, public_summary, summary_model
+from ats_runner import (
+    select_shard,
+    discover_shard,
+    split_by_module,
+    shard_modules,
+    group_by_module,
+    filter_suite,
+    make_runner,
+    run_parallel,
+    time_untraced,
 )
+from ats_summary import CoverageSummary
+from ats_timing import DURATIONS, phase, replay_durations, save_durations
+from ats_updater import check_exists, load_report, update_readme, update_structure, update_index_coverage
 
 __author__ = 'Vladimir Roncevic'
 __copyright__ = '(C) 2026, https://vroncevic.github.io/ats_coverage'
@@ -43,32 +60,188 @@ __version__ = '5.0.0'
 __maintainer__ = 'Vladimir Roncevic'
 __email__ = 'elektron.ronca@gmail.com'
 __status__ = 'Updated'
+__all__ = [
+    'check_exists', 'load_report', 'update_readme', 'update_structure', 'update_index_coverage',
+    'run_coverage', 'shard_data_file', 'durations_file', 'combine_coverage', 'summarize_data', 'main'
+]
 
 
-def _run_tests_and_collect(pro_name: str) -> None:
+def _manifest_wants(
+    manifest: DiscoveryManifest, plan: ImpactPlan | None, shard: tuple[int, int] | None
+) -> TestWants | None:
+    '''
+        Builds test selection of incremental plan and shard from manifest.
+
+        :param manifest: Refreshed test manifest.
+        :param plan: Incremental plan selecting tests or None for all tests.
+        :param shard: Shard number (1 based) and number of shards or None for all modules.
+        :return: Selects tests by module and test id or None for all tests.
+        :exceptions: None.
+    '''
+    wants: TestWants | None = None if plan is None or plan.full else plan.wants_test
+
+    if shard is None:
+        return wants
+
+    selected: set[str] = select_shard(manifest.modules(), shard)
+
+    return lambda module, test_id: module in selected and (wants is None or wants(module, test_id))
+
+
+def _run_tests_and_collect(
+    pro_name: str, cov: Coverage | None = None, plan: ImpactPlan | None = None,
+    shard: tuple[int, int] | None = None
+) -> bool:
     '''
         Discovers and runs tests for the project.
 
         :param pro_name: Project name.
+        :param cov: Started coverage instance for per-test contexts or None.
+        :param plan: Incremental plan selecting tests or None for all tests.
+        :param shard: Shard number (1 based) and number of shards or None for all modules.
+        :return: True if all tests passed.
         :exceptions: None.
     '''
     modules.pop(pro_name, None)
-    tests: TestSuite = TestLoader().discover('tests', pattern='*_test.py', top_level_dir='.')
 
-    test_runner = TextTestRunner(verbosity=2)
+    with phase('discovery'):
+        manifest = DiscoveryManifest()
+
+        if manifest.refresh():
+            tests: TestSuite = manifest.suite(_manifest_wants(manifest, plan, shard))
+        else:
+            tests = TestLoader().discover('tests', pattern='*_test.py', top_level_dir='.')
+
+            if plan is not None and not plan.full:
+                tests = filter_suite(tests, plan.wants)
+
+            if shard is not None:
+                tests = discover_shard(tests, shard)
+
+    test_runner: TextTestRunner = make_runner(cov=cov)
     stdout.write('\n--- Test Report ---\n')
-    test_runner.run(tests)
 
+    with phase('test run'):
+        return test_runner.run(tests).wasSuccessful()
+
+
+def _run_tests_parallel(
+    pro_name: str, jobs: int, plan: ImpactPlan | None = None, core: str | None = None,
+    shard: tuple[int, int] | None = None, contexts: bool = False
+) -> tuple[list[str], float, str, int]:
+    '''
+        Discovers tests for the project and runs test modules in worker processes.
+
+        :param pro_name: Project name.
+        :param jobs: Number of worker processes.
+        :param plan: Incremental plan selecting tests or None for all tests.
+        :param core: Coverage core to use or None for the default.
+        :param shard: Shard number (1 based) and number of shards or None for all modules.
+        :param contexts: Record per-test contexts (always recorded for incremental plans).
+        :return: Tuple containing paths of the worker coverage data files,
+                 traced seconds summed over workers, cores used and
+                 number of failed tests.
+        :exceptions: None.
+    '''
+    modules.pop(pro_name, None)
+
+    with phase('discovery'):
+        manifest = DiscoveryManifest()
+
+        if manifest.refresh():
+            by_module: dict[str, list[str]] = manifest.groups(_manifest_wants(manifest, plan, shard))
+        else:
+            tests: TestSuite = TestLoader().discover('tests', pattern='*_test.py', top_level_dir='.')
+
+            if shard is not None:
+                tests = discover_shard(tests, shard)
+
+            if plan is not None and not plan.full:
+                tests = filter_suite(tests, plan.wants)
+
+            by_module = group_by_module(tests)
+
+        if plan is None or plan.full:
+            groups: list[list[str]] = [[name] for name in by_module]
+        else:
+            groups = list(by_module.values())
+
+    stdout.write(f'\n--- Test Report ({jobs} jobs) ---\n')
 
-def run_coverage(pro_name: str) -> None:
+    with phase(f'test run ({jobs} jobs)'):
+        return run_parallel(pro_name, groups, jobs, contexts=contexts or plan is not None, core=core)
+
+
+def _report_overhead(
+    core: str, traced: float, plan: ImpactPlan | None = None,
+    shard: tuple[int, int] | None = None
+) -> None:
+    '''
+        Measures the same tests without coverage and reports tracer overhead.
+
+        :param core: Core used for the traced run.
+        :param traced: Traced seconds for loading and running the tests.
+        :param plan: Incremental plan selecting tests or None for all tests.
+        :param shard: Shard number (1 based) and number of shards or None for all modules.
+        :exceptions: None.
+    '''
+    names: list[str] | None = None
+
+    if shard is not None:
+        manifest = DiscoveryManifest()
+
+        if manifest.refresh():
+            names = shard_modules(manifest.modules(), *shard)
+        else:
+            tests: TestSuite = TestLoader().discover('tests', pattern='*_test.py', top_level_dir='.')
+            names = shard_modules(split_by_module(tests), *shard)
+
+    if plan is not None and not plan.full:
+        names = sorted(plan.modules) + sorted(
+            test_id for test_id in plan.tests
+            if not any(test_id.startswith(f'{module}.') for module in plan.modules)
+        )
+
+    with phase('untraced baseline'):
+        untraced: float = time_untraced(names)
+    ratio: str = f'{traced / untraced:.2f}x' if untraced > 0 else 'n/a'
+    stdout.write(
+        f'\n--- Tracer overhead ({core}): {traced:.3f}s traced, '
+        f'{untraced:.3f}s untraced, {ratio} ---\n'
+    )
+
+
+def run_coverage(
+    pro_name: str, jobs: int = 1, incremental: bool = False,
+    reports: dict[str, list[str]] | None = None, core: str | None = None,
+    overhead: bool = False, shard: tuple[int, int] | None = None,
+    cache: ResultCache | None = None, slowest: int = 10, contexts: bool = False
+) -> dict[str, object]:
     '''
-        Runs coverage for project and generates reports in JSON and XML formats.
+        Runs coverage for project, builds planned reports and returns summary.
+
+        A shard run only saves its own data file, reports are built once
+        after merging all shard files with combine_coverage.
 
         :param pro_name: Project name (is equal to directory name).
+        :param jobs: Number of worker processes (1 runs tests in process).
+        :param incremental: Run only tests affected by changed files (file hashes
+                            are saved only after a passing run).
+        :param reports: Report plan (requesters per report kind) or None for all reports.
+        :param core: Coverage core (ctrace, pytrace or sysmon) or None for the default.
+        :param overhead: Measure tests without coverage and report tracer overhead.
+        :param shard: Shard number (1 based) and number of shards or None for all modules.
+        :param cache: Result cache reused for plain runs (no incremental, shard or overhead).
+        :param slowest: Number of slowest tests to report (0 for none).
+        :param contexts: Record per-test contexts and index tests covering each line.
+        :return: Coverage data report in dict format (files[*].summary and totals),
+                 empty for shard runs.
         :exceptions:
             | TypeError:  The parameter pro_name type validation failed.
             | ValueError: The parameter pro_name format validation failed.
             | ValueError: The directory with name does not exist.
+            | ValueError: Unknown core.
+            | ValueError: Shard run combined with incremental run.
     '''
     is_dir = isinstance(pro_name, str) and Path(pro_name).is_dir()
     path_to_check = (
@@ -76,61 +249,240 @@ def run_coverage(pro_name: str) -> None:
         if isinstance(pro_name, str) else pro_name
     )
     check_exists(path_to_check, is_dir=is_dir)
-    cov = Coverage(source=[pro_name], config_file='.coveragerc', data_file=f'.coverage.{pro_name}')
 
-    old_trace = gettrace()
+    if shard is not None and incremental:
+        raise ValueError('Shard runs cannot be incremental')
+
+    options: dict[str, object] = {
+        'source': [pro_name], 'config_file': '.coveragerc', 'data_file': f'.coverage.{pro_name}'
+    }
+
+    if shard is not None:
+        options['data_file'] = shard_data_file(pro_name, shard)
+
+    key: str | None = None
+
+    if cache is not None and not incremental and shard is None and not overhead and not contexts:
+        with phase('cache lookup'):
+            key = cache.key(pro_name)
+            kinds: list[str] = list(REPORT_WRITERS if reports is None else reports)
+            cached: dict[str, object] | None = cache.lookup(
+                key, pro_name, str(options['data_file']), kinds, durations_file(pro_name)
+            )
+
+        if cached is not None:
+            stdout.write(f'\n--- Cache hit {key[:12]}: outputs of an identical run reused ---\n')
+            replay_durations(durations_file(pro_name), stdout, slowest)
+            return cached
+
+        stdout.write(f'\n--- Cache miss {key[:12]}: running tests ---\n')
+
+    cov = Coverage(**options)
+
+    plan: ImpactPlan | None = None
+    retained: CoverageData | None = None
+
+    if incremental:
+        with phase('incremental plan'):
+            plan = plan_incremental(pro_name)
+            retained = plan.retained_data()
+
+        mode: str = 'full run' if plan.full else 'selected tests only'
+        stdout.write(f'\n--- Incremental: {mode}, {plan.reason} ---\n')
+
+    requested: str | None = check_core(core) if core is not None else None
+    core, reason = resolve_core(
+        requested, bool(cov.get_option('run:branch')), contexts or plan is not None
+    )
+
+    if reason:
+        stdout.write(f'\n--- Core {requested} not usable ({reason}), falling back to {core} ---\n')
+
+    if core is not None:
+        cov.set_option('run:core', core)
 
     stdout.write('\n--- Starting coverage ---\n')
-    cov.start()
+    DURATIONS.reset()
 
-    _run_tests_and_collect(pro_name)
+    if jobs > 1:
+        data_paths, traced, used, failed = _run_tests_parallel(
+            pro_name, jobs, plan, core, shard, contexts
+        )
+        passed: bool = not failed
+        cov.erase()
 
-    cov.stop()
-    cov.save()
+        if data_paths:
+            with phase('combine'):
+                cov.combine(data_paths=data_paths, keep=False)
+    else:
+        old_trace = gettrace()
+        cov.start()
+        start: float = perf_counter()
 
-    settrace(old_trace)
+        if plan is None and not contexts:
+            passed = _run_tests_and_collect(pro_name, shard=shard)
+        else:
+            passed = _run_tests_and_collect(pro_name, cov, plan, shard)
 
-    stdout.write('\n--- Coverage Report ---\n')
-    cov.report()
-    stdout.write('\n--- JSON Report ---\n')
-    cov.json_report(outfile=f'{pro_name}.json')
-    stdout.write(f'\n--- JSON Report saved to {pro_name}.json ---\n')
-    stdout.write('\n--- XML Report ---\n')
-    cov.xml_report(outfile=f'{pro_name}.xml')
-    stdout.write(f'\n--- XML Report saved to {pro_name}.xml ---\n')
-    stdout.write('\n--- HTML Report ---\n')
-    cov.html_report(directory='htmlcov')
-    stdout.write('\n--- HTML Report saved to htmlcov ---\n')
+        cov.stop()
+        traced = perf_counter() - start
+        settrace(old_trace)
+        used = core_in_use(cov)
 
+    stdout.write(f'\n--- Core: {used or "none"}, tests traced in {traced:.3f}s ---\n')
+    DURATIONS.write_slowest(stdout, slowest)
+    save_durations(durations_file(pro_name, shard))
 
-def main() -> None:
+    if overhead:
+        _report_overhead(used, traced, plan, shard)
+
+    with phase('save'):
+        if retained is not None:
+            cov.get_data().update(retained)
+
+        cov.save()
+
+        if plan is not None and passed:
+            plan.save_state()
+        elif plan is not None:
+            stdout.write('\n--- Incremental: tests failed, changed files stay selected for the next run ---\n')
+
+    if contexts or plan is not None:
+        index_covers(cov.get_data(), str(options['data_file']))
+
+    if shard is not None:
+        stdout.write(f'\n--- Shard {shard[0]}/{shard[1]} data saved to {options["data_file"]} ---\n')
+        return {}
+
+    outputs: dict[str, str] = {}
+    summary: dict[str, object] = build_reports(cov, pro_name, options, reports, outputs)
+    lines: dict[str, int] | None = None
+
+    if contexts or plan is not None:
+        with phase('module lines'):
+            lines = DURATIONS.module_lines(cov.get_data())
+
+    DURATIONS.write_modules(stdout, summary.get('totals', {}).get('percent_covered_display'), lines)
+
+    if cache is not None and key is not None and passed:
+        with phase('cache store'):
+            cache.store(key, pro_name, str(options['data_file']), summary, outputs, durations_file(pro_name))
+
+    return summary
+
+
+def shard_data_file(pro_name: str, shard: tuple[int, int]) -> str:
+    '''
+        Gets data file name of one shard.
+
+        :param pro_name: Project name.
+        :param shard: Shard number (1 based) and number of shards.
+        :return: Shard specific coverage data file name.
+        :exceptions: None.
     '''
-        Main execution flow.
+    return f'.coverage.{pro_name}.shard-{shard[0]}-of-{shard[1]}'
+
 
+def durations_file(pro_name: str, shard: tuple[int, int] | None = None) -> str:
+    '''
+        Gets test durations file name (kept in the state directory).
+
+        :param pro_name: Project name.
+        :param shard: Shard number (1 based) and number of shards or None for all modules.
+        :return: Durations file name.
         :exceptions: None.
     '''
-    try:
-        if len(argv) < 2:
-            stderr.write('Usage: ats_coverage <project_name>\n')
-            sys_exit(128)
+    if shard is None:
+        return f'{STATE_DIR}/{pro_name}.durations.json'
 
-        project_name: str = argv[1]
-        run_coverage(project_name)
-        report_data: dict[str, object] = load_report(f'{project_name}.json')
+    return f'{STATE_DIR}/{pro_name}.durations.shard-{shard[0]}-of-{shard[1]}.json'
 
-        if report_data:
-            update_readme(report_data)
-            update_structure(project_name, 'README.md')
-            update_index_coverage(report_data)
-            update_structure(project_name, 'docs/source/index.rst')
-            sys_exit(0)
 
-        stderr.write('ats_coverage: failed to generate coverage report\n')
-        sys_exit(129)
+def combine_coverage(
+    pro_name: str, data_paths: list[str], reports: dict[str, list[str]] | None = None
+) -> dict[str, object]:
+    '''
+        Merges shard data files, builds planned reports and returns summary.
 
-    except (ValueError, TypeError) as err:
-        stderr.write(f'ats_coverage: {err}\n')
-        sys_exit(128)
+        :param pro_name: Project name (is equal to directory name).
+        :param data_paths: Shard coverage data files (kept after merging).
+        :param reports: Report plan (requesters per report kind) or None for all reports.
+        :return: Coverage data report in dict format (files[*].summary and totals).
+        :exceptions:
+            | TypeError:  The parameter pro_name type validation failed.
+            | ValueError: The parameter pro_name format validation failed.
+            | ValueError: The directory or a data file does not exist.
+    '''
+    is_dir = isinstance(pro_name, str) and Path(pro_name).is_dir()
+    check_exists(pro_name if is_dir else f'{pro_name}.py', is_dir=is_dir)
+
+    for data_path in data_paths:
+        check_exists(data_path)
+
+    options: dict[str, object] = {
+        'source': [pro_name], 'config_file': '.coveragerc', 'data_file': f'.coverage.{pro_name}'
+    }
+    cov = Coverage(**options)
+
+    with phase('combine'):
+        cov.erase()
+        cov.combine(data_paths=[str(Path(data_path).resolve()) for data_path in data_paths], keep=True)
+        cov.save()
+    stdout.write(f'\n--- Combined {len(data_paths)} data files into {options["data_file"]} ---\n')
+
+    if any(cov.get_data().measured_contexts()):
+        index_covers(cov.get_data(), str(options['data_file']))
+
+    return build_reports(cov, pro_name, options, reports)
+
+
+def summarize_data(pro_name: str) -> CoverageSummary:
+    '''
+        Computes table summaries straight from the saved data file.
+
+        Tests are not run and no report is written or parsed, the data
+        file is loaded and every measured file is analyzed once.
+
+        :param pro_name: Project name (is equal to directory name).
+        :return: Summary model.
+        :exceptions:
+            | TypeError:  The parameter pro_name type validation failed.
+            | ValueError: The parameter pro_name format validation failed.
+            | ValueError: The directory or the data file does not exist.
+            | NoDataError: There is no data to report.
+    '''
+    is_dir = isinstance(pro_name, str) and Path(pro_name).is_dir()
+    check_exists(pro_name if is_dir else f'{pro_name}.py', is_dir=is_dir)
+    options: dict[str, object] = {
+        'source': [pro_name], 'config_file': '.coveragerc', 'data_file': f'.coverage.{pro_name}'
+    }
+    check_exists(str(options['data_file']))
+    cov = Coverage(**options)
+
+    with phase('load data'):
+        cov.load()
+
+    if not SHARED_ANALYSIS:
+        with phase('summary'):
+            return CoverageSummary.from_report(public_summary(cov))
+
+    with phase('analysis'):
+        analyses: dict[str, Analysis] = analyze_once(cov)
+
+    with phase('summary'):
+        return summary_model(cov, analyses)
+
+
+def main() -> None:
+    '''
+        Main execution flow (commands are dispatched by ats_cli).
+
+        :exceptions: None.
+    '''
+    # coverage and unittest are already imported here, refresh starts
+    # faster through the installed ats_coverage command or ats_cli.py.
+    # ats_cli imports ats_commands, which imports this module.
+    import_module('ats_cli').main()
 
 
 if __name__ == "__main__":
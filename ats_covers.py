@@ -0,0 +1,424 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_covers.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines line to covering tests index built from per-test contexts.
+'''
+
+from __future__ import annotations
+
+from sys import stdout, stderr
+from array import array
+from os import replace, stat
+from os.path import basename, realpath, relpath
+from pathlib import Path
+from sqlite3 import Connection, Error as SQLiteError, connect
+from typing import IO
+
+from coverage import CoverageData
+from coverage.numbits import nums_to_numbits
+
+from ats_config import STATE_DIR
+from ats_timing import phase
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__ = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__ = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__ = '5.0.0'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+COVERS_SCHEMA: str = '''
+    CREATE TABLE meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+    CREATE TABLE files (id INTEGER PRIMARY KEY, path TEXT NOT NULL UNIQUE);
+    CREATE TABLE tests (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+    CREATE TABLE covers (
+        file_id INTEGER NOT NULL, line INTEGER NOT NULL, tests BLOB NOT NULL,
+        PRIMARY KEY (file_id, line)
+    ) WITHOUT ROWID;
+'''
+SQL_VARIABLES: int = 900
+NUMBITS: int = 0
+ID_ARRAY: int = 1
+BYTE_BITS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)
+)
+
+
+def covers_file(data_file: str) -> str:
+    '''
+        Gets index file name of a coverage data file (kept in the state directory).
+
+        :param data_file: Coverage data file path.
+        :return: Index file path.
+        :exceptions: None.
+    '''
+    return f'{STATE_DIR}/{basename(data_file)}.covers'
+
+
+def _data_key(data_file: str) -> tuple[int, int]:
+    '''
+        Gets identity of a coverage data file (mtime and size).
+
+        :param data_file: Coverage data file path.
+        :return: Modification time in nanoseconds and size.
+        :exceptions:
+            | OSError: The data file does not exist.
+    '''
+    info = stat(data_file)
+
+    return info.st_mtime_ns, info.st_size
+
+
+def pack_tests(test_ids: list[int]) -> bytes:
+    '''
+        Packs test ids of one line as numbits or id array, whichever is smaller.
+
+        Numbits take one bit per id up to the highest id, so lines covered
+        by a few late tests are kept as an array of 32 bit ids instead.
+
+        :param test_ids: Test ids.
+        :return: Encoding tag byte followed by encoded ids.
+        :exceptions: None.
+    '''
+    numbits: bytes = nums_to_numbits(test_ids)
+
+    if len(numbits) <= 4 * len(test_ids):
+        return bytes((NUMBITS,)) + numbits
+
+    return bytes((ID_ARRAY,)) + array('I', test_ids).tobytes()
+
+
+def unpack_tests(packed: bytes) -> list[int]:
+    '''
+        Unpacks test ids of one line.
+
+        :param packed: Ids packed by pack_tests.
+        :return: Test ids.
+        :exceptions: None.
+    '''
+    if packed[0] == NUMBITS:
+        return [
+            index * 8 + bit for index, byte in enumerate(packed[1:]) if byte
+            for bit in BYTE_BITS[byte]
+        ]
+
+    test_ids: array[int] = array('I')
+    test_ids.frombytes(packed[1:])
+
+    return test_ids.tolist()
+
+
+class CoverIndex:
+    '''
+        Defines class CoverIndex with tests covering each line.
+        Inverts per-test contexts of a coverage data file into one row per
+        (file, line) holding the packed ids of covering tests, so a line is
+        answered by one primary key lookup.
+
+        It defines:
+
+            :attributes:
+                | data_file - Coverage data file the index is built from.
+                | path - Index file path.
+            :methods:
+                | __init__ - Initials CoverIndex constructor.
+                | _connect - Opens existing index.
+                | _file_ids - Finds file ids of a path (real path or path suffix).
+                | _test_names - Maps test ids to test names.
+                | build - Builds index from coverage data.
+                | is_current - Checks if index matches the data file.
+                | tests_at - Gets tests covering one line.
+                | lines_of - Gets number of covering tests per line of a file.
+                | tests_of - Gets tests covering any line of files.
+    '''
+
+    def __init__(self, data_file: str) -> None:
+        '''
+            Initials CoverIndex constructor.
+
+            :param data_file: Coverage data file path.
+            :exceptions: None.
+        '''
+        self.data_file: str = data_file
+        self.path: str = covers_file(data_file)
+
+    def _connect(self) -> Connection:
+        '''
+            Opens existing index.
+
+            :return: Open connection (closed by the caller).
+            :exceptions:
+                | sqlite3.Error: The index cannot be opened.
+        '''
+        return connect(f'file:{Path(self.path).resolve()}?mode=ro', uri=True)
+
+    def _file_ids(self, connection: Connection, path: str) -> list[tuple[int, str]]:
+        '''
+            Finds file ids of a path (real path or path suffix).
+
+            :param connection: Open index connection.
+            :param path: Source file path.
+            :return: File id and measured path of matching files.
+            :exceptions:
+                | sqlite3.Error: The index cannot be read.
+        '''
+        rows: list[tuple[int, str]] = connection.execute(
+            'SELECT id, path FROM files WHERE path = ?', (realpath(path),)
+        ).fetchall()
+
+        if rows:
+            return rows
+
+        suffix: str = '/' + path.removeprefix('./')
+        escaped: str = suffix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+        return connection.execute(
+            "SELECT id, path FROM files WHERE path LIKE ? ESCAPE '\\' ORDER BY path",
+            (f'%{escaped}',)
+        ).fetchall()
+
+    def _test_names(self, connection: Connection, test_ids: list[int]) -> list[str]:
+        '''
+            Maps test ids to test names.
+
+            :param connection: Open index connection.
+            :param test_ids: Sorted test ids (many ids are matched in one table scan).
+            :return: Test names (ids follow name order, so names are sorted).
+            :exceptions:
+                | sqlite3.Error: The index cannot be read.
+        '''
+        if len(test_ids) > SQL_VARIABLES:
+            names: list[str] = [name for name, in connection.execute('SELECT name FROM tests ORDER BY id')]
+
+            return [names[test_id - 1] for test_id in test_ids]
+
+        return [name for name, in connection.execute(
+            f'SELECT name FROM tests WHERE id IN ({", ".join("?" * len(test_ids))}) ORDER BY id', test_ids
+        )]
+
+    def build(self, data: CoverageData) -> int:
+        '''
+            Builds index from coverage data (replaces the previous index).
+
+            :param data: Coverage data recorded with per-test contexts (read from data_file).
+            :return: Number of indexed lines.
+            :exceptions:
+                | OSError: The data file does not exist or index cannot be written.
+                | sqlite3.Error: The index cannot be written.
+        '''
+        mtime_ns, size = _data_key(self.data_file)
+        temp_path = Path(f'{self.path}.tmp')
+        temp_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path.unlink(missing_ok=True)
+        test_ids: dict[str, int] = {
+            name: test_id for test_id, name in enumerate(sorted(filter(None, data.measured_contexts())), 1)
+        }
+        lines: int = 0
+        connection: Connection = connect(temp_path)
+
+        try:
+            with connection:
+                connection.executescript(COVERS_SCHEMA)
+                connection.executemany('INSERT INTO meta (key, value) VALUES (?, ?)', (
+                    ('mtime_ns', mtime_ns), ('size', size)
+                ))
+                connection.executemany(
+                    'INSERT INTO tests (id, name) VALUES (?, ?)',
+                    ((test_id, name) for name, test_id in test_ids.items())
+                )
+
+                for file_id, filename in enumerate(sorted(data.measured_files()), 1):
+                    connection.execute('INSERT INTO files (id, path) VALUES (?, ?)', (file_id, filename))
+                    rows: list[tuple[int, int, bytes]] = []
+
+                    for line, contexts in data.contexts_by_lineno(filename).items():
+                        covering: list[int] = sorted(
+                            test_ids[context] for context in contexts if context
+                        )
+
+                        if covering:
+                            rows.append((file_id, line, pack_tests(covering)))
+
+                    connection.executemany(
+                        'INSERT INTO covers (file_id, line, tests) VALUES (?, ?, ?)', rows
+                    )
+                    lines += len(rows)
+
+        finally:
+            connection.close()
+
+        replace(temp_path, self.path)
+
+        return lines
+
+    def is_current(self) -> bool:
+        '''
+            Checks if index matches the data file.
+
+            :return: True if the index was built from the current data file.
+            :exceptions: None.
+        '''
+        if not Path(self.path).is_file():
+            return False
+
+        try:
+            connection: Connection = self._connect()
+
+            try:
+                meta: dict[str, int] = dict(connection.execute('SELECT key, value FROM meta'))
+
+            finally:
+                connection.close()
+
+            return (meta.get('mtime_ns'), meta.get('size')) == _data_key(self.data_file)
+
+        except (OSError, SQLiteError):
+            return False
+
+    def tests_at(self, path: str, line: int) -> dict[str, list[str]]:
+        '''
+            Gets tests covering one line.
+
+            :param path: Source file path (real path or path suffix).
+            :param line: Line number.
+            :return: Sorted test names per matching measured file.
+            :exceptions:
+                | sqlite3.Error: The index cannot be read.
+        '''
+        connection: Connection = self._connect()
+        found: dict[str, list[str]] = {}
+
+        try:
+            for file_id, filename in self._file_ids(connection, path):
+                row: tuple[bytes] | None = connection.execute(
+                    'SELECT tests FROM covers WHERE file_id = ? AND line = ?', (file_id, line)
+                ).fetchone()
+                found[filename] = self._test_names(connection, unpack_tests(row[0])) if row else []
+
+        finally:
+            connection.close()
+
+        return found
+
+    def lines_of(self, path: str) -> dict[str, dict[int, int]]:
+        '''
+            Gets number of covering tests per line of a file.
+
+            :param path: Source file path (real path or path suffix).
+            :return: Number of tests per covered line per matching measured file.
+            :exceptions:
+                | sqlite3.Error: The index cannot be read.
+        '''
+        connection: Connection = self._connect()
+        found: dict[str, dict[int, int]] = {}
+
+        try:
+            for file_id, filename in self._file_ids(connection, path):
+                found[filename] = {
+                    line: len(unpack_tests(tests)) for line, tests in connection.execute(
+                        'SELECT line, tests FROM covers WHERE file_id = ? ORDER BY line', (file_id,)
+                    )
+                }
+
+        finally:
+            connection.close()
+
+        return found
+
+    def tests_of(self, paths: set[str]) -> dict[str, set[str]]:
+        '''
+            Gets tests covering any line of files (as build_test_index).
+
+            :param paths: Measured file paths.
+            :return: Test names per file covered by at least one test.
+            :exceptions:
+                | sqlite3.Error: The index cannot be read.
+        '''
+        connection: Connection = self._connect()
+        index: dict[str, set[str]] = {}
+
+        try:
+            for path in paths:
+                test_ids: set[int] = set()
+
+                for tests, in connection.execute(
+                    'SELECT covers.tests FROM files CROSS JOIN covers ON covers.file_id = files.id '
+                    'WHERE files.path = ?', (path,)
+                ):
+                    test_ids.update(unpack_tests(tests))
+
+                if test_ids:
+                    index[path] = set(self._test_names(connection, sorted(test_ids)))
+
+        finally:
+            connection.close()
+
+        return index
+
+
+def write_who_covers(stream: IO[str], index: CoverIndex, target: str) -> bool:
+    '''
+        Writes tests covering a line (file:line) or covered lines of a file.
+
+        :param stream: Output stream.
+        :param index: Current cover index.
+        :param target: Source file path, optionally with :line.
+        :return: False if no measured file matches.
+        :exceptions:
+            | sqlite3.Error: The index cannot be read.
+    '''
+    path, _, line = target.rpartition(':')
+
+    if not path or not line.isdigit():
+        found_lines: dict[str, dict[int, int]] = index.lines_of(target)
+
+        for filename, lines in found_lines.items():
+            stream.write(f'\n--- {relpath(filename)}: {len(lines)} lines covered by tests ---\n')
+            stream.write(f'{"Line":>6}  {"Tests":>6}\n')
+            stream.writelines(f'{lineno:>6}  {count:>6}\n' for lineno, count in lines.items())
+
+        return bool(found_lines)
+
+    found: dict[str, list[str]] = index.tests_at(path, int(line))
+
+    for filename, tests in found.items():
+        stream.write(f'\n--- {relpath(filename)}:{line} covered by {len(tests)} tests ---\n')
+        stream.writelines(f'{test}\n' for test in tests)
+
+    return bool(found)
+
+
+def index_covers(data: CoverageData, data_file: str) -> None:
+    '''
+        Builds who-covers index of saved data with per-test contexts.
+
+        :param data: Saved coverage data.
+        :param data_file: Saved coverage data file.
+        :exceptions: None.
+    '''
+    try:
+        with phase('covers index'):
+            lines: int = CoverIndex(data_file).build(data)
+
+    except (OSError, SQLiteError) as exc:
+        stderr.write(f'{exc}\n')
+        return
+
+    stdout.write(f'\n--- Covers index: {lines} lines indexed in {covers_file(data_file)} ---\n')
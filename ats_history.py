@@ -0,0 +1,345 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_history.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines coverage history store with trend and drop queries.
+'''
+
+from __future__ import annotations
+
+from sys import stderr
+from time import localtime, strftime, time
+from pathlib import Path
+from sqlite3 import Connection, Error as SQLiteError, connect
+from typing import IO
+
+from ats_impact import STATE_DIR
+from ats_summary import CoverageSummary
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__ = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__ = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__ = '5.0.0'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+HISTORY_FILE: str = f'{STATE_DIR}/history.sqlite'
+HISTORY_SCHEMA: str = '''
+    CREATE TABLE IF NOT EXISTS runs (
+        id INTEGER PRIMARY KEY, project TEXT NOT NULL, created REAL NOT NULL,
+        statements INTEGER NOT NULL, missing INTEGER NOT NULL, covered REAL NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS modules (id INTEGER PRIMARY KEY, path TEXT NOT NULL UNIQUE);
+    CREATE TABLE IF NOT EXISTS results (
+        run_id INTEGER NOT NULL REFERENCES runs (id),
+        module_id INTEGER NOT NULL REFERENCES modules (id),
+        statements INTEGER NOT NULL, missing INTEGER NOT NULL, covered REAL NOT NULL,
+        PRIMARY KEY (run_id, module_id)
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS runs_project ON runs (project, id);
+    CREATE INDEX IF NOT EXISTS results_module ON results (module_id, run_id);
+'''
+INSERT_RESULT: str = '''
+    INSERT INTO results (run_id, module_id, statements, missing, covered)
+    SELECT ?, id, ?, ?, ? FROM modules WHERE path = ?
+'''
+SELECT_DROPS: str = '''
+    SELECT modules.path, old.covered, new.covered, new.covered - old.covered AS delta
+    FROM results AS new
+    JOIN results AS old ON old.module_id = new.module_id AND old.run_id = ?
+    JOIN modules ON modules.id = new.module_id
+    WHERE new.run_id = ? AND new.covered < old.covered
+    ORDER BY delta, modules.path LIMIT ?
+'''
+
+
+def percent_covered(statements: int, missing: int) -> float:
+    '''
+        Computes covered percent from statement counts (unrounded).
+
+        :param statements: Number of statements.
+        :param missing: Number of missing statements.
+        :return: Covered percent (100 for no statements).
+        :exceptions: None.
+    '''
+    return (statements - missing) * 100 / statements if statements else 100.0
+
+
+def glob_to_like(pattern: str) -> str:
+    '''
+        Converts glob pattern (* and ?) to SQL LIKE pattern.
+
+        :param pattern: Glob pattern of module paths.
+        :return: LIKE pattern with backslash as escape character.
+        :exceptions: None.
+    '''
+    escaped: str = pattern.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+    return escaped.replace('*', '%').replace('?', '_')
+
+
+class HistoryStore:
+    '''
+        Defines class HistoryStore with per-run coverage summaries in SQLite.
+        Appends total and per-file summaries of every run, module paths are
+        stored once and referenced by id.
+
+        It defines:
+
+            :attributes:
+                | path - History database file path.
+            :methods:
+                | __init__ - Initials HistoryStore constructor.
+                | _connect - Opens database and creates schema if missing.
+                | record - Appends summaries of one run.
+                | runs - Gets latest runs of project.
+                | trends - Gets covered percent per module over latest runs.
+                | drops - Gets modules with the largest coverage drops between two runs.
+    '''
+
+    def __init__(self, path: str = HISTORY_FILE) -> None:
+        '''
+            Initials HistoryStore constructor.
+
+            :param path: History database file path.
+            :exceptions: None.
+        '''
+        self.path: str = path
+
+    def _connect(self) -> Connection:
+        '''
+            Opens database and creates schema if missing.
+
+            :return: Open connection (closed by the caller).
+            :exceptions:
+                | OSError: The state directory cannot be created.
+                | sqlite3.Error: The database cannot be opened.
+        '''
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        connection: Connection = connect(self.path)
+        connection.executescript(HISTORY_SCHEMA)
+
+        return connection
+
+    def record(
+        self, pro_name: str, summary: CoverageSummary, created: float | None = None
+    ) -> int | None:
+        '''
+            Appends summaries of one run.
+
+            Percents are computed from statement counts, the rounded display
+            percents of the summary would hide small changes.
+
+            :param pro_name: Project name.
+            :param summary: Summary model of the run.
+            :param created: Run time (seconds since epoch) or None for now.
+            :return: Run id or None if the store cannot be written.
+            :exceptions: None.
+        '''
+        statements, missing, _ = summary.total
+
+        try:
+            connection: Connection = self._connect()
+
+            try:
+                with connection:
+                    run_id: int = connection.execute(
+                        'INSERT INTO runs (project, created, statements, missing, covered) '
+                        'VALUES (?, ?, ?, ?, ?)', (
+                            pro_name, time() if created is None else created,
+                            statements, missing, percent_covered(statements, missing)
+                        )
+                    ).lastrowid
+                    connection.executemany(
+                        'INSERT OR IGNORE INTO modules (path) VALUES (?)',
+                        ((name,) for name in summary.names)
+                    )
+                    connection.executemany(INSERT_RESULT, (
+                        (run_id, file_statements, file_missing, percent_covered(file_statements, file_missing), name)
+                        for name, file_statements, file_missing, _ in summary
+                    ))
+
+            finally:
+                connection.close()
+
+        except (OSError, SQLiteError) as exc:
+            stderr.write(f'{exc}\n')
+            return None
+
+        return run_id
+
+    def runs(self, pro_name: str, limit: int) -> list[tuple[int, float, int, int, float]]:
+        '''
+            Gets latest runs of project.
+
+            :param pro_name: Project name.
+            :param limit: Maximum number of runs.
+            :return: Run id, time, statements, missing and covered percent (oldest first).
+            :exceptions:
+                | sqlite3.Error: The database cannot be read.
+        '''
+        connection: Connection = self._connect()
+
+        try:
+            rows: list[tuple[int, float, int, int, float]] = connection.execute(
+                'SELECT id, created, statements, missing, covered FROM runs '
+                'WHERE project = ? ORDER BY id DESC LIMIT ?', (pro_name, limit)
+            ).fetchall()
+
+        finally:
+            connection.close()
+
+        return rows[::-1]
+
+    def trends(self, pro_name: str, limit: int, pattern: str = '%') -> dict[str, dict[int, float]]:
+        '''
+            Gets covered percent per module over latest runs.
+
+            :param pro_name: Project name.
+            :param limit: Number of latest runs.
+            :param pattern: SQL LIKE pattern of module paths (backslash escapes).
+            :return: Covered percent per run id per module path (sorted by path).
+            :exceptions:
+                | sqlite3.Error: The database cannot be read.
+        '''
+        run_ids: list[int] = [run[0] for run in self.runs(pro_name, limit)]
+        trends: dict[str, dict[int, float]] = {}
+
+        if not run_ids:
+            return trends
+
+        connection: Connection = self._connect()
+
+        try:
+            for path, run_id, covered in connection.execute(
+                'SELECT modules.path, results.run_id, results.covered FROM modules '
+                'CROSS JOIN results ON results.module_id = modules.id '
+                f'AND results.run_id IN ({", ".join("?" * len(run_ids))}) '
+                "WHERE modules.path LIKE ? ESCAPE '\\' "
+                'ORDER BY modules.path, results.run_id', (*run_ids, pattern)
+            ):
+                trends.setdefault(path, {})[run_id] = covered
+
+        finally:
+            connection.close()
+
+        return trends
+
+    def drops(
+        self, pro_name: str, old: int | None = None, new: int | None = None, limit: int = 10
+    ) -> tuple[int, int, list[tuple[str, float, float, float]]]:
+        '''
+            Gets modules with the largest coverage drops between two runs.
+
+            :param pro_name: Project name.
+            :param old: Earlier run id or None for the run before the latest one.
+            :param new: Later run id or None for the latest run.
+            :param limit: Maximum number of modules.
+            :return: Old run id, new run id and module path, old percent,
+                     new percent and change per dropped module (largest first).
+            :exceptions:
+                | ValueError: Fewer than two runs are recorded.
+                | ValueError: A run id is not a recorded run of the project.
+                | sqlite3.Error: The database cannot be read.
+        '''
+        if old is None or new is None:
+            latest: list[int] = [run[0] for run in self.runs(pro_name, 2)]
+
+            if len(latest) < 2:
+                raise ValueError(f'At least two recorded runs of {pro_name} are needed')
+
+            old = latest[0] if old is None else old
+            new = latest[1] if new is None else new
+
+        connection: Connection = self._connect()
+
+        try:
+            found: set[int] = {run_id for run_id, in connection.execute(
+                'SELECT id FROM runs WHERE project = ? AND id IN (?, ?)', (pro_name, old, new)
+            )}
+
+            for run_id in (old, new):
+                if run_id not in found:
+                    raise ValueError(f'Run {run_id} is not a recorded run of {pro_name}')
+
+            rows: list[tuple[str, float, float, float]] = connection.execute(
+                SELECT_DROPS, (old, new, limit)
+            ).fetchall()
+
+        finally:
+            connection.close()
+
+        return old, new, rows
+
+
+def write_trends(
+    stream: IO[str], store: HistoryStore, pro_name: str, limit: int, pattern: str = '%'
+) -> None:
+    '''
+        Writes latest runs and covered percent per module over them.
+
+        :param stream: Output stream.
+        :param store: History store.
+        :param pro_name: Project name.
+        :param limit: Number of latest runs.
+        :param pattern: SQL LIKE pattern of module paths (backslash escapes).
+        :exceptions:
+            | sqlite3.Error: The database cannot be read.
+    '''
+    runs: list[tuple[int, float, int, int, float]] = store.runs(pro_name, limit)
+    trends: dict[str, dict[int, float]] = store.trends(pro_name, limit, pattern)
+    stream.write(f'\n--- History of {pro_name}: {len(runs)} runs ---\n')
+
+    for run_id, created, statements, missing, covered in runs:
+        when: str = strftime('%Y-%m-%d %H:%M:%S', localtime(created))
+        stream.write(f'Run {run_id:>5}  {when}  {statements:>7} stmts  {missing:>7} miss  {covered:>6.1f}%\n')
+
+    width: int = max([len('Module'), *(len(path) for path in trends)])
+    stream.write(f'\n{"Module":<{width}}  {"  ".join(f"{run_id:>7}" for run_id, *_ in runs)}\n')
+
+    for path, covered_by_run in trends.items():
+        cells: str = '  '.join(
+            f'{covered_by_run[run_id]:>6.1f}%' if run_id in covered_by_run else f'{"-":>7}'
+            for run_id, *_ in runs
+        )
+        stream.write(f'{path:<{width}}  {cells}\n')
+
+
+def write_drops(
+    stream: IO[str], store: HistoryStore, pro_name: str, old: int | None = None,
+    new: int | None = None, limit: int = 10
+) -> None:
+    '''
+        Writes modules with the largest coverage drops between two runs.
+
+        :param stream: Output stream.
+        :param store: History store.
+        :param pro_name: Project name.
+        :param old: Earlier run id or None for the run before the latest one.
+        :param new: Later run id or None for the latest run.
+        :param limit: Maximum number of modules.
+        :exceptions:
+            | ValueError: Fewer than two runs are recorded.
+            | sqlite3.Error: The database cannot be read.
+    '''
+    old, new, rows = store.drops(pro_name, old, new, limit)
+    stream.write(f'\n--- Coverage drops of {pro_name} from run {old} to run {new}: {len(rows)} ---\n')
+
+    for path, old_covered, new_covered, delta in rows:
+        stream.write(f'{path}  {old_covered:.1f}% -> {new_covered:.1f}% ({delta:+.1f})\n')
@@ -0,0 +1,160 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_ignore.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines .gitignore style patterns for pruning the package tree.
+'''
+
+from __future__ import annotations
+
+from re import Pattern, compile as re_compile, escape
+from sys import stderr
+from collections.abc import Iterable
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__ = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__ = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__ = '5.0.0'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+IGNORE_FILE: str = '.gitignore'
+
+
+def translate(pattern: str) -> str:
+    '''
+        Translates .gitignore glob to regular expression.
+
+        :param pattern: Glob without negation, anchoring and trailing slash.
+        :return: Regular expression source matching a relative path.
+        :exceptions: None.
+    '''
+    parts: list[str] = []
+    index: int = 0
+
+    while index < len(pattern):
+        char: str = pattern[index]
+        index += 1
+
+        if char == '*' and pattern.startswith('*/', index):
+            parts.append('(?:.*/)?')
+            index += 2
+        elif char == '*' and pattern.startswith('*', index):
+            parts.append('.*')
+            index += 1
+        elif char == '*':
+            parts.append('[^/]*')
+        elif char == '?':
+            parts.append('[^/]')
+        elif char == '\\' and index < len(pattern):
+            parts.append(escape(pattern[index]))
+            index += 1
+        elif char == '[' and (end := pattern.find(']', index + 1)) != -1:
+            members: str = pattern[index:end].replace('\\', '\\\\')
+            parts.append(f'[^{members[1:]}]' if members.startswith('!') else f'[{members}]')
+            index = end + 1
+        else:
+            parts.append(escape(char))
+
+    return ''.join(parts)
+
+
+class IgnoreRules:
+    '''
+        Defines class IgnoreRules with ordered .gitignore style rules.
+        The last matching rule decides, negated rules re-include paths.
+
+        It defines:
+
+            :attributes:
+                | rules - Compiled (pattern, negated, directory only) rules.
+            :methods:
+                | __init__ - Initials IgnoreRules constructor.
+                | add - Adds patterns relative to a base directory.
+                | add_file - Adds patterns of an ignore file.
+                | ignored - Checks if a path is ignored.
+    '''
+
+    def __init__(self) -> None:
+        '''
+            Initials IgnoreRules constructor.
+
+            :exceptions: None.
+        '''
+        self.rules: list[tuple[Pattern[str], bool, bool]] = []
+
+    def add(self, patterns: Iterable[str], base: str = '') -> None:
+        '''
+            Adds patterns relative to a base directory.
+
+            :param patterns: Lines in .gitignore format.
+            :param base: Directory of the patterns ('' or path ending with '/').
+            :exceptions: None.
+        '''
+        for line in patterns:
+            pattern: str = line.rstrip('\n')
+
+            while pattern.endswith(' ') and not pattern.endswith('\\ '):
+                pattern = pattern[:-1]
+
+            if not pattern or pattern.startswith('#'):
+                continue
+
+            negated: bool = pattern.startswith('!')
+            pattern = pattern[1:] if negated else pattern
+            pattern = pattern[1:] if pattern.startswith(('\\#', '\\!')) else pattern
+            dir_only: bool = pattern.endswith('/')
+            pattern = pattern.rstrip('/')
+
+            if not pattern:
+                continue
+
+            anchor: str = '' if '/' in pattern else '(?:.*/)?'
+            regex: str = f'{escape(base)}{anchor}{translate(pattern.lstrip("/"))}'
+            self.rules.append((re_compile(regex + r'\Z'), negated, dir_only))
+
+    def add_file(self, file_path: str, base: str = '') -> None:
+        '''
+            Adds patterns of an ignore file.
+
+            :param file_path: Path to the ignore file.
+            :param base: Directory of the ignore file ('' or path ending with '/').
+            :exceptions: None.
+        '''
+        try:
+            with open(file_path, 'r', encoding='utf-8') as ignore_file:
+                self.add(ignore_file.readlines(), base)
+
+        except (OSError, UnicodeDecodeError) as exc:
+            stderr.write(f'{exc}\n')
+
+    def ignored(self, path: str, is_dir: bool) -> bool:
+        '''
+            Checks if a path is ignored.
+
+            :param path: Path relative to the project root ('/' separated).
+            :param is_dir: The path is a directory.
+            :return: True if the last matching rule ignores the path.
+            :exceptions: None.
+        '''
+        for pattern, negated, dir_only in reversed(self.rules):
+            if (is_dir or not dir_only) and pattern.match(path):
+                return not negated
+
+        return False
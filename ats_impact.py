@@ -0,0 +1,406 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_impact.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines test impact selection based on per-test coverage contexts.
+'''
+
+from __future__ import annotations
+
+from sys import stderr
+from ast import Import, ImportFrom, parse, walk
+from os import sep
+from os.path import realpath, relpath
+from json import load, dump
+from sqlite3 import Error as SQLiteError
+from fnmatch import fnmatch
+from hashlib import sha1
+from pathlib import Path
+from unittest import TestCase
+
+from coverage import CoverageData
+
+from ats_config import STATE_DIR
+from ats_covers import CoverIndex
+from ats_runner import module_of_test
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__ = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__ = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__ = '5.0.0'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+def tracked_files(pro_name: str) -> list[Path]:
+    '''
+        Lists measured sources, test files and coverage configuration.
+
+        :param pro_name: Project name.
+        :return: Paths of tracked files (may include missing ones).
+        :exceptions: None.
+    '''
+    pro_path = Path(pro_name)
+    paths: list[Path] = list(pro_path.rglob('*.py')) if pro_path.is_dir() else [Path(f'{pro_name}.py')]
+    paths.extend(Path('tests').rglob('*.py'))
+    paths.append(Path('.coveragerc'))
+
+    return paths
+
+
+def fingerprint_files(pro_name: str) -> dict[str, str]:
+    '''
+        Hashes measured sources, test files and coverage configuration.
+
+        :param pro_name: Project name.
+        :return: Content hash per real file path.
+        :exceptions: None.
+    '''
+    hashes: dict[str, str] = {}
+
+    for path in tracked_files(pro_name):
+        if path.is_file():
+            hashes[realpath(path)] = sha1(path.read_bytes()).hexdigest()
+
+    return hashes
+
+
+def build_test_index(data: CoverageData) -> dict[str, set[str]]:
+    '''
+        Builds source file to test ids index from per-test contexts.
+
+        :param data: Coverage data recorded with per-test contexts.
+        :return: Test ids (contexts) which executed each measured file.
+        :exceptions: None.
+    '''
+    index: dict[str, set[str]] = {}
+
+    for filename in data.measured_files():
+        tests: set[str] = set()
+
+        for contexts in data.contexts_by_lineno(filename).values():
+            tests.update(context for context in contexts if context)
+
+        if tests:
+            index[filename] = tests
+
+    return index
+
+
+def _indexed_tests(data_file: str, paths: set[str]) -> dict[str, set[str]] | None:
+    '''
+        Gets tests covering files from the who-covers index of the data file.
+
+        :param data_file: Coverage data file path.
+        :param paths: Real paths of files to look up.
+        :return: Test ids per covered file or None if there is no current index.
+        :exceptions: None.
+    '''
+    covers = CoverIndex(data_file)
+
+    if not covers.is_current():
+        return None
+
+    try:
+        return covers.tests_of(paths)
+
+    except SQLiteError:
+        return None
+
+
+def _test_module(path: str) -> str:
+    '''
+        Converts a test file path to its module name.
+
+        :param path: Real path of a test file.
+        :return: Dotted module name relative to the working directory.
+        :exceptions: None.
+    '''
+    return '.'.join(Path(relpath(path, realpath('.'))).with_suffix('').parts)
+
+
+def imported_modules(path: Path, module: str) -> set[str]:
+    '''
+        Lists modules a source file imports (names imported from a package included).
+
+        :param path: Source file path.
+        :param module: Dotted module name of the source file.
+        :return: Absolute dotted names of imported modules.
+        :exceptions:
+            | OSError: The source file cannot be read.
+            | SyntaxError: The source file cannot be parsed.
+            | ValueError: The source file contains null bytes.
+    '''
+    package: list[str] = module.split('.') if path.name == '__init__.py' else module.split('.')[:-1]
+    imported: set[str] = set()
+
+    for node in walk(parse(path.read_bytes(), str(path))):
+        if isinstance(node, Import):
+            imported.update(alias.name for alias in node.names)
+        elif isinstance(node, ImportFrom):
+            parts: list[str] = package[:max(len(package) + 1 - node.level, 0)] if node.level else []
+
+            if node.module:
+                parts.append(node.module)
+
+            base: str = '.'.join(parts)
+            imported.add(base)
+            imported.update(f'{base}.{alias.name}' if base else alias.name for alias in node.names)
+
+    return imported
+
+
+def test_dependents(modules: set[str]) -> set[str] | None:
+    '''
+        Finds test modules importing (or subclassing from) changed test modules.
+
+        An import matches a test module by its full dotted name or by a
+        trailing part of it, so tests importing siblings without the tests
+        package prefix are found too. Dependents are followed transitively.
+
+        :param modules: Dotted names of changed test modules.
+        :return: Changed modules with all test modules depending on them or
+                 None if a test file cannot be read or parsed.
+        :exceptions: None.
+    '''
+    importers: dict[str, set[str]] = {}
+
+    for path in Path('tests').rglob('*.py'):
+        module: str = _test_module(realpath(path))
+
+        try:
+            imported: set[str] = imported_modules(path, module)
+
+        except (OSError, SyntaxError, ValueError) as exc:
+            stderr.write(f'{exc}\n')
+            return None
+
+        for name in imported:
+            importers.setdefault(name, set()).add(module)
+
+    selected: set[str] = set(modules)
+    pending: list[str] = list(modules)
+
+    while pending:
+        parts: list[str] = pending.pop().split('.')
+
+        for start in range(len(parts)):
+            for importer in importers.get('.'.join(parts[start:]), ()):
+                if importer not in selected:
+                    selected.add(importer)
+                    pending.append(importer)
+
+    return selected
+
+
+class ImpactPlan:
+    '''
+        Defines class ImpactPlan with incremental test selection.
+        Selects tests affected by changed files and keeps data of the others.
+
+        It defines:
+
+            :attributes:
+                | pro_name - Project name.
+                | hashes - Current content hashes of tracked files.
+                | full - Run the whole suite.
+                | reason - Human readable reason for the selection.
+                | changed - Changed (or removed) tracked files.
+                | tests - Selected test ids covering changed sources.
+                | modules - Selected test modules whose files changed or which import them.
+                | data - Previous coverage data (with contexts).
+            :methods:
+                | __init__ - Initials ImpactPlan constructor.
+                | selects_id - Checks if a recorded test id is selected.
+                | wants_test - Checks if a test is selected by module and test id.
+                | wants - Checks if a discovered test case is selected.
+                | retained_data - Collects previous data of tests not selected.
+                | save_state - Stores current hashes for the next run.
+    '''
+
+    def __init__(self, pro_name: str, hashes: dict[str, str], reason: str) -> None:
+        '''
+            Initials ImpactPlan constructor (selecting the whole suite).
+
+            :param pro_name: Project name.
+            :param hashes: Current content hashes of tracked files.
+            :param reason: Reason for running the whole suite.
+            :exceptions: None.
+        '''
+        self.pro_name: str = pro_name
+        self.hashes: dict[str, str] = hashes
+        self.full: bool = True
+        self.reason: str = reason
+        self.changed: set[str] = set()
+        self.tests: set[str] = set()
+        self.modules: set[str] = set()
+        self.data: CoverageData | None = None
+
+    def selects_id(self, test_id: str) -> bool:
+        '''
+            Checks if a recorded test id is selected.
+
+            :param test_id: Test id (coverage context label).
+            :return: True if the test will be run again.
+            :exceptions: None.
+        '''
+        if self.full or test_id in self.tests:
+            return True
+
+        return any(test_id.startswith(f'{module}.') for module in self.modules)
+
+    def wants_test(self, module: str, test_id: str) -> bool:
+        '''
+            Checks if a test is selected by module and test id.
+
+            :param module: Module defining the test case.
+            :param test_id: Test id.
+            :return: True if the test should run.
+            :exceptions: None.
+        '''
+        return self.full or test_id in self.tests or module in self.modules
+
+    def wants(self, test: TestCase) -> bool:
+        '''
+            Checks if a discovered test case is selected.
+
+            :param test: Discovered test case.
+            :return: True if the test case should run.
+            :exceptions: None.
+        '''
+        return self.wants_test(module_of_test(test), test.id())
+
+    def retained_data(self) -> CoverageData | None:
+        '''
+            Collects previous data of tests not selected for this run.
+
+            :return: In-memory coverage data with contexts, or None for full runs.
+            :exceptions: None.
+        '''
+        if self.full or self.data is None:
+            return None
+
+        by_context: dict[str, dict[str, set[int]]] = {}
+
+        for filename in self.data.measured_files():
+            if filename in self.changed:
+                continue
+
+            for lineno, contexts in self.data.contexts_by_lineno(filename).items():
+                for context in contexts:
+                    if context and self.selects_id(context):
+                        continue
+
+                    by_context.setdefault(context, {}).setdefault(filename, set()).add(lineno)
+
+        self.data = None
+        retained = CoverageData(no_disk=True)
+
+        for context, lines in by_context.items():
+            retained.set_context(context)
+            retained.add_lines(lines)
+
+        return retained
+
+    def save_state(self) -> None:
+        '''
+            Stores current hashes for the next run.
+
+            :exceptions: None.
+        '''
+        state_path = Path(STATE_DIR) / f'{self.pro_name}.impact.json'
+
+        try:
+            state_path.parent.mkdir(parents=True, exist_ok=True)
+
+            with open(state_path, 'w', encoding='utf-8') as state_file:
+                dump({'files': self.hashes}, state_file)
+
+        except OSError as exc:
+            stderr.write(f'{exc}\n')
+
+
+def plan_incremental(pro_name: str, data: CoverageData | None = None) -> ImpactPlan:
+    '''
+        Plans an incremental run from previous hashes and per-test contexts.
+
+        :param pro_name: Project name.
+        :param data: Previous coverage data already in memory or None to read data file.
+        :return: Impact plan (full run whenever selection would be unsafe).
+        :exceptions: None.
+    '''
+    hashes: dict[str, str] = fingerprint_files(pro_name)
+    state_path = Path(STATE_DIR) / f'{pro_name}.impact.json'
+    data_path = Path(f'.coverage.{pro_name}')
+
+    if not state_path.is_file() or (data is None and not data_path.is_file()):
+        return ImpactPlan(pro_name, hashes, 'no previous incremental run')
+
+    try:
+        with open(state_path, 'r', encoding='utf-8') as state_file:
+            previous: dict[str, str] = load(state_file)['files']
+
+    except (OSError, ValueError, KeyError) as exc:
+        return ImpactPlan(pro_name, hashes, f'unreadable state ({exc})')
+
+    loaded: bool = data is None
+
+    if data is None:
+        data = CoverageData(basename=str(data_path))
+        data.read()
+
+    if data.has_arcs():
+        return ImpactPlan(pro_name, hashes, 'branch data cannot be merged per test')
+
+    plan = ImpactPlan(pro_name, hashes, '')
+    plan.changed = {
+        path for path in hashes.keys() | previous.keys()
+        if hashes.get(path) != previous.get(path)
+    }
+    index: dict[str, set[str]] | None = _indexed_tests(str(data_path), plan.changed) if loaded else None
+
+    if index is None:
+        index = build_test_index(data)
+
+    tests_dir: str = realpath('tests') + sep
+    changed_tests: set[str] = set()
+
+    for path in plan.changed:
+        if path.startswith(tests_dir) and fnmatch(Path(path).name, '*_test.py'):
+            changed_tests.add(_test_module(path))
+        elif path in index:
+            plan.tests.update(index[path])
+        else:
+            plan.reason = f'{relpath(path)} is not mapped to any test'
+            return plan
+
+    if changed_tests:
+        dependents: set[str] | None = test_dependents(changed_tests)
+
+        if dependents is None:
+            plan.reason = 'test modules depending on changed tests are unknown'
+            return plan
+
+        plan.modules = dependents
+
+    plan.full = False
+    plan.reason = f'{len(plan.changed)} changed files'
+    plan.data = data
+
+    return plan
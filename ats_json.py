@@ -0,0 +1,294 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_json.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines streaming extraction of summaries from coverage JSON reports.
+'''
+
+from __future__ import annotations
+
+from re import DOTALL, Pattern, compile as re_compile
+from json import loads
+from collections.abc import Iterator
+from typing import IO
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__ = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__ = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__ = '5.0.0'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+CHUNK_SIZE: int = 256 * 1024
+KEPT_SECTIONS: tuple[str, ...] = ('meta', 'totals')
+NESTING: dict[str, int] = {'{': 1, '[': 1, '}': -1, ']': -1}
+STRING_TOKEN: Pattern[str] = re_compile(r'"(?:[^"\\]++|\\.)*+"')
+BRACKET_TOKEN: Pattern[str] = re_compile(r'(?:[^\[\]{}"]++|"(?:[^"\\]++|\\.)*+")*+(.|\Z)', DOTALL)
+SCALAR_STOP: Pattern[str] = re_compile(r'[,\]}\s]')
+
+
+class JsonScanner:
+    '''
+        Defines class JsonScanner with incremental JSON tokens.
+        Reads a text stream in chunks, skipped values are never decoded
+        and consumed text is dropped from the buffer.
+
+        It defines:
+
+            :attributes:
+                | stream - Text stream of the JSON document.
+                | buffer - Text read but not consumed yet (from mark if set).
+                | pos - Position of the next character in buffer.
+                | mark - Start of a value kept for decoding or None.
+            :methods:
+                | __init__ - Initials JsonScanner constructor.
+                | _fill - Reads next chunk into buffer.
+                | _search - Finds next stop character, reading chunks as needed.
+                | peek - Gets next non whitespace character.
+                | expect - Consumes expected structural character.
+                | keys - Reads object member by member (caller consumes each value).
+                | key - Reads member key and the colon after it.
+                | skip - Skips value without decoding it.
+                | value - Reads and decodes value.
+    '''
+
+    def __init__(self, stream: IO[str]) -> None:
+        '''
+            Initials JsonScanner constructor.
+
+            :param stream: Text stream of the JSON document.
+            :exceptions: None.
+        '''
+        self.stream: IO[str] = stream
+        self.buffer: str = ''
+        self.pos: int = 0
+        self.mark: int | None = None
+
+    def _fill(self) -> bool:
+        '''
+            Reads next chunk into buffer.
+
+            :return: False at the end of the stream.
+            :exceptions: None.
+        '''
+        chunk: str = self.stream.read(CHUNK_SIZE)
+
+        if not chunk:
+            return False
+
+        start: int = min(self.pos, len(self.buffer)) if self.mark is None else self.mark
+        self.buffer = self.buffer[start:] + chunk
+        self.pos -= start
+
+        if self.mark is not None:
+            self.mark = 0
+
+        return True
+
+    def _search(self, pattern: Pattern[str]) -> int:
+        '''
+            Finds next stop character, reading chunks as needed.
+
+            :param pattern: Pattern of stop characters.
+            :return: Position of the stop character (buffer length at the end of the stream).
+            :exceptions: None.
+        '''
+        while (found := pattern.search(self.buffer, self.pos)) is None:
+            self.pos = len(self.buffer)
+
+            if not self._fill():
+                return self.pos
+
+        return found.start()
+
+    def peek(self) -> str:
+        '''
+            Gets next non whitespace character.
+
+            :return: Character or '' at the end of the stream.
+            :exceptions: None.
+        '''
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\r\n':
+                self.pos += 1
+
+            if self.pos < len(self.buffer) or not self._fill():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def expect(self, char: str) -> None:
+        '''
+            Consumes expected structural character.
+
+            :param char: Expected character.
+            :exceptions:
+                | ValueError: Other character found.
+        '''
+        found: str = self.peek()
+
+        if found != char:
+            raise ValueError(f'Expected {char!r} but found {found or "end of file"!r}')
+
+        self.pos += 1
+
+    def keys(self) -> Iterator[str]:
+        '''
+            Reads object member by member (caller consumes each value).
+
+            :return: Iterator of member keys.
+            :exceptions:
+                | ValueError: Malformed object.
+        '''
+        self.expect('{')
+
+        if self.peek() == '}':
+            self.pos += 1
+            return
+
+        while True:
+            yield self.key()
+
+            if self.peek() != ',':
+                self.expect('}')
+                return
+
+            self.pos += 1
+
+    def key(self) -> str:
+        '''
+            Reads member key and the colon after it.
+
+            :return: Key.
+            :exceptions:
+                | ValueError: Malformed member.
+        '''
+        key: object = self.value()
+
+        if not isinstance(key, str):
+            raise ValueError(f'Expected member name but found {key!r}')
+
+        self.expect(':')
+
+        return key
+
+    def skip(self) -> None:
+        '''
+            Skips value without decoding it.
+
+            Runs of scalars and whole strings are passed over by regular
+            expressions, only brackets are handled one by one.
+
+            :exceptions:
+                | ValueError: Unterminated value.
+        '''
+        char: str = self.peek()
+
+        if not char:
+            raise ValueError('Expected value but found end of file')
+
+        if char == '"':
+            while (string := STRING_TOKEN.match(self.buffer, self.pos)) is None:
+                if not self._fill():
+                    raise ValueError('Unterminated string at end of file')
+
+            self.pos = string.end()
+            return
+
+        if char not in '{[':
+            self.pos = self._search(SCALAR_STOP)
+            return
+
+        depth: int = 0
+
+        while True:
+            resume: int = len(self.buffer)
+
+            for token in BRACKET_TOKEN.finditer(self.buffer, self.pos):
+                char = token.group(1)
+
+                if char in ('"', ''):
+                    resume = token.start(1)
+                    break
+
+                depth += NESTING[char]
+
+                if depth == 0:
+                    self.pos = token.end()
+                    return
+
+            self.pos = resume
+
+            if not self._fill():
+                raise ValueError('Unterminated value at end of file')
+
+    def value(self) -> object:
+        '''
+            Reads and decodes value.
+
+            :return: Decoded value.
+            :exceptions:
+                | ValueError: Malformed value.
+        '''
+        self.peek()
+        self.mark = self.pos
+
+        try:
+            self.skip()
+            return loads(self.buffer[self.mark:self.pos])
+
+        finally:
+            self.mark = None
+
+
+def load_summaries(stream: IO[str]) -> dict[str, object]:
+    '''
+        Extracts files[*].summary, totals and meta from coverage JSON report.
+
+        Line lists, contexts, functions and classes are skipped without
+        being decoded, so memory stays bounded by the largest kept value.
+
+        :param stream: Text stream of the JSON report.
+        :return: Coverage data report in dict format (without line lists).
+        :exceptions:
+            | ValueError: Malformed JSON report.
+    '''
+    scanner = JsonScanner(stream)
+    report: dict[str, object] = {}
+
+    for section in scanner.keys():
+        if section == 'files':
+            files: dict[str, object] = {}
+
+            for name in scanner.keys():
+                entry: dict[str, object] = {}
+
+                for field in scanner.keys():
+                    if field == 'summary':
+                        entry['summary'] = scanner.value()
+                    else:
+                        scanner.skip()
+
+                files[name] = entry
+
+            report['files'] = files
+        elif section in KEPT_SECTIONS:
+            report[section] = scanner.value()
+        else:
+            scanner.skip()
+
+    return report
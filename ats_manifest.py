@@ -0,0 +1,491 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_manifest.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines cached test discovery manifest with lazily loaded test modules.
+'''
+
+from __future__ import annotations
+
+from sys import path as sys_path, stderr, modules
+from os import scandir, stat
+from os.path import abspath, isdir, isfile, join, relpath
+from re import IGNORECASE, compile as re_compile
+from json import dump, load as load_json
+from fnmatch import fnmatch
+from importlib import import_module
+from pathlib import Path
+from traceback import format_exc
+from collections.abc import Callable, Iterator
+from unittest import SkipTest, TestCase, TestLoader, TestSuite
+
+from ats_impact import STATE_DIR
+from ats_runner import FAILED_TEST_PREFIX, iter_test_cases, module_of_test
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__ = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__ = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__ = '5.0.0'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+MANIFEST_FILE: str = f'{STATE_DIR}/tests.manifest.json'
+MANIFEST_VERSION: int = 1
+VALID_MODULE_NAME = re_compile(r'[_a-z]\w*\.py$', IGNORECASE)
+SKIPPED_TEST_PREFIX: str = 'unittest.loader.ModuleSkipped.'
+
+TestWants = Callable[[str, str], bool]
+
+
+class ModuleTest(TestCase):
+    '''
+        Defines class ModuleTest with outcome of a module which was not loaded.
+        Fails with the import error or skips with the SkipTest reason, under
+        the same test id as TestLoader.discover gives it, so ids do not
+        depend on whether the manifest or discovery built the suite.
+
+        It defines:
+
+            :attributes:
+                | module - Name of the test module.
+                | prefix - Test id prefix (failed import or skipped module).
+                | error - Import error message or None for a skipped module.
+                | reason - Skip reason.
+            :methods:
+                | __init__ - Initials ModuleTest constructor.
+                | id - Gets test id of the module outcome.
+                | __str__ - Gets description of the module outcome.
+                | test_module - Fails with the import error or skips the module.
+    '''
+
+    def __init__(self, module: str, error: str | None, reason: str = '') -> None:
+        '''
+            Initials ModuleTest constructor.
+
+            :param module: Name of the test module.
+            :param error: Import error message or None for a skipped module.
+            :param reason: Skip reason.
+            :exceptions: None.
+        '''
+        super().__init__('test_module')
+        self.module: str = module
+        self.prefix: str = FAILED_TEST_PREFIX if error is not None else SKIPPED_TEST_PREFIX
+        self.error: str | None = error
+        self.reason: str = reason
+
+    def id(self) -> str:
+        '''
+            Gets test id of the module outcome.
+
+            :return: Test id (prefix followed by module name).
+            :exceptions: None.
+        '''
+        return f'{self.prefix}{self.module}'
+
+    def __str__(self) -> str:
+        '''
+            Gets description of the module outcome.
+
+            :return: Module name followed by test id.
+            :exceptions: None.
+        '''
+        return f'{self.module} ({self.id()})'
+
+    def test_module(self) -> None:
+        '''
+            Fails with the import error or skips the module.
+
+            :exceptions:
+                | ImportError: The test module failed to import.
+                | SkipTest: The test module raised SkipTest on import.
+        '''
+        if self.error is not None:
+            raise ImportError(self.error)
+
+        self.skipTest(self.reason)
+
+
+class LazyModuleSuite(TestSuite):
+    '''
+        Defines class LazyModuleSuite with tests of one module loaded on demand.
+        The module is imported the first time the suite is iterated, which
+        during a run is when its turn comes.
+
+        It defines:
+
+            :attributes:
+                | _load - Loads tests of the module (None once loaded).
+            :methods:
+                | __init__ - Initials LazyModuleSuite constructor.
+                | __iter__ - Loads tests on first use and iterates them.
+    '''
+
+    def __init__(self, load: Callable[[], TestSuite]) -> None:
+        '''
+            Initials LazyModuleSuite constructor.
+
+            :param load: Loads tests of the module.
+            :exceptions: None.
+        '''
+        super().__init__()
+        self._load: Callable[[], TestSuite] | None = load
+
+    def __iter__(self) -> Iterator[TestSuite | TestCase]:
+        '''
+            Loads tests on first use and iterates them.
+
+            :return: Iterator over loaded tests.
+            :exceptions: None.
+        '''
+        if self._load is not None:
+            load, self._load = self._load, None
+            self.addTests(load())
+
+        return super().__iter__()
+
+
+class DiscoveryManifest:
+    '''
+        Defines class DiscoveryManifest with cached test discovery.
+        Keeps test modules and test ids of the test tree keyed by file path,
+        mtime and size, so only changed files are imported to refresh it.
+        Builds the same suite as TestLoader.discover with modules loaded
+        lazily, and skips modules without selected tests entirely.
+
+        It defines:
+
+            :attributes:
+                | start_dir - Test directory.
+                | pattern - Test file name pattern.
+                | top_level_dir - Top level directory for imports.
+                | path - Manifest file path.
+                | loader - Test loader of the modules.
+                | entries - Manifest entry per test file (discovery order).
+                | _suites - Tests loaded while refreshing changed files.
+            :methods:
+                | __init__ - Initials DiscoveryManifest constructor.
+                | _module_name - Converts a test file path to its module name.
+                | _scan - Finds test files and packages as discovery does.
+                | _read - Reads manifest entries stored by a previous run.
+                | _stale - Checks if an entry does not match the files on disk.
+                | _load - Loads tests of one module as discovery does.
+                | _build - Builds the entry of a changed file.
+                | refresh - Rebuilds entries of changed files.
+                | save - Stores manifest entries.
+                | modules - Gets test module names.
+                | groups - Groups selected test ids by test module.
+                | suite - Builds test suite with lazily loaded modules.
+                | _module_suite - Loads tests of one entry and keeps the selected ones.
+    '''
+
+    def __init__(
+        self, start_dir: str = 'tests', pattern: str = '*_test.py',
+        top_level_dir: str = '.', path: str = MANIFEST_FILE
+    ) -> None:
+        '''
+            Initials DiscoveryManifest constructor.
+
+            :param start_dir: Test directory.
+            :param pattern: Test file name pattern.
+            :param top_level_dir: Top level directory for imports.
+            :param path: Manifest file path.
+            :exceptions: None.
+        '''
+        self.start_dir: str = start_dir
+        self.pattern: str = pattern
+        self.top_level_dir: str = abspath(top_level_dir)
+        self.path: str = path
+        self.loader: TestLoader = TestLoader()
+        self.entries: dict[str, dict[str, object]] = {}
+        self._suites: dict[str, TestSuite] = {}
+
+    def _module_name(self, path: str) -> str:
+        '''
+            Converts a test file path to its module name.
+
+            :param path: Test file path relative to the top level directory.
+            :return: Dotted module name (package name for __init__.py).
+            :exceptions: None.
+        '''
+        parts: tuple[str, ...] = Path(path).with_suffix('').parts
+
+        return '.'.join(parts[:-1] if parts[-1] == '__init__' else parts)
+
+    def _scan(self, directory: str) -> list[str]:
+        '''
+            Finds test files and packages as discovery does.
+
+            :param directory: Package directory relative to the top level directory.
+            :return: Package __init__.py followed by test files and
+                     subpackages in sorted order.
+            :exceptions: None.
+        '''
+        found: list[str] = [join(directory, '__init__.py')]
+
+        for entry in sorted(scandir(join(self.top_level_dir, directory)), key=lambda item: item.name):
+            path: str = join(directory, entry.name)
+
+            if entry.is_file():
+                if VALID_MODULE_NAME.match(entry.name) and fnmatch(entry.name, self.pattern):
+                    found.append(path)
+            elif entry.is_dir() and isfile(join(entry.path, '__init__.py')):
+                found.extend(self._scan(path))
+
+        return found
+
+    def _read(self) -> dict[str, dict[str, object]]:
+        '''
+            Reads manifest entries stored by a previous run.
+
+            :return: Manifest entry per test file (empty if missing or stale).
+            :exceptions: None.
+        '''
+        try:
+            with open(self.path, 'r', encoding='utf-8') as manifest_file:
+                manifest: dict[str, object] = load_json(manifest_file)
+
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(manifest, dict) or manifest.get('key') != [
+            MANIFEST_VERSION, self.start_dir, self.pattern, self.top_level_dir
+        ]:
+            return {}
+
+        return manifest.get('files', {})
+
+    def _stale(self, path: str, entry: dict[str, object] | None) -> bool:
+        '''
+            Checks if an entry does not match the files on disk.
+
+            :param path: Test file path relative to the top level directory.
+            :param entry: Stored manifest entry or None.
+            :return: True if the file or a file defining its test classes changed.
+            :exceptions: None.
+        '''
+        if entry is None or entry.get('mtime_ns') is None:
+            return True
+
+        for file_path, key in {path: [entry['mtime_ns'], entry['size']], **entry['depends']}.items():
+            try:
+                info = stat(join(self.top_level_dir, file_path))
+
+            except OSError:
+                return True
+
+            if [info.st_mtime_ns, info.st_size] != key:
+                return True
+
+        return False
+
+    def _load(self, name: str) -> tuple[TestSuite, bool]:
+        '''
+            Loads tests of one module as discovery does.
+
+            :param name: Module name.
+            :return: Loaded tests and True if the module was imported.
+            :exceptions: None.
+        '''
+        try:
+            module = import_module(name)
+
+        except SkipTest as exc:
+            return self.loader.suiteClass((ModuleTest(name, None, str(exc)),)), False
+
+        except Exception:
+            message: str = f'Failed to import test module: {name}\n{format_exc()}'
+            self.loader.errors.append(message)
+            return self.loader.suiteClass((ModuleTest(name, message),)), False
+
+        return self.loader.loadTestsFromModule(module, pattern=self.pattern), True
+
+    def _build(self, path: str) -> dict[str, object]:
+        '''
+            Builds the entry of a changed file (imports its module).
+
+            :param path: Test file path relative to the top level directory.
+            :return: Manifest entry (not reusable if the import failed).
+            :exceptions: None.
+        '''
+        info = stat(join(self.top_level_dir, path))
+        name: str = self._module_name(path)
+        tests, imported = self._load(name)
+        self._suites[path] = tests
+        depends: dict[str, list[int]] = {}
+        cases: list[TestCase] = list(iter_test_cases(tests))
+
+        for case in cases:
+            for cls in type(case).__mro__:
+                file_name: str | None = getattr(modules.get(cls.__module__), '__file__', None)
+
+                if file_name is None:
+                    continue
+
+                dep_path: str = relpath(file_name, self.top_level_dir)
+
+                if dep_path != path and not dep_path.startswith('..') and dep_path not in depends:
+                    dep_info = stat(file_name)
+                    depends[dep_path] = [dep_info.st_mtime_ns, dep_info.st_size]
+
+        return {
+            'module': name,
+            'mtime_ns': info.st_mtime_ns if imported else None,
+            'size': info.st_size,
+            'load_tests': imported and hasattr(modules[name], 'load_tests'),
+            'tests': [[module_of_test(case), case.id()] for case in cases],
+            'depends': depends,
+        }
+
+    def refresh(self) -> bool:
+        '''
+            Rebuilds entries of changed files (only those are imported).
+
+            :return: False if the manifest cannot mirror discovery (missing
+                     test directory, failed package or package load_tests).
+            :exceptions: None.
+        '''
+        if not isdir(join(self.top_level_dir, self.start_dir)) or not isfile(
+            join(self.top_level_dir, self.start_dir, '__init__.py')
+        ):
+            return False
+
+        if self.top_level_dir not in sys_path:
+            sys_path.insert(0, self.top_level_dir)
+
+        stored: dict[str, dict[str, object]] = self._read()
+        paths: list[str] = self._scan(self.start_dir)
+        rebuilt: bool = stored.keys() != set(paths)
+        self.entries = {}
+        self._suites = {}
+
+        for path in paths:
+            entry: dict[str, object] | None = stored.get(path)
+
+            if self._stale(path, entry):
+                entry = self._build(path)
+                rebuilt = True
+
+            self.entries[path] = entry
+
+            if path.endswith('__init__.py') and (entry['load_tests'] or entry['mtime_ns'] is None):
+                return False
+
+        if rebuilt:
+            self.save()
+
+        return True
+
+    def save(self) -> None:
+        '''
+            Stores manifest entries.
+
+            :exceptions: None.
+        '''
+        try:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+            with open(self.path, 'w', encoding='utf-8') as manifest_file:
+                dump({
+                    'key': [MANIFEST_VERSION, self.start_dir, self.pattern, self.top_level_dir],
+                    'files': self.entries
+                }, manifest_file)
+
+        except OSError as exc:
+            stderr.write(f'{exc}\n')
+
+    def modules(self) -> list[str]:
+        '''
+            Gets test module names (as split_by_module of discovered suite).
+
+            :return: Unique module names in discovery order.
+            :exceptions: None.
+        '''
+        names: dict[str, None] = {}
+
+        for entry in self.entries.values():
+            for module, _ in entry['tests']:
+                names.setdefault(module)
+
+        return list(names)
+
+    def groups(self, wants: TestWants | None = None) -> dict[str, list[str]]:
+        '''
+            Groups selected test ids by test module (as group_by_module).
+
+            :param wants: Selects tests by module and test id or None for all.
+            :return: Test ids (module name for import failures) per module.
+            :exceptions: None.
+        '''
+        groups: dict[str, list[str]] = {}
+
+        for entry in self.entries.values():
+            for module, test_id in entry['tests']:
+                if wants is None or wants(module, test_id):
+                    groups.setdefault(module, []).append(
+                        module if test_id.startswith(FAILED_TEST_PREFIX) else test_id
+                    )
+
+        return groups
+
+    def suite(self, wants: TestWants | None = None) -> TestSuite:
+        '''
+            Builds test suite with lazily loaded modules.
+
+            Modules without selected tests are neither imported nor run,
+            the others are imported when the runner reaches them.
+
+            :param wants: Selects tests by module and test id or None for all.
+            :return: Suite with the same tests as discovery (and filter_suite).
+            :exceptions: None.
+        '''
+        suites: list[TestSuite] = []
+
+        for path, entry in self.entries.items():
+            if wants is not None and not any(wants(*test) for test in entry['tests']):
+                continue
+
+            suites.append(LazyModuleSuite(
+                lambda path=path, entry=entry: self._module_suite(path, entry, wants)
+            ))
+
+        return TestSuite(suites)
+
+    def _module_suite(
+        self, path: str, entry: dict[str, object], wants: TestWants | None
+    ) -> TestSuite:
+        '''
+            Loads tests of one entry and keeps the selected ones.
+
+            :param path: Test file path relative to the top level directory.
+            :param entry: Manifest entry.
+            :param wants: Selects tests by module and test id or None for all.
+            :return: Loaded (and filtered) tests of the module.
+            :exceptions: None.
+        '''
+        tests: TestSuite | None = self._suites.pop(path, None)
+
+        if tests is None:
+            tests = self._load(entry['module'])[0]
+
+        if wants is None:
+            return tests
+
+        return TestSuite([
+            test for test in iter_test_cases(tests) if wants(module_of_test(test), test.id())
+        ])
@@ -0,0 +1,368 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_report.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines reporting stage building all report formats from one analysis.
+'''
+
+from __future__ import annotations
+
+from sys import stdout
+from io import StringIO
+from os.path import join
+from time import perf_counter
+from typing import Any
+from inspect import signature
+from tempfile import TemporaryDirectory
+from concurrent.futures import ThreadPoolExecutor
+
+from coverage import Coverage
+from coverage.files import relative_filename
+from coverage.plugin import FileReporter
+from coverage.results import Analysis, Numbers
+from coverage.types import TMorf
+
+try:
+    from coverage.report_core import get_analysis_to_report
+except ImportError:
+    get_analysis_to_report = None  # pylint: disable=invalid-name
+
+from ats_json import load_summaries
+from ats_summary import CoverageSummary
+from ats_timing import phase
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__ = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__ = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__ = '5.0.0'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+REPORT_WRITERS: tuple[str, ...] = ('term', 'json', 'xml', 'html')
+REPORT_BANNERS: dict[str, tuple[str, str]] = {
+    'term': ('Coverage Report', ''),
+    'json': ('JSON Report', '{pro_name}.json'),
+    'xml': ('XML Report', '{pro_name}.xml'),
+    'html': ('HTML Report', 'htmlcov'),
+}
+
+
+def _shared_analysis_supported() -> bool:
+    '''
+        Checks private coverage hooks used to share one analysis between reports.
+
+        Sharing was tested with coverage 7.16, other versions fall back to
+        the public report API if the hooks are missing or changed.
+
+        :return: True if get_analysis_to_report and Coverage._analyze(morf, file_reporter) exist.
+        :exceptions: None.
+    '''
+    if get_analysis_to_report is None:
+        return False
+
+    try:
+        parameters = signature(getattr(Coverage, '_analyze')).parameters
+
+    except (AttributeError, TypeError, ValueError):
+        return False
+
+    return list(parameters)[1:3] == ['morf', 'file_reporter']
+
+
+SHARED_ANALYSIS: bool = _shared_analysis_supported()
+
+
+class SharedAnalysisCoverage(Coverage):
+    '''
+        Defines class SharedAnalysisCoverage with precomputed analyses.
+        Coverage writer which reuses analyses instead of parsing sources again.
+
+        It defines:
+
+            :attributes:
+                | analyses - Analysis per source file name.
+            :methods:
+                | __init__ - Initials SharedAnalysisCoverage constructor.
+                | _analyze - Returns shared analysis, analyzing only unknown files.
+    '''
+
+    def __init__(self, analyses: dict[str, Analysis], **kwargs: Any) -> None:
+        '''
+            Initials SharedAnalysisCoverage constructor.
+
+            :param analyses: Analysis per source file name.
+            :param kwargs: Coverage constructor arguments.
+            :exceptions: None.
+        '''
+        super().__init__(**kwargs)
+        self.analyses: dict[str, Analysis] = analyses
+
+    def _analyze(self, morf: TMorf, file_reporter: FileReporter | None = None) -> Analysis:
+        '''
+            Returns shared analysis, analyzing only unknown files.
+
+            :param morf: Module or file name.
+            :param file_reporter: File reporter for the morf or None.
+            :return: Analysis of the file.
+            :exceptions: None.
+        '''
+        if file_reporter is not None and file_reporter.filename in self.analyses:
+            return self.analyses[file_reporter.filename]
+
+        return super()._analyze(morf, file_reporter)
+
+
+def analyze_once(cov: Coverage) -> dict[str, Analysis]:
+    '''
+        Analyzes every reported source file once.
+
+        :param cov: Coverage instance with saved data.
+        :return: Analysis per source file name.
+        :exceptions:
+            | NoDataError: There is no data to report.
+    '''
+    return {fr.filename: analysis for fr, analysis in get_analysis_to_report(cov, None)}
+
+
+def public_summary(cov: Coverage) -> dict[str, object]:
+    '''
+        Builds coverage summary through the public JSON report (no shared analysis).
+
+        :param cov: Coverage instance with saved data.
+        :return: Coverage data report in dict format (without line lists).
+        :exceptions:
+            | NoDataError: There is no data to report.
+    '''
+    with TemporaryDirectory() as temp_dir:
+        report_file: str = join(temp_dir, 'summary.json')
+        cov.json_report(outfile=report_file)
+
+        with open(report_file, 'r', encoding='utf-8') as loaded_file:
+            return load_summaries(loaded_file)
+
+
+def _make_summary(nums: Numbers, has_arcs: bool) -> dict[str, object]:
+    '''
+        Creates summary dict for numbers (same keys as the JSON report).
+
+        :param nums: Coverage numbers of a file or of the totals.
+        :param has_arcs: Include branch numbers.
+        :return: Summary dict.
+        :exceptions: None.
+    '''
+    summary: dict[str, object] = {
+        'covered_lines': nums.n_executed,
+        'num_statements': nums.n_statements,
+        'percent_covered': nums.pc_covered,
+        'percent_covered_display': nums.pc_covered_str,
+        'missing_lines': nums.n_missing,
+        'excluded_lines': nums.n_excluded,
+    }
+
+    if has_arcs:
+        summary.update({
+            'num_branches': nums.n_branches,
+            'num_partial_branches': nums.n_partial_branches,
+            'covered_branches': nums.n_executed_branches,
+            'missing_branches': nums.n_missing_branches,
+            'percent_branches_covered': nums.pc_branches,
+            'percent_branches_covered_display': nums.pc_branches_str,
+        })
+
+    return summary
+
+
+def summarize(cov: Coverage, analyses: dict[str, Analysis]) -> dict[str, object]:
+    '''
+        Builds coverage summary (files[*].summary and totals) from analyses.
+
+        :param cov: Coverage instance with saved data.
+        :param analyses: Analysis per source file name.
+        :return: Coverage data report in dict format (without line lists).
+        :exceptions: None.
+    '''
+    has_arcs: bool = cov.get_data().has_arcs()
+    total = Numbers(precision=cov.config.precision)
+    files: dict[str, object] = {}
+
+    for filename, analysis in analyses.items():
+        total += analysis.numbers
+        files[relative_filename(filename)] = {'summary': _make_summary(analysis.numbers, has_arcs)}
+
+    return {'files': files, 'totals': _make_summary(total, has_arcs)}
+
+
+def summary_model(cov: Coverage, analyses: dict[str, Analysis]) -> CoverageSummary:
+    '''
+        Builds summary model (table counts only) from analyses.
+
+        :param cov: Coverage instance with saved data.
+        :param analyses: Analysis per source file name.
+        :return: Summary model.
+        :exceptions: None.
+    '''
+    total = Numbers(precision=cov.config.precision)
+    model = CoverageSummary()
+
+    for filename, analysis in analyses.items():
+        nums: Numbers = analysis.numbers
+        total += nums
+        model.add(relative_filename(filename), nums.n_statements, nums.n_missing, nums.pc_covered_str)
+
+    model.total = (total.n_statements, total.n_missing, total.pc_covered_str)
+
+    return model
+
+
+def _write_report(
+    kind: str, pro_name: str, analyses: dict[str, Analysis], options: dict[str, Any]
+) -> str:
+    '''
+        Writes one report format from shared analyses (runs in worker thread).
+
+        :param kind: Report format (term, json, xml or html).
+        :param pro_name: Project name.
+        :param analyses: Analysis per source file name (unused without shared analysis).
+        :param options: Coverage constructor arguments.
+        :return: Terminal report text (empty for file reports).
+        :exceptions: None.
+    '''
+    with phase(f'report {kind}'):
+        writer: Coverage = (
+            SharedAnalysisCoverage(analyses, **options) if SHARED_ANALYSIS else Coverage(**options)
+        )
+        writer.load()
+        output = StringIO()
+
+        if kind == 'term':
+            writer.report(file=output)
+        elif kind == 'json':
+            writer.json_report(outfile=f'{pro_name}.json')
+        elif kind == 'xml':
+            writer.xml_report(outfile=f'{pro_name}.xml')
+        else:
+            writer.html_report(directory='htmlcov')
+
+    return output.getvalue()
+
+
+def parse_report_kinds(kinds: list[str]) -> list[str]:
+    '''
+        Validates report kinds given on command line or in config.
+
+        :param kinds: Report kinds (comma separated items are split).
+        :return: Validated report kinds.
+        :exceptions:
+            | ValueError: Unknown report kind.
+    '''
+    parsed: list[str] = [
+        kind.strip() for item in kinds for kind in item.split(',') if kind.strip()
+    ]
+
+    for kind in parsed:
+        if kind not in REPORT_WRITERS:
+            raise ValueError(f'Unknown report {kind}, expected one of {", ".join(REPORT_WRITERS)}')
+
+    return parsed
+
+
+def plan_reports(cli: list[str] | None, config: list[str] | None) -> dict[str, list[str]]:
+    '''
+        Plans which report artifacts are built and who requested them.
+
+        Docs, history, batch runs and the result cache take the summary in
+        memory and refresh reads the saved summary, so no later step needs
+        a report artifact and only the command line or config request them.
+
+        :param cli: Report kinds requested on command line (None if not given).
+        :param config: Report kinds requested in config (None if not set).
+        :return: Requesters per report kind to build (unrequested are left out).
+        :exceptions:
+            | ValueError: Unknown report kind.
+    '''
+    plan: dict[str, list[str]] = {}
+
+    if cli is not None:
+        requested, requester = parse_report_kinds(cli), 'cli'
+    elif config is not None:
+        requested, requester = parse_report_kinds(config), 'config'
+    else:
+        requested, requester = ['term'], 'default'
+
+    for kind in requested:
+        plan.setdefault(kind, []).append(requester)
+
+    return {kind: plan[kind] for kind in REPORT_WRITERS if kind in plan}
+
+
+def build_reports(
+    cov: Coverage, pro_name: str, options: dict[str, Any],
+    plan: dict[str, list[str]] | None = None, outputs: dict[str, str] | None = None
+) -> dict[str, object]:
+    '''
+        Builds planned report artifacts (all formats by default) from one analysis.
+
+        :param cov: Coverage instance with saved data.
+        :param pro_name: Project name.
+        :param options: Coverage constructor arguments for the writers.
+        :param plan: Requesters per report kind to build or None for all kinds.
+        :param outputs: Filled with terminal output per built kind (or None).
+        :return: Coverage summary built from the same analysis.
+        :exceptions:
+            | NoDataError: There is no data to report.
+    '''
+    if plan is None:
+        plan = {kind: ['api'] for kind in REPORT_WRITERS}
+
+    start: float = perf_counter()
+    skipped: list[str] = [kind for kind in REPORT_WRITERS if kind not in plan]
+
+    if outputs is None:
+        outputs = {}
+    with phase('analysis'):
+        analyses: dict[str, Analysis] = analyze_once(cov) if SHARED_ANALYSIS else {}
+
+    analyzed: float = perf_counter()
+
+    if plan:
+        with ThreadPoolExecutor(max_workers=len(plan)) as pool:
+            futures = {
+                kind: pool.submit(_write_report, kind, pro_name, analyses, options)
+                for kind in plan
+            }
+            outputs.update({kind: future.result() for kind, future in futures.items()})
+
+    for kind, output in outputs.items():
+        title, target = REPORT_BANNERS[kind]
+        stdout.write(f'\n--- {title} ---\n')
+        stdout.write(output)
+
+        if target:
+            stdout.write(f'\n--- {title} saved to {target.format(pro_name=pro_name)} ---\n')
+
+    built: str = ', '.join(f'{kind} ({", ".join(plan[kind])})' for kind in plan) or 'none'
+    stdout.write(f'\n--- Artifacts built: {built}; skipped: {", ".join(skipped) or "none"} ---\n')
+    shared: str = (
+        f'{len(analyses)} files analyzed once in {analyzed - start:.3f}s' if SHARED_ANALYSIS
+        else 'shared analysis unsupported by this coverage version'
+    )
+    stdout.write(f'\n--- Reports built in {perf_counter() - start:.3f}s ({shared}) ---\n')
+
+    with phase('summary'):
+        return summarize(cov, analyses) if SHARED_ANALYSIS else public_summary(cov)
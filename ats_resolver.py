@@ -0,0 +1,160 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_resolver.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines package root resolver for report file module paths.
+'''
+
+from __future__ import annotations
+
+from os import sep
+from os.path import basename, dirname, exists, islink, join, realpath
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__ = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__ = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__ = '5.0.0'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+class PackageRootResolver:
+    '''
+        Defines class PackageRootResolver with cached package roots.
+        Resolves root package and display module path of report files.
+
+        The root package is the highest directory with __init__.py above a
+        file. Roots are cached per directory, so every directory is checked
+        at most once and directories below a known root are not checked.
+
+        It defines:
+
+            :attributes:
+                | roots - Root package per real directory path (None if none).
+                | real_dirs - Real path per directory name.
+                | modules - Display module path per report file name.
+            :methods:
+                | __init__ - Initials PackageRootResolver constructor.
+                | real_dir - Resolves directory path once.
+                | root_of - Finds root package of real directory.
+                | module_path - Gets display module path of report file.
+    '''
+
+    def __init__(self) -> None:
+        '''
+            Initials PackageRootResolver constructor.
+
+            :exceptions: None.
+        '''
+        self.roots: dict[str, str | None] = {}
+        self.real_dirs: dict[str, str] = {}
+        self.modules: dict[str, str] = {}
+
+    def real_dir(self, directory: str) -> str:
+        '''
+            Resolves directory path once.
+
+            :param directory: Directory path.
+            :return: Real directory path.
+            :exceptions:
+                | TypeError: The parameter directory type validation failed.
+        '''
+        if directory not in self.real_dirs:
+            self.real_dirs[directory] = realpath(directory)
+
+        return self.real_dirs[directory]
+
+    def root_of(self, directory: str) -> str | None:
+        '''
+            Finds root package of real directory.
+
+            :param directory: Real directory path.
+            :return: Root package path or None.
+            :exceptions: None.
+        '''
+        pending: list[str] = []
+        path: str = directory
+
+        while path not in self.roots:
+            parent: str = dirname(path)
+
+            if parent == path:
+                self.roots[path] = None
+                break
+
+            pending.append(path)
+            path = parent
+
+        root: str | None = self.roots[path]
+
+        for path in reversed(pending):
+            if root is None and exists(join(path, '__init__.py')):
+                root = path
+
+            self.roots[path] = root
+
+        return self.roots[directory]
+
+    def module_path(self, name: str) -> str:
+        '''
+            Gets display module path of report file.
+
+            :param name: Report file name.
+            :return: Module path from the root package (empty if none).
+            :exceptions:
+                | TypeError: The parameter name type validation failed.
+        '''
+        if name in self.modules:
+            return self.modules[name]
+
+        real_name: str = (
+            realpath(name) if islink(name)
+            else join(self.real_dir(dirname(name) or '.'), basename(name))
+        )
+        root: str | None = self.root_of(dirname(real_name))
+        module: str = ''
+
+        if root:
+            module = f'{basename(root)}/{real_name[len(root):].lstrip(sep)}'
+
+        self.modules[name] = module
+
+        return module
+
+
+def find_root_package(module_path: str) -> Path | None:
+    '''
+        Finds root package for project structure.
+
+        :param module_path: Absolute path for project package.
+        :return: Root package path.
+        :exceptions:
+            | TypeError:  The parameter module_path type validation failed.
+            | ValueError: The parameter module_path format validation failed.
+    '''
+    # pylint: disable=import-outside-toplevel
+    from pathlib import Path
+
+    root: str | None = PackageRootResolver().root_of(realpath(module_path))
+
+    return Path(root) if root else None
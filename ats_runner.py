@@ -0,0 +1,413 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_runner.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines helper functions for splitting and running tests in parallel.
+'''
+
+from __future__ import annotations
+
+from sys import path as sys_path, stdout, stderr
+from io import StringIO
+from time import perf_counter, process_time
+from os.path import abspath
+from functools import partial
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import IO, Any
+from unittest import TestCase, TestLoader, TestSuite, TextTestResult, TextTestRunner
+
+from coverage import Coverage
+
+from ats_core import core_in_use
+from ats_timing import DURATIONS
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__ = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__ = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__ = '5.0.0'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+FAILED_TEST_PREFIX: str = 'unittest.loader._FailedTest.'
+
+
+class TimedTestResult(TextTestResult):
+    '''
+        Defines class TimedTestResult with per-test durations.
+        Records wall and CPU time of each test from startTest to stopTest
+        (setUp and tearDown included) in the DURATIONS log.
+
+        It defines:
+
+            :attributes:
+                | _started - Wall and CPU clock when the current test started.
+            :methods:
+                | __init__ - Initials TimedTestResult constructor.
+                | startTest - Starts clocks of the test.
+                | stopTest - Records duration of the test.
+    '''
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        '''
+            Initials TimedTestResult constructor.
+
+            :exceptions: None.
+        '''
+        super().__init__(*args, **kwargs)
+        self._started: tuple[float, float] = (perf_counter(), process_time())
+
+    def startTest(self, test: TestCase) -> None:
+        '''
+            Starts clocks of the test.
+
+            :param test: Test case about to run.
+            :exceptions: None.
+        '''
+        super().startTest(test)
+        self._started = (perf_counter(), process_time())
+
+    def stopTest(self, test: TestCase) -> None:
+        '''
+            Records duration of the test.
+
+            :param test: Test case which finished.
+            :exceptions: None.
+        '''
+        wall: float = perf_counter() - self._started[0]
+        cpu: float = process_time() - self._started[1]
+        DURATIONS.record(test.id(), module_of_test(test), wall, cpu)
+        super().stopTest(test)
+
+
+class ContextTestResult(TimedTestResult):
+    '''
+        Defines class ContextTestResult with per-test coverage contexts.
+        Switches the coverage dynamic context to the test id for each test.
+
+        It defines:
+
+            :attributes:
+                | coverage - Started coverage instance.
+            :methods:
+                | __init__ - Initials ContextTestResult constructor.
+                | startTest - Switches coverage context to the test id.
+                | stopTest - Switches coverage context back to the import context.
+    '''
+
+    def __init__(self, coverage: Coverage, *args: Any, **kwargs: Any) -> None:
+        '''
+            Initials ContextTestResult constructor.
+
+            :param coverage: Started coverage instance.
+            :exceptions: None.
+        '''
+        super().__init__(*args, **kwargs)
+        self.coverage: Coverage = coverage
+
+    def startTest(self, test: TestCase) -> None:
+        '''
+            Switches coverage context to the test id.
+
+            :param test: Test case about to run.
+            :exceptions: None.
+        '''
+        self.coverage.switch_context(test.id())
+        super().startTest(test)
+
+    def stopTest(self, test: TestCase) -> None:
+        '''
+            Switches coverage context back to the import context.
+
+            :param test: Test case which finished.
+            :exceptions: None.
+        '''
+        super().stopTest(test)
+        self.coverage.switch_context('')
+
+
+def make_runner(stream: IO[str] | None = None, cov: Coverage | None = None) -> TextTestRunner:
+    '''
+        Creates test runner timing each test, recording per-test contexts when coverage is given.
+
+        :param stream: Output stream (None for stderr).
+        :param cov: Started coverage instance or None.
+        :return: Text test runner.
+        :exceptions: None.
+    '''
+    if cov is None:
+        return TextTestRunner(stream=stream, verbosity=2, resultclass=TimedTestResult)
+
+    return TextTestRunner(stream=stream, verbosity=2, resultclass=partial(ContextTestResult, cov))
+
+
+def iter_test_cases(suite: TestSuite | TestCase) -> Iterator[TestCase]:
+    '''
+        Flattens nested test suites into test cases.
+
+        :param suite: Test suite or test case.
+        :return: Iterator over test cases in suite order.
+        :exceptions: None.
+    '''
+    if isinstance(suite, TestSuite):
+        for test in suite:
+            yield from iter_test_cases(test)
+    else:
+        yield suite
+
+
+def module_of_test(test: TestCase) -> str:
+    '''
+        Gets the name of the module which defines the test case.
+
+        :param test: Test case.
+        :return: Module name (import failures map to the failed module).
+        :exceptions: None.
+    '''
+    test_id: str = test.id()
+
+    if test_id.startswith(FAILED_TEST_PREFIX):
+        return test_id[len(FAILED_TEST_PREFIX):]
+
+    return type(test).__module__
+
+
+def split_by_module(suite: TestSuite) -> list[str]:
+    '''
+        Splits discovered test suite into test module names.
+
+        :param suite: Discovered test suite.
+        :return: Unique module names in discovery order.
+        :exceptions: None.
+    '''
+    names: dict[str, None] = {}
+
+    for test in iter_test_cases(suite):
+        names.setdefault(module_of_test(test))
+
+    return list(names)
+
+
+def shard_modules(names: list[str], index: int, total: int) -> list[str]:
+    '''
+        Selects test modules of one shard (round robin over sorted names).
+
+        :param names: Test module names.
+        :param index: Shard number (1 based).
+        :param total: Number of shards.
+        :return: Test module names run by the shard.
+        :exceptions: None.
+    '''
+    return sorted(names)[index - 1::total]
+
+
+def select_shard(names: list[str], shard: tuple[int, int]) -> set[str]:
+    '''
+        Selects test modules of one shard and reports their number.
+
+        :param names: Test module names.
+        :param shard: Shard number (1 based) and number of shards.
+        :return: Test module names run by the shard.
+        :exceptions: None.
+    '''
+    selected: set[str] = set(shard_modules(names, *shard))
+    stdout.write(f'\n--- Shard {shard[0]}/{shard[1]}: {len(selected)} test modules ---\n')
+
+    return selected
+
+
+def group_by_module(suite: TestSuite) -> dict[str, list[str]]:
+    '''
+        Groups loadable test names of a suite by test module.
+
+        :param suite: Test suite.
+        :return: Test ids (module name for import failures) per module.
+        :exceptions: None.
+    '''
+    groups: dict[str, list[str]] = {}
+
+    for test in iter_test_cases(suite):
+        module: str = module_of_test(test)
+        test_id: str = test.id()
+        groups.setdefault(module, []).append(
+            module if test_id.startswith(FAILED_TEST_PREFIX) else test_id
+        )
+
+    return groups
+
+
+def filter_suite(suite: TestSuite, wants: Callable[[TestCase], bool]) -> TestSuite:
+    '''
+        Keeps only the selected test cases of a suite.
+
+        :param suite: Discovered test suite.
+        :param wants: Predicate selecting test cases.
+        :return: Flat test suite with selected test cases in suite order.
+        :exceptions: None.
+    '''
+    return TestSuite([test for test in iter_test_cases(suite) if wants(test)])
+
+
+def discover_shard(tests: TestSuite, shard: tuple[int, int]) -> TestSuite:
+    '''
+        Keeps test modules of one shard in discovered suite.
+
+        :param tests: Discovered test suite.
+        :param shard: Shard number (1 based) and number of shards.
+        :return: Flat suite with tests of the shard modules.
+        :exceptions: None.
+    '''
+    selected: set[str] = select_shard(split_by_module(tests), shard)
+
+    return filter_suite(tests, lambda test: module_of_test(test) in selected)
+
+
+def _run_modules(
+    pro_name: str, names: list[str], top_level_dir: str, contexts: bool,
+    core: str | None = None
+) -> tuple[str, str, int, int, float, str, list[tuple[str, str, float, float]]]:
+    '''
+        Runs test modules under a separate coverage data file (worker).
+
+        :param pro_name: Project name.
+        :param names: Test modules (or test ids) to run in this worker.
+        :param top_level_dir: Absolute top level directory for imports.
+        :param contexts: Record per-test coverage contexts.
+        :param core: Coverage core to use or None for the default.
+        :return: Tuple containing data file, test output, tests run, problems,
+                 traced seconds, core used and test durations.
+        :exceptions: None.
+    '''
+    if top_level_dir not in sys_path:
+        sys_path.insert(0, top_level_dir)
+
+    DURATIONS.reset()
+    cov = Coverage(
+        source=[pro_name], config_file='.coveragerc',
+        data_file=f'.coverage.{pro_name}', data_suffix=True
+    )
+
+    if core is not None:
+        cov.set_option('run:core', core)
+
+    stream = StringIO()
+    cov.start()
+    start: float = perf_counter()
+    tests: TestSuite = TestLoader().loadTestsFromNames(names)
+    result = make_runner(stream, cov if contexts else None).run(tests)
+    cov.stop()
+    traced: float = perf_counter() - start
+    cov.save()
+
+    return (
+        cov.get_data().data_filename(), stream.getvalue(),
+        result.testsRun, len(result.failures) + len(result.errors),
+        traced, core_in_use(cov), DURATIONS.tests
+    )
+
+
+def _time_modules(names: list[str] | None, top_level_dir: str) -> float:
+    '''
+        Runs tests without coverage and measures them (worker).
+
+        :param names: Test modules (or test ids) to run or None to discover all tests.
+        :param top_level_dir: Absolute top level directory for imports.
+        :return: Untraced seconds for loading and running the tests.
+        :exceptions: None.
+    '''
+    if top_level_dir not in sys_path:
+        sys_path.insert(0, top_level_dir)
+
+    start: float = perf_counter()
+
+    if names is None:
+        tests: TestSuite = TestLoader().discover(
+            'tests', pattern='*_test.py', top_level_dir=top_level_dir
+        )
+    else:
+        tests = TestLoader().loadTestsFromNames(names)
+
+    make_runner(StringIO()).run(tests)
+
+    return perf_counter() - start
+
+
+def time_untraced(names: list[str] | None = None) -> float:
+    '''
+        Measures tests without coverage in a fresh process (overhead baseline).
+
+        :param names: Test modules (or test ids) to run or None to discover all tests.
+        :return: Untraced seconds for loading and running the tests.
+        :exceptions: None.
+    '''
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as pool:
+        return pool.submit(_time_modules, names, abspath('.')).result()
+
+
+def run_parallel(
+    pro_name: str, groups: list[list[str]], jobs: int, contexts: bool = False,
+    core: str | None = None
+) -> tuple[list[str], float, str, int]:
+    '''
+        Runs test groups in a process pool, one coverage data file per worker.
+
+        Test durations recorded by the workers are added to DURATIONS.
+
+        :param pro_name: Project name.
+        :param groups: Loadable test names grouped by test module.
+        :param jobs: Number of worker processes.
+        :param contexts: Record per-test coverage contexts.
+        :param core: Coverage core to use or None for the default.
+        :return: Tuple containing paths of the worker coverage data files,
+                 traced seconds summed over workers, cores used and
+                 number of failed tests.
+        :exceptions: None.
+    '''
+    buckets: list[list[str]] = [
+        [name for group in groups[i::jobs] for name in group] for i in range(jobs)
+    ]
+    buckets = [bucket for bucket in buckets if bucket]
+    data_paths: list[str] = []
+    traced: float = 0.0
+    cores: set[str] = set()
+    failed: int = 0
+
+    if not buckets:
+        return data_paths, traced, '', failed
+
+    top_level_dir: str = abspath('.')
+
+    with ProcessPoolExecutor(max_workers=len(buckets), mp_context=get_context('spawn')) as pool:
+        futures = [
+            pool.submit(_run_modules, pro_name, bucket, top_level_dir, contexts, core)
+            for bucket in buckets
+        ]
+
+        for future in futures:
+            data_path, output, tests_run, problems, seconds, used, durations = future.result()
+            stderr.write(output)
+            DURATIONS.extend(durations)
+            stdout.write(f'\n--- Worker ran {tests_run} tests, {problems} failed ---\n')
+            data_paths.append(data_path)
+            traced += seconds
+            cores.add(used)
+            failed += problems
+
+    return data_paths, traced, ', '.join(sorted(cores)), failed
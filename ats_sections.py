@@ -0,0 +1,151 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_sections.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines markdown and reStructuredText section scanners.
+'''
+
+from __future__ import annotations
+
+from re import Pattern, compile as re_compile
+from collections.abc import Callable
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__ = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__ = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__ = '5.0.0'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+MD_HEADING: Pattern[str] = re_compile(r' {0,3}#{1,6}\s+(.*?)\s*#*\s*$')
+MD_FENCE: Pattern[str] = re_compile(r' {0,3}(?:```|~~~)')
+RST_ADORNMENT: Pattern[str] = re_compile(r'([!-/:-@\[-`{-~])\1{2,}\s*$')
+RST_CODE_BLOCK: Pattern[str] = re_compile(r'\.\.\s+code-block::')
+SECTION_TITLE: Pattern[str] = re_compile(r'[\W_]*(.*?)\s*$')
+
+MarkdownBlock = tuple[Callable[[], list[str]], list[str]]
+RstBlock = Callable[[], list[str]]
+
+
+def _section_title(text: str) -> str:
+    '''
+        Gets section name from heading text (leading emoji and markup dropped).
+
+        :param text: Heading title or caption line.
+        :return: Section name.
+        :exceptions: None.
+    '''
+    return SECTION_TITLE.match(text).group(1)
+
+
+def replace_markdown_sections(lines: list[str], blocks: dict[str, MarkdownBlock]) -> list[str]:
+    '''
+        Replaces details blocks of markdown sections in one scan.
+
+        A section starts at an ATX heading (any level) whose title names a
+        block and ends at the next heading; headings in fenced code are
+        ignored. Content between </summary> and </details> of the section
+        is replaced by the rendered block.
+
+        :param lines: Lines of the document.
+        :param blocks: Renderer of opening lines and closing lines per section name.
+        :return: Updated lines of the document.
+        :exceptions: None.
+    '''
+    new_lines: list[str] = []
+    block: MarkdownBlock | None = None
+    replacing: bool = False
+    fenced: bool = False
+
+    for line in lines:
+        if MD_FENCE.match(line):
+            fenced = not fenced
+        elif not fenced and (heading := MD_HEADING.match(line)):
+            block = blocks.get(_section_title(heading.group(1)))
+            replacing = False
+            new_lines.append(line)
+            continue
+
+        if block is not None:
+            if replacing:
+                if '</details>' in line:
+                    new_lines.extend(block[1])
+                    new_lines.append(line)
+                    block, replacing = None, False
+
+                continue
+
+            if '</summary>' in line:
+                new_lines.append(line)
+                new_lines.extend(block[0]())
+                replacing = True
+                continue
+
+        new_lines.append(line)
+
+    return new_lines
+
+
+def replace_rst_sections(lines: list[str], blocks: dict[str, RstBlock]) -> list[str]:
+    '''
+        Replaces code-block bodies of reStructuredText sections in one scan.
+
+        A section starts at a heading (title with an underline) or a caption
+        line (plain or comment) naming a block and ends at the next heading.
+        The body of its first code-block directive is replaced by the
+        rendered block.
+
+        :param lines: Lines of the document.
+        :param blocks: Renderer of code-block body per section name.
+        :return: Updated lines of the document.
+        :exceptions: None.
+    '''
+    new_lines: list[str] = []
+    block: RstBlock | None = None
+    replacing: bool = False
+    last: int = len(lines) - 1
+
+    for index, line in enumerate(lines):
+        indented: bool = not line.strip() or line[0] in ' \t'
+
+        if replacing:
+            if indented:
+                continue
+
+            block, replacing = None, False
+
+        if not indented:
+            named: RstBlock | None = blocks.get(_section_title(line))
+            heading: bool = (
+                index < last and RST_ADORNMENT.match(lines[index + 1]) is not None
+                and RST_ADORNMENT.match(line) is None
+            )
+
+            if heading or named is not None:
+                block = named if heading else named or block
+
+            elif block is not None and RST_CODE_BLOCK.match(line):
+                new_lines.append(line)
+                new_lines.extend(block())
+                replacing = True
+                continue
+
+        new_lines.append(line)
+
+    return new_lines
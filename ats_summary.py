@@ -0,0 +1,171 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_summary.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines compact coverage summary model used to render tables.
+'''
+
+from __future__ import annotations
+
+from array import array
+from sys import intern
+from collections.abc import Iterator
+
+from ats_config import STATE_DIR
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__ = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__ = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__ = '5.0.0'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+STATEMENTS_KEY: str = 'num_statements'
+MISSING_KEY: str = 'missing_lines'
+COVERED_KEY: str = 'percent_covered_display'
+CACHED_KEY: str = 'cached'
+
+
+def summary_file(pro_name: str) -> str:
+    '''
+        Gets saved summary file name (written with every docs update, kept in the state directory).
+
+        :param pro_name: Project name.
+        :return: Summary file name.
+        :exceptions: None.
+    '''
+    return f'{STATE_DIR}/{pro_name}.summary.json'
+
+
+class CoverageSummary:
+    '''
+        Defines class CoverageSummary with per-file counts in parallel arrays.
+        Keeps only what the coverage tables show (statements, missing and
+        covered percent) instead of the nested report dict.
+
+        File names and percent strings are interned, counts are kept in
+        machine integer arrays, so a file costs about 80 bytes against
+        about 600 bytes in the report dict (tests/ats_benchmark.py summary).
+
+        It defines:
+
+            :attributes:
+                | names - Interned report file name per file.
+                | statements - Number of statements per file.
+                | missing - Number of missing lines per file.
+                | covered - Interned covered percent (display string) per file.
+                | total - Statements, missing and covered percent of the totals.
+                | cached - Restored from the result cache (not a new measurement).
+            :methods:
+                | __init__ - Initials CoverageSummary constructor.
+                | __len__ - Gets number of files.
+                | __iter__ - Iterates files as (name, statements, missing, covered).
+                | add - Appends summary of one file.
+                | from_report - Builds summary model from report dict.
+                | to_report - Builds report dict with summaries of the model.
+    '''
+
+    __slots__ = ('names', 'statements', 'missing', 'covered', 'total', 'cached')
+
+    def __init__(self) -> None:
+        '''
+            Initials CoverageSummary constructor.
+
+            :exceptions: None.
+        '''
+        self.names: list[str] = []
+        self.statements: array[int] = array('q')
+        self.missing: array[int] = array('q')
+        self.covered: list[str] = []
+        self.total: tuple[int, int, str] = (0, 0, '0')
+        self.cached: bool = False
+
+    def __len__(self) -> int:
+        '''
+            Gets number of files.
+
+            :return: Number of files in the summary.
+            :exceptions: None.
+        '''
+        return len(self.names)
+
+    def __iter__(self) -> Iterator[tuple[str, int, int, str]]:
+        '''
+            Iterates files as (name, statements, missing, covered).
+
+            :return: Iterator of file rows in report order.
+            :exceptions: None.
+        '''
+        return zip(self.names, self.statements, self.missing, self.covered)
+
+    def add(self, name: str, statements: int, missing: int, covered: str) -> None:
+        '''
+            Appends summary of one file.
+
+            :param name: Report file name.
+            :param statements: Number of statements.
+            :param missing: Number of missing lines.
+            :param covered: Covered percent (display string).
+            :exceptions: None.
+        '''
+        self.names.append(intern(name))
+        self.statements.append(statements)
+        self.missing.append(missing)
+        self.covered.append(intern(covered))
+
+    @classmethod
+    def from_report(cls, report: dict[str, object]) -> CoverageSummary:
+        '''
+            Builds summary model from report dict.
+
+            :param report: Coverage data report in dict format (files[*].summary, totals
+                           and cached flag of result cache hits).
+            :return: Summary model.
+            :exceptions:
+                | KeyError: The coverage report has no summary or totals.
+        '''
+        model = cls()
+
+        for name, file_data in report['files'].items():
+            summary: dict[str, object] = file_data['summary']
+            model.add(name, summary[STATEMENTS_KEY], summary[MISSING_KEY], summary[COVERED_KEY])
+
+        totals: dict[str, object] = report['totals']
+        model.total = (totals[STATEMENTS_KEY], totals[MISSING_KEY], intern(totals[COVERED_KEY]))
+        model.cached = bool(report.get(CACHED_KEY))
+
+        return model
+
+    def to_report(self) -> dict[str, object]:
+        '''
+            Builds report dict with summaries of the model (read back by from_report).
+
+            :return: Coverage data report in dict format (files[*].summary and totals).
+            :exceptions: None.
+        '''
+        files: dict[str, object] = {
+            name: {'summary': {STATEMENTS_KEY: statements, MISSING_KEY: missing, COVERED_KEY: covered}}
+            for name, statements, missing, covered in self
+        }
+        statements, missing, covered = self.total
+
+        return {
+            'files': files,
+            'totals': {STATEMENTS_KEY: statements, MISSING_KEY: missing, COVERED_KEY: covered}
+        }
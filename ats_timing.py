@@ -0,0 +1,421 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_timing.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines phase timing (wall, CPU, process peak RSS) with trace-event export
+    and per-test durations.
+'''
+
+from __future__ import annotations
+
+from sys import platform, stderr
+from os import getpid, makedirs
+from os.path import dirname
+from json import dump, load
+from time import perf_counter, process_time
+from threading import Lock, get_ident
+from contextlib import contextmanager
+from collections.abc import Iterator
+from typing import IO, TYPE_CHECKING
+
+try:
+    from resource import getrusage, RUSAGE_SELF
+except ImportError:
+    getrusage = None
+
+if TYPE_CHECKING:
+    from coverage import CoverageData
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__ = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__ = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__ = '5.0.0'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+def peak_rss_kb() -> int:
+    '''
+        Gets peak resident set size of the process.
+
+        :return: Peak RSS in KiB (0 if not available on the platform).
+        :exceptions: None.
+    '''
+    if getrusage is None:
+        return 0
+
+    peak: int = getrusage(RUSAGE_SELF).ru_maxrss
+
+    return peak // 1024 if platform == 'darwin' else peak
+
+
+class PhaseTimer:
+    '''
+        Defines class PhaseTimer with recorded run phases.
+        Records wall time, CPU time and process peak RSS of named phases.
+
+        It defines:
+
+            :attributes:
+                | origin - Start of the timeline (perf_counter seconds).
+                | phases - Recorded (name, start, wall, cpu, process peak rss, thread) tuples.
+            :methods:
+                | __init__ - Initials PhaseTimer constructor.
+                | reset - Drops recorded phases and restarts the timeline.
+                | phase - Context manager recording one phase.
+                | merge - Adds phases recorded by another process.
+                | write_summary - Writes timing table of recorded phases.
+                | write_trace - Writes recorded phases as Chrome trace events.
+    '''
+
+    def __init__(self) -> None:
+        '''
+            Initials PhaseTimer constructor.
+
+            :exceptions: None.
+        '''
+        self._lock = Lock()
+        self.origin: float = perf_counter()
+        self.phases: list[tuple[str, float, float, float, int, int]] = []
+
+    def reset(self) -> None:
+        '''
+            Drops recorded phases and restarts the timeline.
+
+            :exceptions: None.
+        '''
+        with self._lock:
+            self.origin = perf_counter()
+            self.phases = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        '''
+            Context manager recording one phase.
+
+            CPU time is process wide, so phases running in parallel
+            threads include each other's CPU time. Peak RSS is the high
+            water mark of the whole process when the phase ends, not the
+            memory used by the phase.
+
+            :param name: Phase name.
+            :exceptions: None.
+        '''
+        start: float = perf_counter()
+        cpu: float = process_time()
+
+        try:
+            yield
+
+        finally:
+            record = (
+                name, start - self.origin, perf_counter() - start,
+                process_time() - cpu, peak_rss_kb(), get_ident()
+            )
+
+            with self._lock:
+                self.phases.append(record)
+
+    def merge(
+        self, phases: list[tuple[str, float, float, float, int, int]], origin: float, prefix: str = ''
+    ) -> None:
+        '''
+            Adds phases recorded by another process.
+
+            perf_counter is a system wide monotonic clock, so phases are
+            moved onto this timeline by the difference of the origins.
+
+            :param phases: Phases recorded by the other process timer.
+            :param origin: Origin of the other process timer.
+            :param prefix: Prefix added to the phase names.
+            :exceptions: None.
+        '''
+        shift: float = origin - self.origin
+
+        with self._lock:
+            self.phases.extend(
+                (f'{prefix}{name}', start + shift, wall, cpu, rss, tid)
+                for name, start, wall, cpu, rss, tid in phases
+            )
+
+    def write_summary(self, stream: IO[str]) -> None:
+        '''
+            Writes timing table of recorded phases.
+
+            :param stream: Output stream.
+            :exceptions: None.
+        '''
+        if not self.phases:
+            return
+
+        width: int = max(len(name) for name, *_ in self.phases)
+        stream.write('\n--- Phase timing ---\n')
+        stream.write(f'{"Phase":<{width}}  {"Wall":>9}  {"CPU":>9}  {"Process peak RSS":>16}\n')
+
+        for name, _, wall, cpu, rss, _ in sorted(self.phases, key=lambda record: record[1]):
+            stream.write(f'{name:<{width}}  {wall:>8.3f}s  {cpu:>8.3f}s  {rss / 1024:>13.1f}MiB\n')
+
+    def write_trace(self, path: str) -> None:
+        '''
+            Writes recorded phases as Chrome trace events (about:tracing, Perfetto).
+
+            :param path: Trace file path.
+            :exceptions:
+                | OSError: The trace file cannot be written.
+        '''
+        pid: int = getpid()
+        events: list[dict[str, object]] = [
+            {
+                'name': name, 'cat': 'ats_coverage', 'ph': 'X', 'pid': pid, 'tid': tid,
+                'ts': round(start * 1e6), 'dur': round(wall * 1e6),
+                'args': {'cpu_ms': round(cpu * 1e3, 3), 'process_peak_rss_kb': rss},
+            }
+            for name, start, wall, cpu, rss, tid in self.phases
+        ]
+
+        with open(path, 'w', encoding='utf-8') as trace_file:
+            dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, trace_file)
+
+
+class DurationLog:
+    '''
+        Defines class DurationLog with recorded test durations.
+        Records wall time and CPU time per test (setUp and tearDown
+        included) and sums them per test module.
+
+        It defines:
+
+            :attributes:
+                | tests - Recorded (test id, module, wall, cpu) tuples in run order.
+            :methods:
+                | __init__ - Initials DurationLog constructor.
+                | reset - Drops recorded durations.
+                | record - Records duration of one test.
+                | extend - Adds durations recorded by another process.
+                | modules - Sums durations per test module.
+                | module_lines - Counts measured lines executed by tests of each module.
+                | write_slowest - Writes table of the slowest tests.
+                | write_modules - Writes table of test time per module.
+                | write_json - Writes durations per test and module as JSON.
+                | read_json - Replaces durations with those of a JSON durations file.
+    '''
+
+    def __init__(self) -> None:
+        '''
+            Initials DurationLog constructor.
+
+            :exceptions: None.
+        '''
+        self._lock = Lock()
+        self.tests: list[tuple[str, str, float, float]] = []
+
+    def reset(self) -> None:
+        '''
+            Drops recorded durations.
+
+            :exceptions: None.
+        '''
+        with self._lock:
+            self.tests = []
+
+    def record(self, test_id: str, module: str, wall: float, cpu: float) -> None:
+        '''
+            Records duration of one test.
+
+            :param test_id: Test id.
+            :param module: Module defining the test case.
+            :param wall: Wall seconds.
+            :param cpu: CPU seconds.
+            :exceptions: None.
+        '''
+        with self._lock:
+            self.tests.append((test_id, module, wall, cpu))
+
+    def extend(self, tests: list[tuple[str, str, float, float]]) -> None:
+        '''
+            Adds durations recorded by another process.
+
+            :param tests: Durations recorded by the other process log.
+            :exceptions: None.
+        '''
+        with self._lock:
+            self.tests.extend(tests)
+
+    def modules(self) -> dict[str, tuple[int, float, float]]:
+        '''
+            Sums durations per test module.
+
+            :return: Number of tests, wall and CPU seconds per module (slowest first).
+            :exceptions: None.
+        '''
+        totals: dict[str, tuple[int, float, float]] = {}
+
+        for _, module, wall, cpu in self.tests:
+            count, module_wall, module_cpu = totals.get(module, (0, 0.0, 0.0))
+            totals[module] = (count + 1, module_wall + wall, module_cpu + cpu)
+
+        return dict(sorted(totals.items(), key=lambda item: (-item[1][1], item[0])))
+
+    def module_lines(self, data: CoverageData) -> dict[str, int]:
+        '''
+            Counts measured lines executed by tests of each module.
+
+            :param data: Coverage data recorded with per-test contexts.
+            :return: Number of executed lines per test module (tests not recorded are skipped).
+            :exceptions: None.
+        '''
+        module_of: dict[str, str] = {test_id: module for test_id, module, *_ in self.tests}
+        counts: dict[str, int] = {}
+
+        for filename in data.measured_files():
+            executed: dict[str, set[int]] = {}
+
+            for lineno, contexts in data.contexts_by_lineno(filename).items():
+                for context in contexts:
+                    if context in module_of:
+                        executed.setdefault(module_of[context], set()).add(lineno)
+
+            for module, lines in executed.items():
+                counts[module] = counts.get(module, 0) + len(lines)
+
+        return counts
+
+    def write_slowest(self, stream: IO[str], top: int) -> None:
+        '''
+            Writes table of the slowest tests.
+
+            :param stream: Output stream.
+            :param top: Number of tests (0 writes nothing).
+            :exceptions: None.
+        '''
+        if not self.tests or top <= 0:
+            return
+
+        slowest = sorted(self.tests, key=lambda test: -test[2])[:top]
+        width: int = max(len('Test'), *(len(test_id) for test_id, *_ in slowest))
+        stream.write(f'\n--- Slowest {len(slowest)} of {len(self.tests)} tests ---\n')
+        stream.write(f'{"Test":<{width}}  {"Wall":>9}  {"CPU":>9}\n')
+
+        for test_id, _, wall, cpu in slowest:
+            stream.write(f'{test_id:<{width}}  {wall:>8.3f}s  {cpu:>8.3f}s\n')
+
+    def write_modules(
+        self, stream: IO[str], covered: str | None = None, lines: dict[str, int] | None = None
+    ) -> None:
+        '''
+            Writes table of test time per module.
+
+            :param stream: Output stream.
+            :param covered: Total covered percent shown in the title or None.
+            :param lines: Measured lines executed by tests of each module
+                          (from per-test contexts) or None for no Lines column.
+            :exceptions: None.
+        '''
+        if not self.tests:
+            return
+
+        modules: dict[str, tuple[int, float, float]] = self.modules()
+        total: float = sum(wall for _, wall, _ in modules.values())
+        width: int = max(len('Module'), *(len(module) for module in modules))
+        coverage: str = f', {covered}% covered' if covered is not None else ''
+        header: str = f'{"Module":<{width}}  {"Tests":>5}  {"Wall":>9}  {"CPU":>9}  {"Share":>6}'
+        stream.write(f'\n--- Test time per module ({total:.3f}s{coverage}) ---\n')
+        stream.write(f'{header}  {"Lines":>7}\n' if lines is not None else f'{header}\n')
+
+        for module, (count, wall, cpu) in modules.items():
+            share: float = wall / total * 100 if total > 0 else 0.0
+            row: str = f'{module:<{width}}  {count:>5}  {wall:>8.3f}s  {cpu:>8.3f}s  {share:>5.1f}%'
+            stream.write(f'{row}  {lines.get(module, 0):>7}\n' if lines is not None else f'{row}\n')
+
+    def write_json(self, path: str) -> None:
+        '''
+            Writes durations per test and module as JSON.
+
+            :param path: Durations file path.
+            :exceptions:
+                | OSError: The durations file cannot be written.
+        '''
+        durations: dict[str, object] = {
+            'tests': [
+                {'id': test_id, 'module': module, 'wall': round(wall, 6), 'cpu': round(cpu, 6)}
+                for test_id, module, wall, cpu in self.tests
+            ],
+            'modules': {
+                module: {'tests': count, 'wall': round(wall, 6), 'cpu': round(cpu, 6)}
+                for module, (count, wall, cpu) in self.modules().items()
+            },
+        }
+
+        with open(path, 'w', encoding='utf-8') as durations_file:
+            dump(durations, durations_file, indent=1)
+
+    def read_json(self, path: str) -> None:
+        '''
+            Replaces durations with those of a JSON durations file.
+
+            :param path: Durations file path (written by write_json).
+            :exceptions:
+                | OSError: The durations file cannot be read.
+                | ValueError: The durations file is not valid JSON.
+                | KeyError: A test entry misses a field.
+        '''
+        with open(path, 'r', encoding='utf-8') as durations_file:
+            tests: list[dict[str, object]] = load(durations_file)['tests']
+
+        with self._lock:
+            self.tests = [(test['id'], test['module'], test['wall'], test['cpu']) for test in tests]
+
+
+TIMER: PhaseTimer = PhaseTimer()
+phase = TIMER.phase
+DURATIONS: DurationLog = DurationLog()
+
+
+def save_durations(path: str) -> None:
+    '''
+        Writes recorded test durations, reporting write errors.
+
+        :param path: Durations file path.
+        :exceptions: None.
+    '''
+    try:
+        makedirs(dirname(path) or '.', exist_ok=True)
+        DURATIONS.write_json(path)
+
+    except OSError as exc:
+        stderr.write(f'{exc}\n')
+
+
+def replay_durations(path: str, stream: IO[str], slowest: int) -> None:
+    '''
+        Loads test durations restored from the result cache and writes the slowest.
+
+        :param path: Restored durations file path.
+        :param stream: Output stream.
+        :param slowest: Number of slowest tests to report (0 for none).
+        :exceptions: None.
+    '''
+    try:
+        DURATIONS.read_json(path)
+
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        stderr.write(f'{exc}\n')
+        return
+
+    DURATIONS.write_slowest(stream, slowest)
@@ -0,0 +1,184 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_tree.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines lazy package tree walker for structure sections.
+'''
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from os import DirEntry, scandir, sep
+from os.path import exists, join
+
+from ats_ignore import IGNORE_FILE, IgnoreRules
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__ = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__ = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__ = '5.0.0'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+def _more_entries(num_dirs: int, num_files: int) -> str:
+    '''
+        Formats summary of entries left out of the tree.
+
+        :param num_dirs: Directories left out.
+        :param num_files: Files left out.
+        :return: Summary such as '… 12,345 more files'.
+        :exceptions: None.
+    '''
+    parts: list[str] = []
+
+    if num_dirs:
+        parts.append(f'{num_dirs:,} more {"directory" if num_dirs == 1 else "directories"}')
+
+    if num_files:
+        parts.append(f'{num_files:,} more {"file" if num_files == 1 else "files"}')
+
+    return f'… {", ".join(parts)}'
+
+
+class TreeWalker:
+    '''
+        Defines class TreeWalker with lazy package tree lines.
+        Walks directories with an explicit stack of os.scandir listings,
+        pruning ignored, too deep and surplus entries without walking them.
+
+        It defines:
+
+            :attributes:
+                | root - Directory to walk.
+                | prefix - Indentation prefix of the top level entries.
+                | rules - Ignore rules (.gitignore files and excludes).
+                | gitignore - Read .gitignore files of walked directories.
+                | max_depth - Deepest level of shown entries or None for no limit.
+                | max_entries_per_dir - Shown entries per directory or None for no limit.
+                | num_dirs - Directories yielded so far.
+                | num_files - Files yielded so far.
+            :methods:
+                | __init__ - Initials TreeWalker constructor.
+                | _entries - Lists visible directory entries in tree order.
+                | __iter__ - Yields tree lines in depth first order.
+    '''
+
+    def __init__(
+        self, root: str, prefix: str = '', excludes: list[str] | None = None,
+        gitignore: bool = True, max_depth: int | None = None,
+        max_entries_per_dir: int | None = None
+    ) -> None:
+        '''
+            Initials TreeWalker constructor.
+
+            :param root: Directory to walk (relative to the project root).
+            :param prefix: Indentation prefix of the top level entries.
+            :param excludes: Extra .gitignore style patterns or None.
+            :param gitignore: Honour .gitignore files of project root and walked directories.
+            :param max_depth: Deepest level of shown entries or None for no limit.
+            :param max_entries_per_dir: Shown entries per directory or None for no limit.
+            :exceptions: None.
+        '''
+        self.root: str = root
+        self.prefix: str = prefix
+        self.rules = IgnoreRules()
+        self.gitignore: bool = gitignore
+        self.max_depth: int | None = max_depth
+        self.max_entries_per_dir: int | None = max_entries_per_dir
+        self.num_dirs: int = 0
+        self.num_files: int = 0
+
+        if gitignore and exists(IGNORE_FILE):
+            self.rules.add_file(IGNORE_FILE)
+
+        self.rules.add(excludes or [])
+
+    def _entries(self, directory: str) -> list[tuple[DirEntry[str], bool]]:
+        '''
+            Lists visible directory entries in tree order.
+
+            :param directory: Directory path.
+            :return: Entries with directory flag (from the cached entry type).
+            :exceptions:
+                | OSError: The directory cannot be listed.
+        '''
+        with scandir(directory) as listing:
+            entries: list[DirEntry[str]] = [entry for entry in listing if entry.name != '__pycache__']
+
+        base: str = directory.replace(sep, '/') + '/'
+
+        if self.gitignore and any(entry.name == IGNORE_FILE for entry in entries):
+            self.rules.add_file(join(directory, IGNORE_FILE), base)
+
+        visible: list[tuple[DirEntry[str], bool]] = []
+
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+
+            is_dir: bool = entry.is_dir()
+
+            if not self.rules.rules or not self.rules.ignored(base + entry.name, is_dir):
+                visible.append((entry, is_dir))
+
+        visible.sort(key=lambda item: item[0].name.lstrip('_').lower())
+
+        return visible
+
+    def __iter__(self) -> Iterator[str]:
+        '''
+            Yields tree lines in depth first order.
+
+            :return: Iterator of tree lines.
+            :exceptions:
+                | OSError: A directory cannot be listed.
+        '''
+        stack: list[tuple[list[tuple[DirEntry[str], bool]], int, str, int]] = [
+            (self._entries(self.root), 0, self.prefix, 1)
+        ]
+        limit: int | None = self.max_entries_per_dir
+
+        while stack:
+            entries, index, prefix, depth = stack.pop()
+            shown: int = len(entries) if limit is None else min(limit, len(entries))
+
+            if index == shown:
+                if shown < len(entries):
+                    hidden_dirs: int = sum(is_dir for _, is_dir in entries[shown:])
+                    more: str = _more_entries(hidden_dirs, len(entries) - shown - hidden_dirs)
+                    yield f'{prefix}└── {more}\n'
+
+                continue
+
+            stack.append((entries, index + 1, prefix, depth))
+            entry, is_dir = entries[index]
+            is_last: bool = index == len(entries) - 1
+            connector: str = '└── ' if is_last else '├── '
+
+            if is_dir:
+                self.num_dirs += 1
+                yield f'{prefix}{connector}{entry.name}/\n'
+
+                if self.max_depth is None or depth < self.max_depth:
+                    child_prefix: str = prefix + ('    ' if is_last else '│\xa0\xa0 ')
+                    stack.append((self._entries(entry.path), 0, child_prefix, depth + 1))
+            else:
+                self.num_files += 1
+                yield f'{prefix}{connector}{entry.name}\n'
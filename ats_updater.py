@@ -17,14 +17,24 @@ Copyright
     with this program. If not, see <http://www.gnu.org/licenses/>.
 Info
     Defines helper functions for updating structures and READMEs.
+    Package roots, tree walking and section scanning are defined in
+    ats_resolver, ats_tree and ats_sections.
 '''
 
 from __future__ import annotations
 
 from sys import stderr
-from json import load
-from os.path import basename
-from pathlib import Path
+from json import dumps
+from os import chmod, makedirs, remove, replace, stat
+from os.path import basename, dirname, exists, isdir, isfile, realpath
+from stat import S_IMODE
+
+from ats_json import load_summaries
+from ats_resolver import PackageRootResolver, find_root_package
+from ats_sections import MarkdownBlock, RstBlock, replace_markdown_sections, replace_rst_sections
+from ats_summary import CoverageSummary, summary_file
+from ats_timing import phase
+from ats_tree import TreeWalker
 
 __author__ = 'Vladimir Roncevic'
 __copyright__ = '(C) 2026, https://vroncevic.github.io/ats_coverage'
@@ -34,6 +44,15 @@ __version__ = '5.0.0'
 __maintainer__ = 'Vladimir Roncevic'
 __email__ = 'elektron.ronca@gmail.com'
 __status__ = 'Updated'
+__all__ = [
+    'check_exists', 'load_report', 'find_root_package', 'write_atomic', 'update_readme',
+    'generate_tree_lines', 'update_structure', 'update_index_coverage', 'update_docs'
+]
+
+STRUCTURE_SECTIONS: tuple[str, ...] = ('Tool structure', 'Framework structure')
+COVERAGE_SECTION: str = 'Code coverage'
+COMPARE_CHUNK: int = 64 * 1024
+NEW_FILE_MODE: int = 0o644
 
 
 def check_exists(item_path: str, is_dir: bool = False) -> None:
@@ -54,30 +73,34 @@ def check_exists(item_path: str, is_dir: bool = False) -> None:
         raise ValueError('Parameter item_path cannot be empty')
 
     if is_dir:
-        if not Path(item_path).is_dir():
+        if not isdir(item_path):
             raise ValueError(f'Directory with name {item_path} does not exist')
     else:
-        if not Path(item_path).is_file():
+        if not isfile(item_path):
             raise ValueError(f'File with name {item_path} does not exist')
 
 
 def load_report(file_path: str) -> dict[str, object]:
     '''
-        Loads coverage report from file (JSON format).
+        Loads coverage summaries from report file (JSON format).
+
+        The report is parsed incrementally, line lists and contexts are
+        skipped, so memory does not grow with the size of the report.
 
         :param file_path: Coverage report file path.
-        :return: Coverage data report in dict format.
+        :return: Coverage data report in dict format (files[*].summary, totals and meta).
         :exceptions:
             | TypeError:  The parameter file_path type validation failed.
             | ValueError: The parameter file_path format validation failed.
             | ValueError: The file with name does not exist.
+            | ValueError: The file is not a valid JSON report.
     '''
     check_exists(file_path)
     data: dict[str, object] = {}
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as loaded_file:
-            data = load(loaded_file)
+        with phase('load_report'), open(file_path, 'r', encoding='utf-8') as loaded_file:
+            data = load_summaries(loaded_file)
 
     except (OSError, UnicodeDecodeError) as exc:
         stderr.write(f'{exc}\n')
@@ -85,181 +108,239 @@ def load_report(file_path: str) -> dict[str, object]:
     return data
 
 
-def find_root_package(module_path: str) -> Path | None:
+def _read_lines(file_path: str) -> list[str] | None:
     '''
-        Finds root package for project structure.
+        Reads lines of a target document.
 
-        :param module_path: Absolute path for project package.
-        :return: Root package path.
-        :exceptions:
-            | TypeError:  The parameter module_path type validation failed.
-            | ValueError: The parameter module_path format validation failed.
+        :param file_path: Path to the target file.
+        :return: Lines of the document or None if it cannot be read.
+        :exceptions: None.
+    '''
+    try:
+        with open(file_path, 'r', encoding='utf-8') as target_file:
+            return target_file.readlines()
+
+    except (OSError, UnicodeDecodeError) as exc:
+        stderr.write(f'{exc}\n')
+        return None
+
+
+def _same_content(file_path: str, content: bytes) -> bool:
+    '''
+        Compares file with new content (size first, then streamed chunks).
+
+        :param file_path: Path to the target file.
+        :param content: New content of the file.
+        :return: True if the file exists and holds the same bytes.
+        :exceptions: None.
     '''
-    root: Path | None = None
-    path: Path = Path(module_path).resolve()
+    try:
+        if stat(file_path).st_size != len(content):
+            return False
+
+        with open(file_path, 'rb') as target_file:
+            offset: int = 0
+
+            while chunk := target_file.read(COMPARE_CHUNK):
+                if chunk != content[offset:offset + len(chunk)]:
+                    return False
 
-    while path.parent != path:
-        if (path / '__init__.py').exists():
-            root = path
+                offset += len(chunk)
 
-        path = path.parent
+        return offset == len(content)
 
-    return root
+    except OSError:
+        return False
 
 
-def update_readme(coverage: dict[str, object], readme_path: str = 'README.md') -> None:
+def write_atomic(file_path: str, content: str, current: str | None = None) -> bool:
     '''
-        Updates README.md file with code coverage report table.
+        Writes file through a temporary file, skipping unchanged content.
 
-        :param coverage: Coverage data report in dict format.
-        :param readme_path: Path to README.md file.
-        :exceptions:
-            | TypeError:  The parameter coverage type validation failed.
-            | ValueError: The parameter coverage format validation failed.
-            | ValueError: The parameter readme_path type validation failed.
-            | ValueError: The parameter readme_path format validation failed.
-            | ValueError: The file with name does not exist.
+        The temporary file is created next to the target and replaced into
+        place, so readers never see a half written file and an unchanged
+        file keeps its modification time. A symlinked target is resolved
+        first, so the file it points to is replaced and the link is kept.
+        tempfile is imported on the first write only, it is not needed to
+        start the refresh command.
+
+        :param file_path: Path to the target file.
+        :param content: New content of the file.
+        :param current: Current content if already read (compared instead of the file).
+        :return: True if the file was changed.
+        :exceptions: None.
     '''
-    check_exists(readme_path)
-    lines: list[str] = []
+    data: bytes = content.encode('utf-8')
+
+    if content == current if current is not None else _same_content(file_path, data):
+        return False
+
+    # pylint: disable=import-outside-toplevel
+    from tempfile import mkstemp
+
+    file_path = realpath(file_path)
+    directory: str = dirname(file_path)
+    temp_path: str = ''
 
     try:
-        with open(readme_path, 'r', encoding='utf-8') as readme_file:
-            lines = readme_file.readlines()
+        handle, temp_path = mkstemp(prefix=f'.{basename(file_path)}.', suffix='.tmp', dir=directory)
 
-    except (OSError, UnicodeDecodeError) as exc:
+        with open(handle, 'wb') as temp_file:
+            temp_file.write(data)
+
+        try:
+            chmod(temp_path, S_IMODE(stat(file_path).st_mode))
+
+        except FileNotFoundError:
+            chmod(temp_path, NEW_FILE_MODE)
+
+        replace(temp_path, file_path)
+
+    except OSError as exc:
         stderr.write(f'{exc}\n')
-        return
-
-    new_lines: list[str] = []
-    inside_coverage: bool = False
-    inside_table: bool = False
-    stmts: str = 'num_statements'
-    miss: str = 'missing_lines'
-    cover: str = 'percent_covered_display'
-
-    for line in lines:
-        if '###' in line and 'Code coverage' in line:
-            inside_coverage = True
-            new_lines.append(line)
-            continue
-
-        if inside_coverage:
-            if '###' in line and 'Docs' in line:
-                inside_coverage = False
-                inside_table = False
-                new_lines.append(line)
-                continue
-
-            if '</summary>' in line:
-                inside_table = True
-                new_lines.append(line)
-                new_lines.append('\n')
-                new_lines.append('| Name | Stmts | Miss | Cover |\n')
-                new_lines.append('|------|-------|------|-------|\n')
-                file_names: list[str] = coverage['files']
-
-                for name in file_names:
-                    root_package: Path | None = find_root_package(name)
-                    module: str = ''
-
-                    if root_package:
-                        abs_name = str(Path(name).resolve())
-                        abs_root = str(root_package.resolve())
-
-                        if abs_name.startswith(abs_root):
-                            result: str = abs_name[len(abs_root):]
-                            result = result.lstrip('/')
-                            module = f'{basename(abs_root)}/{result}'
-
-                    file_summary: dict[str, object] = coverage['files'][name]
-                    statements: str = file_summary['summary'][stmts]
-                    missing: str = file_summary['summary'][miss]
-                    covered: str = file_summary['summary'][cover]
-                    new_lines.append(
-                        f'| `{module}` | {statements} | {missing} | {covered}%|\n'
-                    )
-
-                total: str = '| **Total** |'
-                total_statements: str = coverage['totals'][stmts]
-                total_missing: str = coverage['totals'][miss]
-                total_covered: str = coverage['totals'][cover]
-                total += f' {total_statements} |'
-                total += f' {total_missing} |'
-                total += f' {total_covered}% |\n'
-                new_lines.append(total)
-                continue
-
-            if '</details>' in line:
-                inside_table = False
-                new_lines.append('\n')
-                new_lines.append(line)
-                continue
-
-            if inside_table:
-                continue
-
-        if not inside_table:
-            new_lines.append(line)
-
-    with open(readme_path, 'w', encoding='utf-8') as update_file:
-        update_file.writelines(new_lines)
-
-
-def _build_tree(dir_path: Path, prefix: str = '') -> tuple[list[str], int, int]:
+
+        if temp_path and exists(temp_path):
+            remove(temp_path)
+
+        return False
+
+    return True
+
+
+def _coverage_rows(
+    coverage: CoverageSummary | dict[str, object], resolver: PackageRootResolver
+) -> list[tuple[str, object, object, object]]:
     '''
-        Recursively builds tree lines and counts files/directories.
+        Computes coverage table rows (module, statements, missing, covered).
 
-        :param dir_path: Directory path.
-        :param prefix: Current indentation prefix.
-        :return: Tuple containing tree lines list, directory count, and file count.
+        :param coverage: Summary model or coverage data report in dict format.
+        :param resolver: Package root resolver.
+        :return: Row per file followed by the total row.
+        :exceptions:
+            | KeyError: The coverage report has no summary or totals.
+    '''
+    if not isinstance(coverage, CoverageSummary):
+        coverage = CoverageSummary.from_report(coverage)
+
+    rows: list[tuple[str, object, object, object]] = [
+        (resolver.module_path(name), statements, missing, covered)
+        for name, statements, missing, covered in coverage
+    ]
+    rows.append(('Total', *coverage.total))
+
+    return rows
+
+
+def _markdown_table(rows: list[tuple[str, object, object, object]]) -> list[str]:
+    '''
+        Renders coverage rows as markdown table.
+
+        :param rows: Row per file followed by the total row.
+        :return: Lines of the table.
+        :exceptions: None.
+    '''
+    lines: list[str] = ['\n', '| Name | Stmts | Miss | Cover |\n', '|------|-------|------|-------|\n']
+    lines.extend(
+        f'| `{module}` | {statements} | {missing} | {covered}%|\n'
+        for module, statements, missing, covered in rows[:-1]
+    )
+    _, statements, missing, covered = rows[-1]
+    lines.append(f'| **Total** | {statements} | {missing} | {covered}% |\n')
+
+    return lines
+
+
+def _csv_table(rows: list[tuple[str, object, object, object]]) -> str:
+    '''
+        Renders coverage rows as csv-table content.
+
+        :param rows: Row per file followed by the total row.
+        :return: Content of the csv file.
         :exceptions: None.
     '''
-    entries = []
+    csv_lines: list[str] = ['"Name", "Stmts", "Miss", "Cover"']
+    csv_lines.extend(
+        f'"{module}", "{statements}", "{missing}", "{covered}%"'
+        for module, statements, missing, covered in rows
+    )
+
+    return '\n'.join(csv_lines) + '\n'
+
+
+def _markdown_tree(tree: tuple[list[str], int, int]) -> list[str]:
+    '''
+        Renders package tree as markdown code block.
+
+        :param tree: Tree lines list, directory count, and file count.
+        :return: Lines of the code block.
+        :exceptions: None.
+    '''
+    tree_lines, num_dirs, num_files = tree
+
+    return ['\n', '```bash\n', *tree_lines, '\n', f'     {num_dirs} directories, {num_files} files\n', '```\n']
+
+
+def _rst_tree(tree: tuple[list[str], int, int]) -> list[str]:
+    '''
+        Renders package tree as code-block body.
+
+        :param tree: Tree lines list, directory count, and file count.
+        :return: Lines of the code-block body.
+        :exceptions: None.
+    '''
+    tree_lines, num_dirs, num_files = tree
 
-    for entry in dir_path.iterdir():
-        if entry.name == '__pycache__' or entry.name.startswith('.'):
-            continue
+    return ['\n', *tree_lines, '\n', f'     {num_dirs} directories, {num_files} files\n', '\n']
 
-        entries.append(entry)
 
-    entries.sort(key=lambda x: x.name.lstrip('_').lower())
+def update_readme(
+    coverage: CoverageSummary | dict[str, object], readme_path: str = 'README.md',
+    resolver: PackageRootResolver | None = None
+) -> bool:
+    '''
+        Updates README.md file with code coverage report table.
+
+        :param coverage: Summary model or coverage data report in dict format.
+        :param readme_path: Path to README.md file.
+        :param resolver: Package root resolver shared with other tables or None.
+        :return: True if the file was changed.
+        :exceptions:
+            | TypeError:  The parameter coverage type validation failed.
+            | ValueError: The parameter coverage format validation failed.
+            | ValueError: The parameter readme_path type validation failed.
+            | ValueError: The parameter readme_path format validation failed.
+            | ValueError: The file with name does not exist.
+    '''
+    check_exists(readme_path)
+    lines: list[str] | None = _read_lines(readme_path)
 
-    lines = []
-    num_dirs = 0
-    num_files = 0
+    if lines is None:
+        return False
 
-    for i, entry in enumerate(entries):
-        is_last = (i == len(entries) - 1)
-        connector = '└── ' if is_last else '├── '
+    if resolver is None:
+        resolver = PackageRootResolver()
 
-        if entry.is_dir():
-            num_dirs += 1
-            lines.append(f'{prefix}{connector}{entry.name}/\n')
-            new_prefix = prefix + ('    ' if is_last else '│\xa0\xa0 ')
-            sub_lines, sub_dirs, sub_files = _build_tree(entry, new_prefix)
-            lines.extend(sub_lines)
-            num_dirs += sub_dirs
-            num_files += sub_files
-        else:
-            num_files += 1
-            lines.append(f'{prefix}{connector}{entry.name}\n')
+    table: MarkdownBlock = (lambda: _markdown_table(_coverage_rows(coverage, resolver)), ['\n'])
+    new_lines: list[str] = replace_markdown_sections(lines, {COVERAGE_SECTION: table})
 
-    return lines, num_dirs, num_files
+    return write_atomic(readme_path, ''.join(new_lines), ''.join(lines))
 
 
-def generate_tree_lines(pro_name: str) -> tuple[list[str], int, int]:
+def generate_tree_lines(
+    pro_name: str, tree_options: dict[str, object] | None = None
+) -> tuple[list[str], int, int]:
     '''
         Generates tree structure representation of package.
 
         :param pro_name: Project name.
+        :param tree_options: TreeWalker arguments (excludes, gitignore, limits) or None.
         :return: Tuple containing tree lines list, directory count, and file count.
         :exceptions:
             | TypeError: Parameter pro_name type validation failed.
             | ValueError: Parameter pro_name format validation failed.
             | ValueError: Directory with name does not exist.
     '''
-    is_dir = isinstance(pro_name, str) and Path(pro_name).is_dir()
+    is_dir = isinstance(pro_name, str) and isdir(pro_name)
     path_to_check = (
         pro_name if is_dir else f'{pro_name}.py'
         if isinstance(pro_name, str) else pro_name
@@ -269,154 +350,160 @@ def generate_tree_lines(pro_name: str) -> tuple[list[str], int, int]:
     if not is_dir:
         return [f'    {pro_name}.py\n'], 0, 1
 
-    pro_path = Path(pro_name)
-    lines = [f'    {pro_name}/\n']
-    sub_lines, num_dirs, num_files = _build_tree(pro_path, prefix='         ')
-    lines.extend(sub_lines)
+    walker = TreeWalker(pro_name, prefix='         ', **(tree_options or {}))
+    lines: list[str] = [f'    {pro_name}/\n', *walker]
 
-    return lines, num_dirs + 1, num_files
+    return lines, walker.num_dirs + 1, walker.num_files
 
 
-def update_structure(pro_name: str, file_path: str = 'README.md') -> None:
+def update_structure(
+    pro_name: str, file_path: str = 'README.md', tree_options: dict[str, object] | None = None
+) -> bool:
     '''
         Updates file with package directory structure (supports Markdown and reStructuredText).
 
         :param pro_name: Project name.
         :param file_path: Path to the target file.
+        :param tree_options: TreeWalker arguments (excludes, gitignore, limits) or None.
+        :return: True if the file was changed.
         :exceptions:
             | TypeError:  The parameter pro_name type validation failed.
             | TypeError:  The parameter file_path type validation failed.
             | ValueError: The file with name does not exist.
     '''
     check_exists(file_path)
-    tree_lines, num_dirs, num_files = generate_tree_lines(pro_name)
-    lines: list[str] = []
 
-    try:
-        with open(file_path, 'r', encoding='utf-8') as target_file:
-            lines = target_file.readlines()
+    with phase('generate_tree_lines'):
+        tree: tuple[list[str], int, int] = generate_tree_lines(pro_name, tree_options)
+    lines: list[str] | None = _read_lines(file_path)
 
-    except (OSError, UnicodeDecodeError) as exc:
-        stderr.write(f'{exc}\n')
-        return
-
-    structure_sections: tuple[str, ...] = ('Tool structure', 'Framework structure')
-    new_lines: list[str] = []
-    inside_structure: bool = False
-    replace_mode: bool = False
-    is_rst: bool = file_path.endswith('.rst')
-
-    for line in lines:
-        if is_rst:
-            if any(sec in line for sec in structure_sections):
-                inside_structure = True
-                new_lines.append(line)
-                continue
-        else:
-            if '###' in line and any(sec in line for sec in structure_sections):
-                inside_structure = True
-                new_lines.append(line)
-                continue
-
-        if inside_structure:
-            if is_rst:
-                if '..' in line and 'code-block' in line:
-                    new_lines.append(line)
-                    new_lines.append('\n')
-                    new_lines.extend(tree_lines)
-                    new_lines.append('\n')
-                    new_lines.append(f'     {num_dirs} directories, {num_files} files\n')
-                    new_lines.append('\n')
-                    replace_mode = True
-                    continue
-
-                if replace_mode and line.strip() and not line.startswith((' ', '\t')):
-                    inside_structure = False
-                    replace_mode = False
-
-            else:
-                if '###' in line and 'Code coverage' in line:
-                    inside_structure = False
-                    replace_mode = False
-                    new_lines.append(line)
-                    continue
-
-                if '</summary>' in line:
-                    new_lines.append(line)
-                    new_lines.append('\n')
-                    new_lines.append('```bash\n')
-                    new_lines.extend(tree_lines)
-                    new_lines.append('\n')
-                    new_lines.append(f'     {num_dirs} directories, {num_files} files\n')
-                    new_lines.append('```\n')
-                    replace_mode = True
-                    continue
-
-                if '</details>' in line:
-                    replace_mode = False
-                    new_lines.append(line)
-                    continue
-
-            if replace_mode:
-                continue
-
-        new_lines.append(line)
+    if lines is None:
+        return False
 
-    try:
-        with open(file_path, 'w', encoding='utf-8') as target_file:
-            target_file.writelines(new_lines)
+    if file_path.endswith('.rst'):
+        rst_blocks: dict[str, RstBlock] = dict.fromkeys(STRUCTURE_SECTIONS, lambda: _rst_tree(tree))
+        new_lines: list[str] = replace_rst_sections(lines, rst_blocks)
+    else:
+        md_blocks: dict[str, MarkdownBlock] = dict.fromkeys(
+            STRUCTURE_SECTIONS, (lambda: _markdown_tree(tree), [])
+        )
+        new_lines = replace_markdown_sections(lines, md_blocks)
 
-    except (OSError, UnicodeDecodeError) as exc:
-        stderr.write(f'{exc}\n')
-        return
+    return write_atomic(file_path, ''.join(new_lines), ''.join(lines))
 
 
-def update_index_coverage(coverage: dict[str, object], csv_path: str = 'docs/source/coverage_table.csv') -> None:
+def update_index_coverage(
+    coverage: CoverageSummary | dict[str, object], csv_path: str = 'docs/source/coverage_table.csv',
+    resolver: PackageRootResolver | None = None
+) -> bool:
     '''
         Updates docs/source/coverage_table.csv with code coverage data.
 
-        :param coverage: Coverage data report in dict format.
+        :param coverage: Summary model or coverage data report in dict format.
         :param csv_path: Path to coverage_table.csv file.
+        :param resolver: Package root resolver shared with other tables or None.
+        :return: True if the file was changed.
         :exceptions:
             | TypeError:  The parameter coverage type validation failed.
             | ValueError: The parameter csv_path type validation failed.
             | ValueError: The directory with name does not exist.
     '''
-    dir_path: Path = Path(csv_path).parent
-    check_exists(str(dir_path), is_dir=True)
-    stmts: str = 'num_statements'
-    miss: str = 'missing_lines'
-    cover: str = 'percent_covered_display'
-    csv_lines: list[str] = ['"Name", "Stmts", "Miss", "Cover"']
-    file_names: list[str] = coverage['files']
+    check_exists(dirname(csv_path) or '.', is_dir=True)
+
+    if resolver is None:
+        resolver = PackageRootResolver()
+
+    return write_atomic(csv_path, _csv_table(_coverage_rows(coverage, resolver)))
+
 
-    for name in file_names:
-        root_package: Path | None = find_root_package(name)
-        module: str = ''
+def update_docs(
+    pro_name: str, coverage: CoverageSummary | dict[str, object], readme_path: str = 'README.md',
+    index_path: str | None = 'docs/source/index.rst',
+    csv_path: str | None = 'docs/source/coverage_table.csv', structure: bool = True,
+    tree_options: dict[str, object] | None = None
+) -> list[str]:
+    '''
+        Updates README.md, index.rst and coverage_table.csv in a single pass.
+
+        Coverage rows and package tree are computed once, each document is
+        read once, all its sections are replaced in one scan and it is
+        written once (atomically, and only if its content changed). The
+        summary is saved next to the docs for the refresh subcommand.
 
-        if root_package:
-            abs_name = str(Path(name).resolve())
-            abs_root = str(root_package.resolve())
+        :param pro_name: Project name.
+        :param coverage: Summary model or coverage data report in dict format.
+        :param readme_path: Path to README.md file.
+        :param index_path: Path to index.rst file or None to skip it.
+        :param csv_path: Path to coverage_table.csv file or None to skip it.
+        :param structure: Update package structure sections (skip if layout is unchanged).
+        :param tree_options: TreeWalker arguments (excludes, gitignore, limits) or None.
+        :return: Paths of changed files.
+        :exceptions:
+            | TypeError:  The parameter pro_name type validation failed.
+            | ValueError: The parameter pro_name format validation failed.
+            | ValueError: The file or directory with name does not exist.
+    '''
+    check_exists(readme_path)
 
-            if abs_name.startswith(abs_root):
-                result: str = abs_name[len(abs_root):]
-                result = result.lstrip('/')
-                module = f'{basename(abs_root)}/{result}'
+    if csv_path is not None:
+        check_exists(dirname(csv_path) or '.', is_dir=True)
 
-        file_summary: dict[str, object] = coverage['files'][name]
-        statements: str = file_summary['summary'][stmts]
-        missing: str = file_summary['summary'][miss]
-        covered: str = file_summary['summary'][cover]
-        csv_lines.append(f'"{module}", "{statements}", "{missing}", "{covered}%"')
+    if not structure:
+        index_path = None
+    elif index_path is not None:
+        check_exists(index_path)
 
-    total_statements: str = coverage['totals'][stmts]
-    total_missing: str = coverage['totals'][miss]
-    total_covered: str = coverage['totals'][cover]
-    csv_lines.append(f'"Total", "{total_statements}", "{total_missing}", "{total_covered}%"')
+    if not isinstance(coverage, CoverageSummary):
+        coverage = CoverageSummary.from_report(coverage)
+
+    with phase('coverage rows'):
+        rows = _coverage_rows(coverage, PackageRootResolver())
+
+    md_blocks: dict[str, MarkdownBlock] = {COVERAGE_SECTION: (lambda: _markdown_table(rows), ['\n'])}
+    rst_blocks: dict[str, RstBlock] = {}
+
+    if structure:
+        with phase('generate_tree_lines'):
+            tree: tuple[list[str], int, int] = generate_tree_lines(pro_name, tree_options)
+
+        md_blocks.update(dict.fromkeys(STRUCTURE_SECTIONS, (lambda: _markdown_tree(tree), [])))
+        rst_blocks.update(dict.fromkeys(STRUCTURE_SECTIONS, lambda: _rst_tree(tree)))
+
+    changed: list[str] = []
+
+    with phase('update_readme'):
+        lines: list[str] | None = _read_lines(readme_path)
+
+        if lines is not None:
+            new_lines: list[str] = replace_markdown_sections(lines, md_blocks)
+
+            if write_atomic(readme_path, ''.join(new_lines), ''.join(lines)):
+                changed.append(readme_path)
+
+    if index_path is not None:
+        with phase('update_index'):
+            lines = _read_lines(index_path)
+
+            if lines is not None:
+                new_lines = replace_rst_sections(lines, rst_blocks)
+
+                if write_atomic(index_path, ''.join(new_lines), ''.join(lines)):
+                    changed.append(index_path)
+
+    if csv_path is not None:
+        with phase('update_index_coverage'):
+            if write_atomic(csv_path, _csv_table(rows)):
+                changed.append(csv_path)
+
+    summary_path: str = summary_file(pro_name)
 
     try:
-        with open(csv_path, 'w', encoding='utf-8') as csv_file:
-            csv_file.write('\n'.join(csv_lines) + '\n')
+        makedirs(dirname(summary_path), exist_ok=True)
 
     except OSError as exc:
         stderr.write(f'{exc}\n')
+        return changed
+
+    write_atomic(summary_path, dumps(coverage.to_report()) + '\n')
+
+    return changed
@@ -0,0 +1,369 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_watch.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines resident watch mode rerunning affected tests on file changes.
+'''
+
+from __future__ import annotations
+
+from sys import stdout, stderr, modules, gettrace, settrace
+from os import sep
+from os.path import realpath
+from time import perf_counter, sleep
+from pathlib import Path
+from unittest import TestLoader, TestResult, TestSuite
+
+from coverage import Coverage, CoverageData
+
+from ats_core import check_core, resolve_core
+from ats_impact import ImpactPlan, imported_modules, plan_incremental, tracked_files
+from ats_manifest import DiscoveryManifest
+from ats_report import build_reports
+from ats_runner import filter_suite, make_runner
+from ats_timing import DURATIONS, TIMER
+from ats_updater import check_exists, update_docs
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__ = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__ = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__ = '5.0.0'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+WATCH_INTERVAL: float = 0.2
+DOCS_DIR: str = 'docs/source'
+
+
+def snapshot_files(pro_name: str) -> dict[str, tuple[int, int]]:
+    '''
+        Stats tracked files (cheap change detection without reading them).
+
+        :param pro_name: Project name.
+        :return: Modification time and size per real file path.
+        :exceptions: None.
+    '''
+    snapshot: dict[str, tuple[int, int]] = {}
+
+    for path in tracked_files(pro_name):
+        try:
+            stat = path.stat()
+
+        except OSError:
+            continue
+
+        snapshot[realpath(path)] = (stat.st_mtime_ns, stat.st_size)
+
+    return snapshot
+
+
+def _importers(names: set[str], project: dict[str, str]) -> set[str] | None:
+    '''
+        Finds loaded project modules importing given modules (transitively).
+
+        :param names: Names of changed project modules.
+        :param project: Real file path per loaded project module name.
+        :return: Given names with all their importers or None if an import
+                 of a loaded project module cannot be parsed.
+        :exceptions: None.
+    '''
+    if not names:
+        return names
+
+    importers: dict[str, set[str]] = {}
+
+    for name, path in project.items():
+        try:
+            imported: set[str] = imported_modules(Path(path), name)
+
+        except (OSError, SyntaxError, ValueError):
+            return None
+
+        for target in imported:
+            importers.setdefault(target, set()).add(name)
+
+    stale: set[str] = set(names)
+    pending: list[str] = list(names)
+
+    while pending:
+        for importer in importers.get(pending.pop(), ()):
+            if importer not in stale:
+                stale.add(importer)
+                pending.append(importer)
+
+    return stale
+
+
+class CoverageWatcher:
+    '''
+        Defines class CoverageWatcher with resident incremental runs.
+        Keeps interpreter, imports and coverage instance warm between edits.
+
+        It defines:
+
+            :attributes:
+                | pro_name - Project name.
+                | options - Coverage constructor arguments.
+                | reports - Report plan (requesters per report kind).
+                | core - Requested coverage core or None for the default.
+                | tree_options - TreeWalker arguments for structure sections.
+                | cov - Reused coverage instance (recreated when config changes or a run fails).
+                | snapshot - Modification time and size per tracked file.
+                | manifest - Test discovery manifest (only changed test files are imported).
+            :methods:
+                | __init__ - Initials CoverageWatcher constructor.
+                | changes - Polls tracked files for changes.
+                | _new_coverage - Creates coverage instance from current config.
+                | _forget_modules - Drops test modules and changed project modules with their importers.
+                | _load_tests - Loads tests selected by the plan.
+                | _refresh_docs - Updates README.md and docs with new summary.
+                | run_once - Reruns tests affected by changed files.
+                | run_forever - Polls for changes and reruns until interrupted.
+    '''
+
+    def __init__(
+        self, pro_name: str, reports: dict[str, list[str]] | None = None,
+        core: str | None = None, tree_options: dict[str, object] | None = None
+    ) -> None:
+        '''
+            Initials CoverageWatcher constructor.
+
+            :param pro_name: Project name (is equal to directory name).
+            :param reports: Report plan (requesters per report kind) or None for no artifacts.
+            :param core: Coverage core (ctrace, pytrace or sysmon) or None for the default.
+            :param tree_options: TreeWalker arguments (excludes, gitignore, limits) or None.
+            :exceptions:
+                | TypeError:  The parameter pro_name type validation failed.
+                | ValueError: The parameter pro_name format validation failed.
+                | ValueError: The directory with name does not exist.
+                | ValueError: Unknown core.
+        '''
+        is_dir = isinstance(pro_name, str) and Path(pro_name).is_dir()
+        check_exists(pro_name if is_dir else f'{pro_name}.py', is_dir=is_dir)
+        self.pro_name: str = pro_name
+        self.options: dict[str, object] = {
+            'source': [pro_name], 'config_file': '.coveragerc', 'data_file': f'.coverage.{pro_name}'
+        }
+        self.reports: dict[str, list[str]] = reports if reports is not None else {}
+        self.core: str | None = check_core(core) if core is not None else None
+        self.tree_options: dict[str, object] | None = tree_options
+        self.cov: Coverage | None = None
+        self.snapshot: dict[str, tuple[int, int]] = {}
+        self.manifest: DiscoveryManifest = DiscoveryManifest()
+
+    def changes(self) -> tuple[set[str], bool]:
+        '''
+            Polls tracked files for changes.
+
+            :return: Tuple containing changed (added or removed) files and
+                     flag if the set of files changed.
+            :exceptions: None.
+        '''
+        current: dict[str, tuple[int, int]] = snapshot_files(self.pro_name)
+        changed: set[str] = {
+            path for path in current.keys() | self.snapshot.keys()
+            if current.get(path) != self.snapshot.get(path)
+        }
+        layout: bool = current.keys() != self.snapshot.keys()
+        self.snapshot = current
+
+        return changed, layout
+
+    def _new_coverage(self) -> Coverage:
+        '''
+            Creates coverage instance from current config.
+
+            :return: Coverage instance recording per-test contexts.
+            :exceptions: None.
+        '''
+        cov = Coverage(**self.options)
+        core, reason = resolve_core(self.core, bool(cov.get_option('run:branch')), True)
+
+        if reason:
+            stdout.write(f'\n--- Core {self.core} not usable ({reason}), falling back to {core} ---\n')
+
+        if core is not None:
+            cov.set_option('run:core', core)
+
+        return cov
+
+    def _forget_modules(self, changed: set[str], full: bool) -> None:
+        '''
+            Drops test modules and changed project modules with their importers.
+
+            Dropped modules are imported again while tests are loaded, so
+            names other modules bound with from-imports refer to the new
+            objects. Project modules importing a changed module (directly or
+            through other project modules) are dropped too, all of them if
+            the whole suite is run again or an import cannot be parsed. Test
+            modules are imported again only if they have selected tests.
+
+            :param changed: Changed tracked files.
+            :param full: Drop all project modules (whole suite is run again).
+            :exceptions: None.
+        '''
+        tests_dir: str = realpath('tests') + sep
+        pro_path: str = realpath(self.pro_name)
+        project: dict[str, str] = {}
+
+        for name in sorted(modules):
+            module_file: str | None = getattr(modules.get(name), '__file__', None)
+
+            if not module_file:
+                continue
+
+            path: str = realpath(module_file)
+
+            if path.startswith(tests_dir):
+                modules.pop(name, None)
+            elif path.startswith(pro_path + sep) or path == f'{pro_path}.py':
+                project[name] = path
+
+        stale: set[str] | None = set(project) if full else _importers(
+            {name for name, path in project.items() if path in changed}, project
+        )
+
+        for name in project if stale is None else stale:
+            modules.pop(name, None)
+
+    def _load_tests(self, plan: ImpactPlan) -> TestSuite:
+        '''
+            Loads tests selected by the plan.
+
+            :param plan: Incremental plan selecting tests.
+            :return: Suite importing selected test modules when run.
+            :exceptions: None.
+        '''
+        if self.manifest.refresh():
+            return self.manifest.suite(None if plan.full else plan.wants_test)
+
+        tests: TestSuite = TestLoader().discover('tests', pattern='*_test.py', top_level_dir='.')
+
+        return tests if plan.full else filter_suite(tests, plan.wants)
+
+    def _refresh_docs(self, summary: dict[str, object], layout: bool) -> list[str]:
+        '''
+            Updates README.md and docs with new summary.
+
+            :param summary: Coverage data report in dict format.
+            :param layout: Project files were added or removed.
+            :return: Paths of changed files.
+            :exceptions: None.
+        '''
+        docs: bool = Path(DOCS_DIR).is_dir()
+
+        try:
+            return update_docs(
+                self.pro_name, summary, index_path=f'{DOCS_DIR}/index.rst' if docs else None,
+                csv_path=f'{DOCS_DIR}/coverage_table.csv' if docs else None, structure=layout,
+                tree_options=self.tree_options
+            )
+
+        except (ValueError, TypeError) as err:
+            stderr.write(f'ats_coverage: {err}\n')
+            return []
+
+    def run_once(self, changed: set[str], layout: bool = False) -> dict[str, object]:
+        '''
+            Reruns tests affected by changed files.
+
+            :param changed: Changed tracked files.
+            :param layout: Project files were added or removed.
+            :return: Coverage data report in dict format (files[*].summary and totals).
+            :exceptions:
+                | NoDataError: There is no data to report.
+                | NotPython: A measured source file cannot be parsed.
+        '''
+        TIMER.reset()
+        DURATIONS.reset()
+        start: float = perf_counter()
+        data: CoverageData | None = None
+
+        if self.cov is None or realpath('.coveragerc') in changed:
+            self.cov = self._new_coverage()
+        else:
+            data = self.cov.get_data()
+
+        plan: ImpactPlan = plan_incremental(self.pro_name, data)
+        retained: CoverageData | None = plan.retained_data()
+        mode: str = 'full run' if plan.full else 'selected tests only'
+        stdout.write(f'\n--- Incremental: {mode}, {plan.reason} ---\n')
+        self.cov.erase()
+        self._forget_modules(changed, plan.full)
+        old_trace = gettrace()
+        self.cov.start()
+
+        try:
+            tests: TestSuite = self._load_tests(plan)
+            stdout.write('\n--- Test Report ---\n')
+            result: TestResult = make_runner(cov=self.cov).run(tests)
+
+        finally:
+            self.cov.stop()
+            settrace(old_trace)
+
+        if retained is not None:
+            self.cov.get_data().update(retained)
+
+        self.cov.save()
+
+        if result.wasSuccessful():
+            plan.save_state()
+
+        tests_run: int = result.testsRun
+        summary: dict[str, object] = build_reports(self.cov, self.pro_name, self.options, self.reports)
+        docs: list[str] = self._refresh_docs(summary, layout)
+        stdout.write(
+            f'\n--- Watch: {len(changed)} changed files, {tests_run} tests run, '
+            f'{len(docs)} docs updated in {perf_counter() - start:.3f}s ---\n'
+        )
+
+        return summary
+
+    def run_forever(self, interval: float = WATCH_INTERVAL) -> None:
+        '''
+            Polls for changes and reruns until interrupted.
+
+            The first poll only takes the snapshot. A failing run (for
+            example a syntax error in a watched file) is reported and the
+            changed files stay selected until a run passes.
+
+            :param interval: Seconds between polls.
+            :exceptions:
+                | KeyboardInterrupt: Watching was stopped by the user.
+        '''
+        stdout.write(f'\n--- Watching {self.pro_name} (polling every {interval}s) ---\n')
+        self.changes()
+
+        while True:
+            sleep(interval)
+            changed, layout = self.changes()
+
+            if not changed:
+                continue
+
+            try:
+                self.run_once(changed, layout)
+
+            except Exception as exc:
+                self.cov = None
+                stderr.write(f'ats_coverage: watch run failed: {exc!r}\n')
+                stdout.write('\n--- Watch: run failed, waiting for the next change ---\n')
+
+            stdout.flush()
@@ -56,12 +56,17 @@ setup(
     keywords='code, coverage, automation',
     platforms='any',
     classifiers=PYP_CLASSIFIERS,
-    py_modules=['ats_coverage', 'ats_updater'],
-    install_requires=['ats_utilities', 'coverage'],
+    py_modules=[
+        'ats_args', 'ats_batch', 'ats_cache', 'ats_cli', 'ats_commands', 'ats_config', 'ats_core',
+        'ats_coverage', 'ats_covers', 'ats_ignore', 'ats_history', 'ats_impact', 'ats_json',
+        'ats_manifest', 'ats_report', 'ats_resolver', 'ats_runner', 'ats_sections', 'ats_summary',
+        'ats_timing', 'ats_tree', 'ats_updater', 'ats_watch'
+    ],
+    install_requires=['ats_utilities', 'coverage>=7.16,<8'],
     data_files=[('', ['py.typed'])],
     entry_points={
         'console_scripts': [
-            'ats_coverage=ats_coverage:main',
+            'ats_coverage=ats_cli:main',
         ],
     }
 )
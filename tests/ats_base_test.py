@@ -63,7 +63,7 @@ class ATSCoverageBaseTestCase(unittest.TestCase):
         sys.path.insert(0, self.temp_dir.name)
 
         for name in list(sys.modules.keys()):
-            if name.startswith("dummy_package") or "dummy_test" in name or name.startswith("ats_coverage"):
+            if name.startswith("dummy_package") or "dummy_test" in name or name.startswith(("ats_coverage", "ats_commands")):
                 sys.modules.pop(name, None)
             elif name == "tests" or name.startswith("tests."):
                 sys.modules.pop(name, None)
@@ -121,7 +121,7 @@ class ATSCoverageBaseTestCase(unittest.TestCase):
         self.temp_dir.cleanup()
 
         for name in list(sys.modules.keys()):
-            if name.startswith("dummy_package") or "dummy_test" in name or name.startswith("ats_coverage"):
+            if name.startswith("dummy_package") or "dummy_test" in name or name.startswith(("ats_coverage", "ats_commands")):
                 sys.modules.pop(name, None)
             elif name == "tests" or name.startswith("tests."):
                 sys.modules.pop(name, None)
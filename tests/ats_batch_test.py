@@ -0,0 +1,116 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_batch_test.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines multi-project batch run test cases.
+'''
+
+from __future__ import annotations
+
+import sys
+import shutil
+import subprocess
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from ats_batch import expand_projects
+from tests.ats_base_test import ATSCoverageBaseTestCase
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__: list[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__: str = '5.0.0'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+SCRIPT_PATH = str(Path(__file__).parent.parent / "ats_coverage.py")
+
+
+class ATSBatchTestCase(ATSCoverageBaseTestCase):
+    '''
+        Defines class ATSBatchTestCase with batch run tests.
+        Tests project expansion and concurrent runs of several projects.
+
+        It defines:
+
+            :attributes: None.
+            :methods:
+                | make_root - Copies the dummy project into a root directory.
+                | test_expand_projects - Test names are kept and glob patterns expanded.
+                | test_batch_run - Test every project is run, documented and timed.
+    '''
+
+    def make_root(self, root: str) -> None:
+        '''
+            Copies the dummy project into a root directory.
+
+            :param root: Root directory of the copy.
+            :exceptions: None.
+        '''
+        shutil.copytree(self.pkg_dir, Path(root) / self.pkg_dir)
+        shutil.copytree(self.test_dir, Path(root) / self.test_dir)
+        shutil.copy(self.readme_path, Path(root) / self.readme_path)
+        (Path(root) / "docs/source").mkdir(parents=True)
+        (Path(root) / "docs/source/index.rst").write_text("Tool structure\n", encoding="utf-8")
+
+    def test_expand_projects(self) -> None:
+        '''
+            Test names are kept and glob patterns expanded.
+
+            :exceptions: None.
+        '''
+        self.make_root("one")
+        self.make_root("two")
+        Path("two/tool.py").write_text("", encoding="utf-8")
+        self.assertEqual(
+            expand_projects(["dummy_package/", "*/dummy_package", "two/*.py", "dummy_package"]),
+            ["dummy_package", "one/dummy_package", "two/dummy_package", "two/tool"]
+        )
+
+        with self.assertRaises(ValueError):
+            expand_projects(["missing_*"])
+
+    def test_batch_run(self) -> None:
+        '''
+            Test every project is run, documented and timed.
+
+            :exceptions: None.
+        '''
+        self.make_root("one")
+        self.make_root("two")
+        res = subprocess.run(
+            ["python3", SCRIPT_PATH, "--no-cache", "--report", "json", "*/dummy_package", "one/missing"],
+            capture_output=True, text=True, check=False
+        )
+        self.assertEqual(res.returncode, 128)
+        self.assertIn("--- Batch: 3 projects, 1 failed", res.stdout)
+        self.assertIn("one/dummy_package: test run", res.stdout)
+
+        for root in ("one", "two"):
+            self.assertTrue(Path(root, ".coverage.dummy_package").is_file())
+            self.assertTrue(Path(root, "dummy_package.json").is_file())
+            self.assertIn("| **Total** |", Path(root, "README.md").read_text(encoding="utf-8"))
+
+        self.assertEqual(self.readme_path.read_text(encoding="utf-8"), self.readme_content)
+
+
+if __name__ == '__main__':
+    unittest.main()
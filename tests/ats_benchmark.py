@@ -0,0 +1,793 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_benchmark.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines performance benchmarks on synthetic projects.
+Execute
+    python3 tests/ats_benchmark.py reports --modules 400
+    python3 tests/ats_benchmark.py tree --files 200000
+    python3 tests/ats_benchmark.py summary --modules 20000
+    python3 tests/ats_benchmark.py history --modules 5000 --runs 500
+    python3 tests/ats_benchmark.py covers --modules 200 --tests 50000
+    python3 tests/ats_benchmark.py startup --repeat 10
+    python3 tests/ats_benchmark.py suite --scales 10,100,1000,10000 --depths 1,5,15 --save current.json
+    python3 tests/ats_benchmark.py suite --baseline baseline.json
+    python3 tests/ats_benchmark.py compare baseline.json current.json
+'''
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import subprocess
+import tempfile
+import tracemalloc
+from io import StringIO
+from platform import platform, python_version
+from contextlib import redirect_stderr
+from pathlib import Path
+from time import perf_counter
+from statistics import median
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable
+from importlib import import_module
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from coverage import Coverage, CoverageData
+
+from ats_cli import STARTUP_BUDGET
+from ats_coverage import run_coverage
+from ats_covers import CoverIndex
+from ats_history import HistoryStore
+from ats_report import build_reports
+from ats_summary import CoverageSummary
+from ats_resolver import PackageRootResolver
+from ats_updater import (
+    generate_tree_lines,
+    load_report,
+    update_index_coverage,
+    update_readme,
+    update_structure,
+    _coverage_rows,
+)
+from tests.ats_base_test import ATSCoverageBaseTestCase
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__: list[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__: str = '5.0.0'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+PRO_NAME: str = 'bench_package'
+MODULE_BODY: str = ''.join(
+    f'def func{index}(value: int) -> int:\n'
+    f'    if value > {index}:\n'
+    f'        return value * 2\n'
+    f'    elif value < 0:\n'
+    f'        return -value\n'
+    f'    return value + {index}\n\n'
+    for index in range(20)
+)
+SUITE_PRO_NAME: str = 'dummy_package'
+SUITE_MODULE_BODY: str = 'def double(value: int) -> int:\n    return value * 2\n'
+SUITE_TEST_BODY: str = (
+    'import unittest\n'
+    'from importlib import import_module\n\n'
+    'MODULES = {modules!r}\n\n'
+    'class BenchTest(unittest.TestCase):\n'
+    '    def test_modules(self):\n'
+    '        for name in MODULES:\n'
+    '            self.assertEqual(import_module(name).double(2), 4)\n'
+)
+REGRESSION_TOLERANCE: float = 0.25
+MIN_DELTA: float = 0.005
+ROOT_DIR: str = str(Path(__file__).parent.parent)
+STARTUP_REPEAT: int = 9
+IMPORT_CODE: str = 'from time import perf_counter; start = perf_counter(); import {module}; print(perf_counter() - start)'
+
+
+def make_project(root: Path, modules: int) -> list[str]:
+    '''
+        Creates synthetic package with modules under root directory.
+
+        :param root: Project root directory.
+        :param modules: Number of modules in the package.
+        :return: Dotted names of the generated modules.
+        :exceptions: None.
+    '''
+    pkg_dir = root / PRO_NAME
+    pkg_dir.mkdir(parents=True, exist_ok=True)
+    (pkg_dir / '__init__.py').write_text('', encoding='utf-8')
+    (root / '.coveragerc').write_text('[report]\n', encoding='utf-8')
+    names: list[str] = []
+
+    for index in range(modules):
+        (pkg_dir / f'module{index}.py').write_text(MODULE_BODY, encoding='utf-8')
+        names.append(f'{PRO_NAME}.module{index}')
+
+    return names
+
+
+def _measure(names: list[str]) -> dict[str, object]:
+    '''
+        Measures synthetic modules and returns coverage constructor arguments.
+
+        :param names: Dotted names of the modules to execute.
+        :return: Coverage constructor arguments.
+        :exceptions: None.
+    '''
+    options: dict[str, object] = {
+        'source': [PRO_NAME], 'config_file': '.coveragerc', 'data_file': f'.coverage.{PRO_NAME}'
+    }
+    cov = Coverage(**options)
+    cov.start()
+
+    for name in names:
+        module = import_module(name)
+        module.func1(5)
+        module.func3(-1)
+
+    cov.stop()
+    cov.save()
+
+    return options
+
+
+def bench_reports(args: Namespace) -> dict[str, float]:
+    '''
+        Compares sequential report calls with the shared analysis stage.
+
+        :param args: Parsed benchmark arguments.
+        :return: Best time in seconds per variant.
+        :exceptions: None.
+    '''
+    options: dict[str, object] = _measure(make_project(Path('.'), args.modules))
+    sequential: list[float] = []
+    shared: list[float] = []
+
+    for _ in range(args.repeat):
+        cov = Coverage(**options)
+        cov.load()
+        start: float = perf_counter()
+        cov.report(file=StringIO())
+        cov.json_report(outfile=f'{PRO_NAME}.json')
+        cov.xml_report(outfile=f'{PRO_NAME}.xml')
+        cov.html_report(directory='htmlcov')
+        sequential.append(perf_counter() - start)
+
+        cov = Coverage(**options)
+        cov.load()
+        start = perf_counter()
+
+        with patch('ats_report.stdout', StringIO()):
+            build_reports(cov, PRO_NAME, options)
+
+        shared.append(perf_counter() - start)
+
+    return {'sequential': min(sequential), 'shared_analysis': min(shared)}
+
+
+def make_tree(root: Path, files: int, fanout: int = 10) -> None:
+    '''
+        Creates synthetic package tree with files spread over nested directories.
+
+        :param root: Project root directory.
+        :param files: Number of files in the tree.
+        :param fanout: Files and subdirectories per directory.
+        :exceptions: None.
+    '''
+    pending: list[Path] = [root / PRO_NAME]
+    created: int = 0
+
+    while created < files:
+        directory: Path = pending.pop(0)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        for index in range(min(fanout, files - created)):
+            (directory / f'_module{index}.py').touch()
+            created += 1
+
+        pending.extend(directory / f'Sub{index}' for index in range(fanout))
+
+
+def _recursive_tree(dir_path: Path, prefix: str = '') -> tuple[list[str], int, int]:
+    '''
+        Builds tree lines with recursive Path.iterdir walk (previous implementation).
+
+        :param dir_path: Directory path.
+        :param prefix: Current indentation prefix.
+        :return: Tuple containing tree lines list, directory count, and file count.
+        :exceptions: None.
+    '''
+    entries = sorted(
+        (entry for entry in dir_path.iterdir()
+         if entry.name != '__pycache__' and not entry.name.startswith('.')),
+        key=lambda entry: entry.name.lstrip('_').lower()
+    )
+    lines: list[str] = []
+    num_dirs: int = 0
+    num_files: int = 0
+
+    for index, entry in enumerate(entries):
+        is_last: bool = index == len(entries) - 1
+        connector: str = '└── ' if is_last else '├── '
+
+        if entry.is_dir():
+            num_dirs += 1
+            lines.append(f'{prefix}{connector}{entry.name}/\n')
+            sub_lines, sub_dirs, sub_files = _recursive_tree(
+                entry, prefix + ('    ' if is_last else '│\xa0\xa0 ')
+            )
+            lines.extend(sub_lines)
+            num_dirs += sub_dirs
+            num_files += sub_files
+        else:
+            num_files += 1
+            lines.append(f'{prefix}{connector}{entry.name}\n')
+
+    return lines, num_dirs, num_files
+
+
+def bench_tree(args: Namespace) -> dict[str, float]:
+    '''
+        Compares recursive pathlib walk with the scandir tree walker.
+
+        :param args: Parsed benchmark arguments.
+        :return: Best time in seconds per variant.
+        :exceptions: None.
+    '''
+    make_tree(Path('.'), args.files)
+    recursive: list[float] = []
+    walker: list[float] = []
+
+    for _ in range(args.repeat):
+        start: float = perf_counter()
+        lines, num_dirs, num_files = _recursive_tree(Path(PRO_NAME), '         ')
+        recursive.append(perf_counter() - start)
+        start = perf_counter()
+        tree: tuple[list[str], int, int] = generate_tree_lines(PRO_NAME)
+        walker.append(perf_counter() - start)
+
+        if tree != ([f'    {PRO_NAME}/\n', *lines], num_dirs + 1, num_files):
+            raise AssertionError('tree walker output differs from recursive walk')
+
+    return {'pathlib_recursive': min(recursive), 'scandir_walker': min(walker)}
+
+
+def make_summary_report(modules: int) -> dict[str, object]:
+    '''
+        Creates summary report dict as returned by build_reports.
+
+        :param modules: Number of files in the report.
+        :return: Coverage data report in dict format (files[*].summary and totals).
+        :exceptions: None.
+    '''
+    summary: Callable[[int], dict[str, object]] = lambda index: {
+        'covered_lines': 100 - index % 7, 'num_statements': 120, 'percent_covered': 83.3,
+        'percent_covered_display': str(80 + index % 20), 'missing_lines': 20 + index % 7,
+        'excluded_lines': 0,
+    }
+
+    return {
+        'files': {f'{PRO_NAME}/module{index}.py': {'summary': summary(index)} for index in range(modules)},
+        'totals': summary(modules),
+    }
+
+
+def _dict_rows(
+    coverage: dict[str, object], resolver: PackageRootResolver
+) -> list[tuple[str, object, object, object]]:
+    '''
+        Computes coverage table rows from report dict (previous implementation).
+
+        :param coverage: Coverage data report in dict format.
+        :param resolver: Package root resolver.
+        :return: Row per file followed by the total row.
+        :exceptions: None.
+    '''
+    stmts, miss, cover = 'num_statements', 'missing_lines', 'percent_covered_display'
+    rows: list[tuple[str, object, object, object]] = []
+
+    for name, file_summary in coverage['files'].items():
+        summary: dict[str, object] = file_summary['summary']
+        rows.append((resolver.module_path(name), summary[stmts], summary[miss], summary[cover]))
+
+    totals: dict[str, object] = coverage['totals']
+    rows.append(('Total', totals[stmts], totals[miss], totals[cover]))
+
+    return rows
+
+
+def _traced_size(build: Callable[[], object]) -> tuple[object, int]:
+    '''
+        Builds object and measures memory it keeps alive.
+
+        :param build: Builder of the object.
+        :return: Built object and bytes kept alive by it.
+        :exceptions: None.
+    '''
+    tracemalloc.start()
+
+    try:
+        built: object = build()
+        return built, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_summary(args: Namespace) -> dict[str, float]:
+    '''
+        Compares rendering rows from report dict with the summary model.
+
+        :param args: Parsed benchmark arguments.
+        :return: Best time in seconds and kept bytes per file per variant.
+        :exceptions: None.
+    '''
+    Path(PRO_NAME).mkdir()
+    (Path(PRO_NAME) / '__init__.py').touch()
+    report, dict_size = _traced_size(lambda: make_summary_report(args.modules))
+    model, model_size = _traced_size(lambda: CoverageSummary.from_report(report))
+    resolver = PackageRootResolver()
+    expected: list[tuple[str, object, object, object]] = _dict_rows(report, resolver)
+    dict_path: list[float] = []
+    model_path: list[float] = []
+
+    for _ in range(args.repeat):
+        start: float = perf_counter()
+        _dict_rows(report, resolver)
+        dict_path.append(perf_counter() - start)
+        start = perf_counter()
+        rows: list[tuple[str, object, object, object]] = _coverage_rows(model, resolver)
+        model_path.append(perf_counter() - start)
+
+        if rows != expected:
+            raise AssertionError('summary model rows differ from report dict rows')
+
+    return {
+        'dict_rows': min(dict_path), 'model_rows': min(model_path),
+        'dict_bytes_per_file': dict_size / args.modules, 'model_bytes_per_file': model_size / args.modules,
+    }
+
+
+def bench_history(args: Namespace) -> dict[str, float]:
+    '''
+        Times appending runs to the history store and querying it.
+
+        :param args: Parsed benchmark arguments.
+        :return: Best time in seconds per operation.
+        :exceptions: None.
+    '''
+    report: dict[str, object] = make_summary_report(args.modules)
+    store = HistoryStore()
+    record: list[float] = []
+
+    for index in range(args.runs):
+        summary: CoverageSummary = CoverageSummary.from_report(report)
+        summary.covered[index % args.modules] = str(index % 100)
+        start: float = perf_counter()
+        store.record(PRO_NAME, summary)
+        record.append(perf_counter() - start)
+
+    return {
+        'record_run': min(record),
+        'trends_10_runs': _best(lambda: store.trends(PRO_NAME, 10), args.repeat),
+        'trends_one_module': _best(
+            lambda: store.trends(PRO_NAME, args.runs, f'{PRO_NAME}/module1.py'), args.repeat
+        ),
+        'drops_latest': _best(lambda: store.drops(PRO_NAME), args.repeat),
+    }
+
+
+def bench_covers(args: Namespace) -> dict[str, float]:
+    '''
+        Times building the who-covers index and querying lines.
+
+        Every test covers two lines of one module and the first line of a
+        common module, which is therefore covered by all tests.
+
+        :param args: Parsed benchmark arguments.
+        :return: Best time in seconds per operation.
+        :exceptions: None.
+    '''
+    data_file: str = f'.coverage.{PRO_NAME}'
+    data = CoverageData(basename=data_file)
+
+    for index in range(args.tests):
+        data.set_context(f'tests.bench_test.BenchTest.test_{index}')
+        data.add_lines({
+            f'/src/module{index % args.modules}.py': {1, 2 + index % 50}, '/src/common.py': {1}
+        })
+
+    covers = CoverIndex(data_file)
+
+    return {
+        'build_index': _best(lambda: covers.build(data), args.repeat),
+        'line_few_tests': _best(lambda: covers.tests_at('/src/module1.py', 3), args.repeat),
+        'line_all_tests': _best(lambda: covers.tests_at('/src/common.py', 1), args.repeat),
+        'line_contexts_api': _best(lambda: data.contexts_by_lineno('/src/module1.py')[3], args.repeat),
+        'file_tests': _best(lambda: covers.tests_of({'/src/module1.py'}), args.repeat),
+    }
+
+
+def make_suite_project(case: ATSCoverageBaseTestCase, modules: int, depth: int) -> None:
+    '''
+        Adds modules spread over nested subpackages to the base test project.
+
+        :param case: Base test case after setUp (current directory is its project).
+        :param modules: Number of added modules.
+        :param depth: Package nesting levels (1 keeps modules in the package).
+        :exceptions: None.
+    '''
+    levels: list[Path] = [case.pkg_dir]
+
+    for level in range(1, depth):
+        levels.append(levels[-1] / f'level{level}')
+        levels[-1].mkdir()
+        (levels[-1] / '__init__.py').touch()
+
+    names: list[str] = []
+
+    for index in range(modules):
+        level_dir: Path = levels[index % depth]
+        (level_dir / f'bench{index}.py').write_text(SUITE_MODULE_BODY, encoding='utf-8')
+        names.append('.'.join((*level_dir.parts, f'bench{index}')))
+
+    (case.test_dir / 'bench_test.py').write_text(SUITE_TEST_BODY.format(modules=names), encoding='utf-8')
+    Path('docs/source').mkdir(parents=True)
+
+
+def _best(call: Callable[[], object], repeat: int, reset: Callable[[], object] | None = None) -> float:
+    '''
+        Times call and keeps the best of repetitions.
+
+        :param call: Timed call.
+        :param repeat: Repetitions.
+        :param reset: Untimed call restoring inputs before each repetition or None.
+        :return: Best time in seconds.
+        :exceptions: None.
+    '''
+    times: list[float] = []
+
+    for _ in range(repeat):
+        if reset is not None:
+            reset()
+
+        start: float = perf_counter()
+        call()
+        times.append(perf_counter() - start)
+
+    return min(times)
+
+
+def _suite_point(modules: int, depth: int, repeat: int) -> dict[str, float]:
+    '''
+        Times public entry points on one synthetic project.
+
+        :param modules: Number of modules in the project.
+        :param depth: Package nesting levels.
+        :param repeat: Repetitions (best time is kept).
+        :return: Best time in seconds per entry point.
+        :exceptions: None.
+    '''
+    case = ATSCoverageBaseTestCase()
+    case.setUp()
+
+    try:
+        make_suite_project(case, modules, depth)
+        reset_readme: Callable[[], object] = lambda: case.readme_path.write_text(
+            case.readme_content, encoding='utf-8'
+        )
+
+        with patch.dict(run_coverage.__globals__, {'stdout': StringIO()}), \
+                patch.dict(build_reports.__globals__, {'stdout': StringIO()}), redirect_stderr(StringIO()):
+            start: float = perf_counter()
+            run_coverage(SUITE_PRO_NAME, reports={'json': ['benchmark']})
+            results: dict[str, float] = {'run_coverage': perf_counter() - start}
+
+        report_file: str = f'{SUITE_PRO_NAME}.json'
+        report: dict[str, object] = load_report(report_file)
+        results['load_report'] = _best(lambda: load_report(report_file), repeat)
+        results['update_readme'] = _best(lambda: update_readme(report), repeat, reset_readme)
+        results['update_index_coverage'] = _best(
+            lambda: update_index_coverage(report), repeat,
+            lambda: Path('docs/source/coverage_table.csv').unlink(missing_ok=True)
+        )
+        results['generate_tree_lines'] = _best(lambda: generate_tree_lines(SUITE_PRO_NAME), repeat)
+        results['update_structure'] = _best(lambda: update_structure(SUITE_PRO_NAME), repeat, reset_readme)
+
+    finally:
+        case.tearDown()
+
+        for name in list(sys.modules):
+            if name.startswith(SUITE_PRO_NAME):
+                sys.modules.pop(name)
+
+    return results
+
+
+def bench_suite(args: Namespace) -> dict[str, float]:
+    '''
+        Times load_report, updaters, tree walker and run_coverage per scale and depth.
+
+        :param args: Parsed benchmark arguments.
+        :return: Best time in seconds per entry point, scale and depth.
+        :exceptions: None.
+    '''
+    results: dict[str, float] = {}
+
+    for modules in args.scales:
+        for depth in args.depths:
+            point: dict[str, float] = _suite_point(modules, depth, args.repeat)
+            results.update({f'{entry} m={modules} d={depth}': value for entry, value in point.items()})
+
+    return results
+
+
+def _fresh_interpreter(argv: list[str], repeat: int, inner: bool = False) -> float:
+    '''
+        Times command in fresh interpreters and keeps the median of repetitions.
+
+        The median (not the best time) is kept, so a single lucky or slow
+        interpreter start does not decide whether the budget is kept.
+
+        :param argv: Interpreter arguments.
+        :param repeat: Repetitions (at least STARTUP_REPEAT are run).
+        :param inner: Use seconds printed by the command instead of process wall time.
+        :return: Median time in seconds.
+        :exceptions: None.
+    '''
+    env: dict[str, str] = {**os.environ, 'PYTHONPATH': ROOT_DIR}
+    times: list[float] = []
+
+    for _ in range(max(repeat, STARTUP_REPEAT)):
+        start: float = perf_counter()
+        res = subprocess.run([sys.executable, *argv], capture_output=True, text=True, check=True, env=env)
+        times.append(float(res.stdout) if inner else perf_counter() - start)
+
+    return median(times)
+
+
+def bench_startup(args: Namespace) -> dict[str, float]:
+    '''
+        Times imports before first useful work of refresh and of test runs.
+
+        Import times are measured inside fresh interpreters (interpreter
+        startup excluded), process times include it. Refresh imports over
+        STARTUP_BUDGET fail the benchmark run (see over_budget).
+
+        :param args: Parsed benchmark arguments.
+        :return: Median time in seconds per variant.
+        :exceptions: None.
+    '''
+    case = ATSCoverageBaseTestCase()
+    case.setUp()
+
+    try:
+        Path('docs/source').mkdir(parents=True)
+        Path('docs/source/index.rst').write_text(
+            '.. Tool structure\n.. details:: Structure\n.. end details\n', encoding='utf-8'
+        )
+
+        with patch.dict(run_coverage.__globals__, {'stdout': StringIO()}), \
+                patch.dict(build_reports.__globals__, {'stdout': StringIO()}), redirect_stderr(StringIO()):
+            run_coverage(SUITE_PRO_NAME, reports={'json': ['benchmark']})
+
+        results: dict[str, float] = {
+            'import_refresh': _fresh_interpreter(['-c', IMPORT_CODE.format(module='ats_cli')], args.repeat, True),
+            'import_run': _fresh_interpreter(['-c', IMPORT_CODE.format(module='ats_coverage')], args.repeat, True),
+            'process_empty': _fresh_interpreter(['-c', 'pass'], args.repeat),
+            'process_refresh': _fresh_interpreter(
+                [f'{ROOT_DIR}/ats_cli.py', 'refresh', SUITE_PRO_NAME], args.repeat
+            ),
+        }
+
+    finally:
+        case.tearDown()
+
+        for name in list(sys.modules):
+            if name.startswith(SUITE_PRO_NAME):
+                sys.modules.pop(name)
+
+    return results
+
+
+def over_budget(results: dict[str, dict[str, float]]) -> list[str]:
+    '''
+        Finds results over their fixed budget (refresh imports).
+
+        :param results: Results per benchmark and variant.
+        :return: Description per result over budget (empty if none).
+        :exceptions: None.
+    '''
+    value: float | None = results.get('startup', {}).get('import_refresh')
+
+    if value is None or value <= STARTUP_BUDGET:
+        return []
+
+    return [f'startup import_refresh: {value:.4f}s over budget {STARTUP_BUDGET:.4f}s']
+
+
+def compare_results(
+    baseline: dict[str, dict[str, float]], current: dict[str, dict[str, float]],
+    tolerance: float = REGRESSION_TOLERANCE
+) -> list[str]:
+    '''
+        Finds results slower (or bigger) than baseline beyond tolerance.
+
+        :param baseline: Saved results per benchmark and variant.
+        :param current: New results per benchmark and variant.
+        :param tolerance: Allowed relative growth.
+        :return: Description per regression (empty if none).
+        :exceptions: None.
+    '''
+    regressions: list[str] = []
+
+    for name, variants in current.items():
+        for variant, value in variants.items():
+            base: float | None = baseline.get(name, {}).get(variant)
+
+            if base is None or value <= base * (1 + tolerance):
+                continue
+
+            if not variant.endswith('_bytes_per_file') and value - base < MIN_DELTA:
+                continue
+
+            regressions.append(f'{name} {variant}: {base:.4f} -> {value:.4f} (+{value / base - 1:.0%})')
+
+    return regressions
+
+
+def _load_results(file_path: str) -> dict[str, dict[str, float]]:
+    '''
+        Loads results saved with --save.
+
+        :param file_path: Results file path.
+        :return: Results per benchmark and variant.
+        :exceptions:
+            | OSError: The file cannot be read.
+            | ValueError: The file is not valid JSON.
+    '''
+    with open(file_path, 'r', encoding='utf-8') as results_file:
+        return json.load(results_file)['results']
+
+
+def _report_regressions(regressions: list[str]) -> None:
+    '''
+        Prints regressions and exits with status 1 if there are any.
+
+        :param regressions: Description per regression.
+        :exceptions: None.
+    '''
+    for regression in regressions:
+        print(f'REGRESSION {regression}')
+
+    if regressions:
+        sys.exit(1)
+
+    print('No regressions')
+
+
+def _parse_counts(value: str) -> list[int]:
+    '''
+        Parses comma separated positive counts.
+
+        :param value: Comma separated counts.
+        :return: Counts.
+        :exceptions:
+            | ValueError: A count is not a positive integer.
+    '''
+    counts: list[int] = [int(item) for item in value.split(',')]
+
+    if any(count < 1 for count in counts):
+        raise ValueError(f'counts must be positive, not {value}')
+
+    return counts
+
+
+BENCHMARKS: dict[str, Callable[[Namespace], dict[str, float]]] = {
+    'reports': bench_reports,
+    'tree': bench_tree,
+    'summary': bench_summary,
+    'history': bench_history,
+    'covers': bench_covers,
+    'suite': bench_suite,
+    'startup': bench_startup,
+}
+
+
+def main() -> None:
+    '''
+        Runs selected benchmarks in a temporary directory or compares saved results.
+
+        :exceptions: None.
+    '''
+    if sys.argv[1:2] == ['compare']:
+        compare = ArgumentParser(prog='ats_benchmark compare', description='Flag regressions against baseline')
+        compare.add_argument('baseline', help='results saved with --save')
+        compare.add_argument('current', help='results saved with --save')
+        compare.add_argument('--tolerance', type=float, default=REGRESSION_TOLERANCE, help='allowed relative growth')
+        files: Namespace = compare.parse_args(sys.argv[2:])
+        _report_regressions(
+            compare_results(_load_results(files.baseline), _load_results(files.current), files.tolerance)
+        )
+        return
+
+    parser = ArgumentParser(prog='ats_benchmark')
+    parser.add_argument('benchmarks', nargs='*', default=list(BENCHMARKS), help=f'any of {list(BENCHMARKS)}')
+    parser.add_argument('--modules', type=int, default=200, help='modules in synthetic package')
+    parser.add_argument('--files', type=int, default=20000, help='files in synthetic tree')
+    parser.add_argument('--runs', type=int, default=100, help='runs recorded in history store')
+    parser.add_argument('--tests', type=int, default=50000, help='tests recorded with contexts')
+    parser.add_argument('--scales', type=_parse_counts, default=[10, 100, 1000], help='suite module counts')
+    parser.add_argument('--depths', type=_parse_counts, default=[1, 5, 15], help='suite package depths')
+    parser.add_argument(
+        '--repeat', type=int, default=3,
+        help=f'repetitions (best time is kept, startup keeps the median of at least {STARTUP_REPEAT})'
+    )
+    parser.add_argument('--save', metavar='FILE', help='save results as JSON')
+    parser.add_argument('--baseline', metavar='FILE', help='flag regressions against saved results')
+    parser.add_argument('--tolerance', type=float, default=REGRESSION_TOLERANCE, help='allowed relative growth')
+    args: Namespace = parser.parse_args()
+
+    for name in args.benchmarks:
+        if name not in BENCHMARKS:
+            parser.error(f'unknown benchmark {name!r}')
+
+    old_cwd: str = os.getcwd()
+    all_results: dict[str, dict[str, float]] = {}
+
+    for name in args.benchmarks:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.chdir(temp_dir)
+            sys.path.insert(0, temp_dir)
+
+            try:
+                results: dict[str, float] = BENCHMARKS[name](args)
+            finally:
+                sys.path.remove(temp_dir)
+                os.chdir(old_cwd)
+
+        all_results[name] = results
+
+        for variant, value in results.items():
+            unit: str = 'B' if variant.endswith('_bytes_per_file') else 's'
+            print(f'{name:>10} {variant:<36} {value:9.4f}{unit}')
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as results_file:
+            json.dump(
+                {'python': python_version(), 'platform': platform(), 'results': all_results},
+                results_file, indent=4
+            )
+
+    regressions: list[str] = over_budget(all_results)
+
+    if args.baseline:
+        regressions.extend(compare_results(_load_results(args.baseline), all_results, args.tolerance))
+
+    if regressions or args.baseline:
+        _report_regressions(regressions)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_cache_test.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines whole-run result cache test cases.
+'''
+
+from __future__ import annotations
+
+import sys
+import unittest
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from ats_cache import ResultCache, tool_fingerprint
+from ats_commands import _record_history
+from ats_coverage import run_coverage, durations_file
+from ats_history import HISTORY_FILE
+from ats_summary import CoverageSummary
+from ats_timing import DURATIONS
+from tests.ats_base_test import ATSCoverageBaseTestCase
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__: list[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__: str = '5.0.0'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+REPORTS: dict[str, list[str]] = {"term": ["cli"], "json": ["cli"]}
+
+
+class ATSCacheTestCase(ATSCoverageBaseTestCase):
+    '''
+        Defines class ATSCacheTestCase with result cache tests.
+        Tests hits, misses on content changes and LRU eviction.
+
+        It defines:
+
+            :attributes: None.
+            :methods:
+                | test_identical_run_is_reused - Test second identical run restores outputs without running.
+                | test_changes_miss - Test changed tests, tool sources or missing artifacts miss the cache.
+                | test_eviction_keeps_recent_entries - Test size bound evicts least recently used entries.
+    '''
+
+    def test_identical_run_is_reused(self) -> None:
+        '''
+            Test second identical run restores outputs without running.
+
+            :exceptions: None.
+        '''
+        cache = ResultCache()
+        first = run_coverage("dummy_package", reports=REPORTS, cache=cache)
+        durations = Path(durations_file("dummy_package")).read_text(encoding="utf-8")
+        Path("dummy_package.json").unlink()
+        Path(".coverage.dummy_package").unlink()
+        Path(durations_file("dummy_package")).unlink()
+        DURATIONS.reset()
+        output = StringIO()
+        failing = patch.dict(run_coverage.__globals__, {
+            "stdout": output,
+            "_run_tests_and_collect": lambda *args, **kwargs: self.fail("tests were run")
+        })
+
+        with failing, patch("ats_cache.stdout", output):
+            second = run_coverage("dummy_package", reports=REPORTS, cache=cache)
+
+        self.assertEqual(second, {**first, "cached": True})
+        self.assertTrue(Path("dummy_package.json").is_file())
+        self.assertTrue(Path(".coverage.dummy_package").is_file())
+        self.assertEqual(Path(durations_file("dummy_package")).read_text(encoding="utf-8"), durations)
+        self.assertEqual(len(DURATIONS.tests), 2)
+        self.assertIn("--- Cache hit", output.getvalue())
+        self.assertIn("--- Slowest 2 of 2 tests ---", output.getvalue())
+        self.assertIn("dummy_package/submodule.py", output.getvalue())
+
+        summary = CoverageSummary.from_report(second)
+        self.assertTrue(summary.cached)
+        self.assertFalse(CoverageSummary.from_report(first).cached)
+        output = StringIO()
+
+        with patch.dict(_record_history.__globals__, {"stdout": output}):
+            _record_history({}, "dummy_package", summary)
+
+        self.assertIn("cached result, no run recorded", output.getvalue())
+        self.assertFalse(Path(HISTORY_FILE).exists())
+
+    def test_changes_miss(self) -> None:
+        '''
+            Test changed tests, tool sources or missing artifacts miss the cache.
+
+            :exceptions: None.
+        '''
+        cache = ResultCache()
+        run_coverage("dummy_package", reports=REPORTS, cache=cache)
+        key = cache.key("dummy_package")
+        self.assertIsNone(cache.lookup(key, "dummy_package", ".coverage.dummy_package", ["html"]))
+
+        (self.test_dir / "dummy_test.py").write_text(
+            (self.test_dir / "dummy_test.py").read_text(encoding="utf-8") + "\n# changed\n",
+            encoding="utf-8"
+        )
+        changed = cache.key("dummy_package")
+        self.assertNotEqual(changed, key)
+        Path("README.md").write_text("docs only\n", encoding="utf-8")
+        self.assertEqual(cache.key("dummy_package"), changed)
+
+        self.assertEqual(len(tool_fingerprint()), 40)
+
+        with patch("ats_cache.tool_fingerprint", return_value="changed tool"):
+            self.assertNotEqual(cache.key("dummy_package"), changed)
+
+    def test_eviction_keeps_recent_entries(self) -> None:
+        '''
+            Test size bound evicts least recently used entries.
+
+            :exceptions: None.
+        '''
+        run_coverage("dummy_package", reports={"json": ["cli"]})
+        summary = {"files": {}, "totals": {}}
+        cache = ResultCache(max_bytes=1)
+        cache.store("old", "dummy_package", ".coverage.dummy_package", summary, {"json": ""})
+        cache.store("new", "dummy_package", ".coverage.dummy_package", summary, {"json": ""})
+        self.assertEqual([entry.name for entry in cache.cache_dir.iterdir()], ["new"])
+        self.assertEqual(
+            cache.lookup("new", "dummy_package", ".coverage.dummy_package", ["json"]), {**summary, "cached": True}
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_cli_test.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines fast-start entry point and refresh subcommand test cases.
+'''
+
+from __future__ import annotations
+
+import os
+import sys
+import subprocess
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from ats_coverage import run_coverage
+from ats_summary import summary_file
+from tests.ats_base_test import ATSCoverageBaseTestCase
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__: list[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__: str = '5.0.0'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+ROOT_DIR = str(Path(__file__).parent.parent)
+CLI_PATH = str(Path(ROOT_DIR) / "ats_cli.py")
+SCRIPT_PATH = str(Path(ROOT_DIR) / "ats_coverage.py")
+REFRESH_CODE = (
+    "import sys\n"
+    "sys.argv = ['ats_coverage', 'refresh', 'dummy_package']\n"
+    "import ats_cli\n"
+    "try:\n"
+    "    ats_cli.main()\n"
+    "except SystemExit as exc:\n"
+    "    print(exc.code, sorted({'coverage', 'unittest', 'ats_coverage', 'configparser', 'pathlib'} & set(sys.modules)))\n"
+)
+
+
+class ATSCliTestCase(ATSCoverageBaseTestCase):
+    '''
+        Defines class ATSCliTestCase with fast-start entry point tests.
+        Tests refresh from saved report, its imports, errors and delegation.
+
+        It defines:
+
+            :attributes: None.
+            :methods:
+                | setUp - Add docs directory with index.rst.
+                | test_refresh_without_test_imports - Test refresh updates docs without coverage or unittest.
+                | test_refresh_errors - Test refresh usage and missing report errors.
+                | test_other_commands_delegate - Test other commands run tests and save summary for refresh in the state directory.
+    '''
+
+    def setUp(self) -> None:
+        '''
+            Add docs directory with index.rst.
+
+            :exceptions: None.
+        '''
+        super().setUp()
+        docs_dir = Path("docs/source")
+        docs_dir.mkdir(parents=True)
+        (docs_dir / "index.rst").write_text(
+            ".. Tool structure\n.. details:: Structure\n.. end details\n", encoding="utf-8"
+        )
+
+    def test_refresh_without_test_imports(self) -> None:
+        '''
+            Test refresh updates docs without coverage or unittest.
+
+            :exceptions: None.
+        '''
+        run_coverage("dummy_package", reports={"json": ["test"]})
+        res = subprocess.run(
+            ["python3", "-c", REFRESH_CODE], capture_output=True, text=True, check=True,
+            env={**os.environ, "PYTHONPATH": ROOT_DIR}
+        )
+        self.assertIn("--- Docs dummy_package: README.md, docs/source/coverage_table.csv ---", res.stdout)
+        self.assertIn("no saved summary .ats_coverage/dummy_package.summary.json", res.stderr)
+        self.assertTrue(res.stdout.endswith("0 []\n"))
+        self.assertNotIn("existing coverage line 1", self.readme_path.read_text(encoding="utf-8"))
+        self.assertTrue(Path("docs/source/coverage_table.csv").is_file())
+        res = subprocess.run(
+            ["python3", CLI_PATH, "refresh", "dummy_package"], capture_output=True, text=True, check=True
+        )
+        self.assertEqual(res.stdout, "--- Docs dummy_package: unchanged ---\n")
+        self.assertEqual(res.stderr, "")
+
+    def test_refresh_errors(self) -> None:
+        '''
+            Test refresh usage and missing report errors.
+
+            :exceptions: None.
+        '''
+        for args in ([], ["--jobs", "2", "dummy_package"]):
+            res = subprocess.run(["python3", CLI_PATH, "refresh", *args], capture_output=True, text=True)
+            self.assertEqual(res.returncode, 128)
+            self.assertIn("Usage: ats_coverage refresh <project_name>...", res.stderr)
+
+        res = subprocess.run(["python3", SCRIPT_PATH, "refresh", "dummy_package"], capture_output=True, text=True)
+        self.assertEqual(res.returncode, 128)
+        self.assertIn("dummy_package.json does not exist", res.stderr)
+        Path("dummy_package.json").write_text('{"meta": {}}', encoding="utf-8")
+        res = subprocess.run(["python3", CLI_PATH, "refresh", "dummy_package"], capture_output=True, text=True)
+        self.assertEqual(res.returncode, 128)
+        self.assertIn("Report dummy_package.json has no coverage summary", res.stderr)
+
+    def test_other_commands_delegate(self) -> None:
+        '''
+            Test other commands run tests and save summary for refresh in the state directory.
+
+            :exceptions: None.
+        '''
+        res = subprocess.run(
+            ["python3", CLI_PATH, "--contexts", "dummy_package"], capture_output=True, text=True, check=True
+        )
+        self.assertIn("--- Test Report ---", res.stdout)
+        self.assertFalse(Path("dummy_package.json").exists())
+        self.assertTrue(Path(summary_file("dummy_package")).is_file())
+        self.assertEqual(list(Path(".").glob("dummy_package.*")) + list(Path(".").glob("*.covers")), [])
+        res = subprocess.run(
+            ["python3", SCRIPT_PATH, "refresh", "dummy_package"], capture_output=True, text=True, check=True
+        )
+        self.assertEqual(res.stdout, "--- Docs dummy_package: unchanged ---\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
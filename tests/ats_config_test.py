@@ -0,0 +1,93 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_config_test.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines ats_coverage config loading test cases.
+'''
+
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from ats_config import load_config, config_list, config_int
+from tests.ats_base_test import ATSCoverageBaseTestCase
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__: list[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__: str = '5.0.0'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class ATSConfigTestCase(ATSCoverageBaseTestCase):
+    '''
+        Defines class ATSConfigTestCase with config loading tests.
+        Tests reading the [ats_coverage] section of .coveragerc.
+
+        It defines:
+
+            :attributes: None.
+            :methods:
+                | test_load_config_missing - Test missing file or section gives empty config.
+                | test_load_config_list - Test list options split on commas and newlines.
+                | test_config_int - Test integer options and their validation.
+    '''
+
+    def test_load_config_missing(self) -> None:
+        '''
+            Test missing file or section gives empty config.
+
+            :exceptions: None.
+        '''
+        self.assertEqual(load_config(), {})
+        Path(".coveragerc").write_text("[report]\nshow_missing = true\n", encoding="utf-8")
+        self.assertEqual(load_config(), {})
+        self.assertIsNone(config_list({}, "reports"))
+
+    def test_load_config_list(self) -> None:
+        '''
+            Test list options split on commas and newlines.
+
+            :exceptions: None.
+        '''
+        Path(".coveragerc").write_text(
+            "[report]\n\n[ats_coverage]\nreports = term, xml\n    html\n", encoding="utf-8"
+        )
+        self.assertEqual(config_list(load_config(), "reports"), ["term", "xml", "html"])
+
+    def test_config_int(self) -> None:
+        '''
+            Test integer options and their validation.
+
+            :exceptions: None.
+        '''
+        self.assertIsNone(config_int({}, "tree_max_depth"))
+        self.assertEqual(config_int({"tree_max_depth": " 3 "}, "tree_max_depth"), 3)
+
+        with self.assertRaises(ValueError):
+            config_int({"tree_max_depth": "-1"}, "tree_max_depth")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_core_test.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines coverage core selection test cases.
+'''
+
+from __future__ import annotations
+
+import sys
+import unittest
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from ats_core import check_core, resolve_core
+from ats_coverage import run_coverage
+from tests.ats_base_test import ATSCoverageBaseTestCase
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__: list[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__: str = '5.0.0'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class ATSCoreTestCase(ATSCoverageBaseTestCase):
+    '''
+        Defines class ATSCoreTestCase with core selection tests.
+        Tests validation, explicit fallback and reporting of the used core.
+
+        It defines:
+
+            :attributes: None.
+            :methods:
+                | test_check_core - Test unknown core is rejected.
+                | test_resolve_core_fallback - Test sysmon falls back on incompatible features.
+                | test_run_coverage_reports_core - Test run output reports the used core.
+    '''
+
+    def test_check_core(self) -> None:
+        '''
+            Test unknown core is rejected.
+
+            :exceptions: None.
+        '''
+        self.assertEqual(check_core("pytrace"), "pytrace")
+
+        with self.assertRaises(ValueError):
+            check_core("fasttrace")
+
+    def test_resolve_core_fallback(self) -> None:
+        '''
+            Test sysmon falls back on incompatible features.
+
+            :exceptions: None.
+        '''
+        self.assertEqual(resolve_core(None, True, True), (None, ""))
+        self.assertEqual(resolve_core("pytrace", True, True), ("pytrace", ""))
+
+        with patch("ats_core.version_info", (3, 11)):
+            self.assertEqual(resolve_core("sysmon", False, False)[0], "ctrace")
+
+        with patch("ats_core.version_info", (3, 12)):
+            self.assertEqual(resolve_core("sysmon", False, False), ("sysmon", ""))
+            core, reason = resolve_core("sysmon", True, False)
+            self.assertEqual(core, "ctrace")
+            self.assertIn("branches", reason)
+
+        with patch("ats_core.version_info", (3, 14)):
+            self.assertEqual(resolve_core("sysmon", True, False), ("sysmon", ""))
+            self.assertIn("contexts", resolve_core("sysmon", False, True)[1])
+
+        with patch("ats_core.find_spec", return_value=None):
+            self.assertEqual(resolve_core("ctrace", False, False)[0], "pytrace")
+
+    def test_run_coverage_reports_core(self) -> None:
+        '''
+            Test run output reports the used core.
+
+            :exceptions: None.
+        '''
+        output = StringIO()
+
+        with patch.dict(run_coverage.__globals__, {"stdout": output}):
+            run_coverage("dummy_package", reports={}, core="pytrace")
+
+        self.assertIn("--- Core: pytrace, tests traced in", output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -72,8 +72,9 @@ class ATSCoverageExecutionTestCase(ATSCoverageBaseTestCase):
 
         with patch("ats_coverage.check_exists") as mock_check, \
              patch("ats_coverage.Coverage") as mock_cov, \
-             patch("ats_coverage._run_tests_and_collect") as mock_run:
-            
+             patch("ats_coverage._run_tests_and_collect") as mock_run, \
+             patch("ats_coverage.build_reports") as mock_reports:
+
             mock_instance = MagicMock()
             mock_cov.return_value = mock_instance
 
@@ -86,13 +87,16 @@ class ATSCoverageExecutionTestCase(ATSCoverageBaseTestCase):
                 data_file=".coverage.dummy_package"
             )
             mock_instance.start.assert_called_once()
-            mock_run.assert_called_once_with("dummy_package")
+            mock_run.assert_called_once_with("dummy_package", shard=None)
             mock_instance.stop.assert_called_once()
             mock_instance.save.assert_called_once()
-            mock_instance.report.assert_called_once()
-            mock_instance.json_report.assert_called_once_with(outfile="dummy_package.json")
-            mock_instance.xml_report.assert_called_once_with(outfile="dummy_package.xml")
-            mock_instance.html_report.assert_called_once_with(directory="htmlcov")
+            mock_reports.assert_called_once_with(
+                mock_instance, "dummy_package", {
+                    "source": ["dummy_package"],
+                    "config_file": ".coveragerc",
+                    "data_file": ".coverage.dummy_package"
+                }, None, {}
+            )
 
 
 if __name__ == '__main__':
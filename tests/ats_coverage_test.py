@@ -175,7 +175,7 @@ class ATSCoverageCoreTestCase(ATSCoverageBaseTestCase):
             ".. end details\n",
             encoding="utf-8"
         )
-        subprocess.run(["python3", SCRIPT_PATH, "dummy_package"], check=True)
+        subprocess.run(["python3", SCRIPT_PATH, "--report", "json", "dummy_package"], check=True)
         report_file = "dummy_package.json"
         self.assertTrue(Path(report_file).exists())
 
@@ -227,7 +227,7 @@ class ATSCoverageReadmeTestCase(ATSCoverageBaseTestCase):
             ".. end details\n",
             encoding="utf-8"
         )
-        subprocess.run(["python3", SCRIPT_PATH, "dummy_package"], check=True)
+        subprocess.run(["python3", SCRIPT_PATH, "--report", "json", "dummy_package"], check=True)
         report_file = "dummy_package.json"
         report_data = load_report(report_file)
 
@@ -0,0 +1,139 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_covers_test.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines who-covers index test cases.
+'''
+
+from __future__ import annotations
+
+import sys
+import subprocess
+import unittest
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from ats_covers import CoverIndex, covers_file, write_who_covers
+from ats_coverage import run_coverage
+from ats_impact import plan_incremental
+from tests.ats_base_test import ATSCoverageBaseTestCase
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__: list[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__: str = '5.0.0'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+SCRIPT_PATH = str(Path(__file__).parent.parent / "ats_coverage.py")
+DATA_FILE = ".coverage.dummy_package"
+
+
+class ATSCoversTestCase(ATSCoverageBaseTestCase):
+    '''
+        Defines class ATSCoversTestCase with who-covers index tests.
+        Tests index build, line and file queries, CLI and test selection.
+
+        It defines:
+
+            :attributes: None.
+            :methods:
+                | test_index_answers_lines - Test index lists tests covering a line.
+                | test_main_who_covers - Test who-covers subcommand output and errors.
+                | test_incremental_plan_uses_index - Test incremental selection reads the index.
+    '''
+
+    def test_index_answers_lines(self) -> None:
+        '''
+            Test index lists tests covering a line.
+
+            :exceptions: None.
+        '''
+        run_coverage("dummy_package", contexts=True)
+        index = CoverIndex(DATA_FILE)
+        self.assertTrue(Path(covers_file(DATA_FILE)).is_file())
+        self.assertTrue(index.is_current())
+        submodule = str(Path("dummy_package/submodule.py").resolve())
+        self.assertEqual(
+            index.tests_at("dummy_package/submodule.py", 2),
+            {submodule: ["tests.dummy_test.DummyTest.test_add"]}
+        )
+        self.assertEqual(index.tests_at("submodule.py", 1), {submodule: []})
+        self.assertEqual(index.lines_of("dummy_package/submodule.py"), {submodule: {2: 1}})
+        self.assertEqual(
+            index.tests_of({submodule}), {submodule: {"tests.dummy_test.DummyTest.test_add"}}
+        )
+        stream = StringIO()
+        self.assertTrue(write_who_covers(stream, index, "dummy_package/__init__.py:2"))
+        self.assertIn("dummy_package/__init__.py:2 covered by 1 tests", stream.getvalue())
+        self.assertIn("tests.dummy_test.DummyTest.test_hello\n", stream.getvalue())
+        self.assertFalse(write_who_covers(StringIO(), index, "missing.py:1"))
+        run_coverage("dummy_package")
+        self.assertFalse(index.is_current())
+
+    def test_main_who_covers(self) -> None:
+        '''
+            Test who-covers subcommand output and errors.
+
+            :exceptions: None.
+        '''
+        run_coverage("dummy_package")
+        res = subprocess.run(
+            ["python3", SCRIPT_PATH, "who-covers", "dummy_package", "dummy_package/submodule.py:2"],
+            capture_output=True, text=True
+        )
+        self.assertEqual(res.returncode, 128)
+        self.assertIn("has no per-test contexts", res.stderr)
+        run_coverage("dummy_package", contexts=True)
+        Path(covers_file(DATA_FILE)).unlink()
+        res = subprocess.run(
+            [
+                "python3", SCRIPT_PATH, "who-covers", "dummy_package",
+                "dummy_package/submodule.py:2", "dummy_package/submodule.py"
+            ],
+            capture_output=True, text=True, check=True
+        )
+        self.assertIn("tests.dummy_test.DummyTest.test_add", res.stdout)
+        self.assertIn("dummy_package/submodule.py: 1 lines covered by tests", res.stdout)
+        self.assertTrue(CoverIndex(DATA_FILE).is_current())
+
+    def test_incremental_plan_uses_index(self) -> None:
+        '''
+            Test incremental selection reads the index.
+
+            :exceptions: None.
+        '''
+        run_coverage("dummy_package", incremental=True)
+        self.assertTrue(CoverIndex(DATA_FILE).is_current())
+        (self.pkg_dir / "submodule.py").write_text(
+            "def add(a: int, b: int) -> int:\n    return b + a\n", encoding="utf-8"
+        )
+
+        with patch("ats_impact.build_test_index", side_effect=AssertionError("index not used")):
+            plan = plan_incremental("dummy_package")
+
+        self.assertFalse(plan.full)
+        self.assertEqual(plan.tests, {"tests.dummy_test.DummyTest.test_add"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_history_test.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines coverage history store test cases.
+'''
+
+from __future__ import annotations
+
+import sys
+import sqlite3
+import subprocess
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from ats_history import HISTORY_FILE, HistoryStore, glob_to_like
+from ats_summary import CoverageSummary
+from tests.ats_base_test import ATSCoverageBaseTestCase
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__: list[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__: str = '5.0.0'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+SCRIPT_PATH = str(Path(__file__).parent.parent / "ats_coverage.py")
+
+
+def make_summary(covered: dict[str, str]) -> CoverageSummary:
+    '''
+        Creates summary model with covered percent per module.
+
+        :param covered: Covered percent (display string) per module path.
+        :return: Summary model.
+        :exceptions: None.
+    '''
+    summary = CoverageSummary()
+
+    for name, percent in covered.items():
+        summary.add(name, 10, 10 - int(percent) // 10, percent)
+
+    summary.total = (10 * len(covered), 0, '100')
+
+    return summary
+
+
+class ATSHistoryTestCase(ATSCoverageBaseTestCase):
+    '''
+        Defines class ATSHistoryTestCase with history store tests.
+        Tests recorded runs, module path reuse, trends, drops and the subcommand.
+
+        It defines:
+
+            :attributes: None.
+            :methods:
+                | test_record_and_query - Test runs are recorded with exact percents and queried by module and run.
+                | test_history_subcommand - Test command line runs are recorded and queried.
+    '''
+
+    def test_record_and_query(self) -> None:
+        '''
+            Test runs are recorded with exact percents and queried by module and run.
+
+            :exceptions: None.
+        '''
+        store = HistoryStore()
+        first = store.record('pkg', make_summary({'pkg/a.py': '100', 'pkg/b_c.py': '80'}), 1.0)
+        second = store.record(
+            'pkg', make_summary({'pkg/a.py': '50', 'pkg/b_c.py': '90', 'pkg/d.py': '70'})
+        )
+        store.record('other', make_summary({'pkg/a.py': '0'}))
+        self.assertEqual(store.runs('pkg', 10)[0][:2], (first, 1.0))
+        self.assertEqual([run[0] for run in store.runs('pkg', 10)], [first, second])
+
+        with sqlite3.connect(HISTORY_FILE) as connection:
+            self.assertEqual(connection.execute('SELECT COUNT(*) FROM modules').fetchone(), (3,))
+
+        self.assertEqual(
+            store.trends('pkg', 10),
+            {'pkg/a.py': {first: 100.0, second: 50.0}, 'pkg/b_c.py': {first: 80.0, second: 90.0},
+             'pkg/d.py': {second: 70.0}}
+        )
+        self.assertEqual(list(store.trends('pkg', 1, glob_to_like('*b_c*'))), ['pkg/b_c.py'])
+        self.assertEqual(store.trends('pkg', 10, glob_to_like('pkg/_.py')), {})
+        self.assertEqual(store.drops('pkg'), (first, second, [('pkg/a.py', 100.0, 50.0, -50.0)]))
+        self.assertEqual(store.drops('pkg', second, first)[2], [('pkg/b_c.py', 90.0, 80.0, -10.0)])
+
+        with self.assertRaises(ValueError):
+            store.drops('other')
+
+        other = store.runs('other', 1)[0][0]
+
+        with self.assertRaisesRegex(ValueError, f'Run {other} is not a recorded run of pkg'):
+            store.drops('pkg', first, other)
+
+        with self.assertRaisesRegex(ValueError, 'Run 99 is not a recorded run of pkg'):
+            store.drops('pkg', 99, second)
+
+        summary = CoverageSummary()
+        summary.add('pkg/e.py', 3, 1, '67')
+        summary.total = (3, 1, '67')
+        third = store.record('pkg', summary)
+        self.assertAlmostEqual(store.runs('pkg', 1)[0][4], 200 / 3)
+        self.assertAlmostEqual(store.trends('pkg', 1)['pkg/e.py'][third], 200 / 3)
+
+    def test_history_subcommand(self) -> None:
+        '''
+            Test command line runs are recorded and queried.
+
+            :exceptions: None.
+        '''
+        docs_dir = Path("docs/source")
+        docs_dir.mkdir(parents=True, exist_ok=True)
+        (docs_dir / "index.rst").write_text("Tool structure\n", encoding="utf-8")
+        res = subprocess.run(
+            ["python3", SCRIPT_PATH, "history", "dummy_package"], capture_output=True, text=True
+        )
+        self.assertEqual(res.returncode, 128)
+
+        for _ in range(2):
+            res = subprocess.run(
+                ["python3", SCRIPT_PATH, "--no-cache", "dummy_package"], capture_output=True, text=True
+            )
+            self.assertIn("--- History: run", res.stdout)
+
+        res = subprocess.run(
+            ["python3", SCRIPT_PATH, "history", "--module", "*submodule*", "dummy_package"],
+            capture_output=True, text=True, check=True
+        )
+        self.assertIn("--- History of dummy_package: 2 runs ---", res.stdout)
+        self.assertIn("dummy_package/submodule.py", res.stdout)
+        self.assertNotIn("dummy_package/__init__.py", res.stdout)
+        res = subprocess.run(
+            ["python3", SCRIPT_PATH, "history", "--drops", "dummy_package"],
+            capture_output=True, text=True, check=True
+        )
+        self.assertIn("--- Coverage drops of dummy_package from run 1 to run 2: 0 ---", res.stdout)
+
+
+if __name__ == '__main__':
+    unittest.main()
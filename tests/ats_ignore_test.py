@@ -0,0 +1,108 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_ignore_test.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines .gitignore style pattern test cases.
+'''
+
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from ats_ignore import IgnoreRules
+from tests.ats_base_test import ATSCoverageBaseTestCase
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__: list[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__: str = '5.0.0'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class ATSIgnoreTestCase(ATSCoverageBaseTestCase):
+    '''
+        Defines class ATSIgnoreTestCase with ignore rule tests.
+        Tests anchoring, directory only, wildcard and negated patterns.
+
+        It defines:
+
+            :attributes: None.
+            :methods:
+                | test_unanchored_and_anchored - Test patterns with and without slash.
+                | test_wildcards - Test single, double star and character classes.
+                | test_negation_and_base - Test last rule wins and nested ignore files.
+    '''
+
+    def test_unanchored_and_anchored(self) -> None:
+        '''
+            Test patterns with and without slash.
+
+            :exceptions: None.
+        '''
+        rules = IgnoreRules()
+        rules.add(['# comment\n', '\n', 'build/\n', '/dist\n', 'docs/out\n'])
+        self.assertTrue(rules.ignored('pkg/build', True))
+        self.assertFalse(rules.ignored('pkg/build', False))
+        self.assertTrue(rules.ignored('dist', True))
+        self.assertFalse(rules.ignored('pkg/dist', True))
+        self.assertTrue(rules.ignored('docs/out', False))
+        self.assertFalse(rules.ignored('pkg/docs/out', False))
+
+    def test_wildcards(self) -> None:
+        '''
+            Test single, double star and character classes.
+
+            :exceptions: None.
+        '''
+        rules = IgnoreRules()
+        rules.add(['*.py[cod]\n', '**/data/*.csv\n', 'logs/**\n', 'a/**/z\n', 'file?.txt  \n'])
+        self.assertTrue(rules.ignored('pkg/mod.pyc', False))
+        self.assertFalse(rules.ignored('pkg/mod.py', False))
+        self.assertTrue(rules.ignored('pkg/data/x.csv', False))
+        self.assertFalse(rules.ignored('pkg/data/sub/x.csv', False))
+        self.assertTrue(rules.ignored('logs/a/b', False))
+        self.assertFalse(rules.ignored('logs', True))
+        self.assertTrue(rules.ignored('a/z', True))
+        self.assertTrue(rules.ignored('a/b/c/z', True))
+        self.assertTrue(rules.ignored('file1.txt', False))
+        self.assertFalse(rules.ignored('file10.txt', False))
+
+    def test_negation_and_base(self) -> None:
+        '''
+            Test last rule wins and nested ignore files.
+
+            :exceptions: None.
+        '''
+        Path('pkg').mkdir()
+        Path('pkg/.gitignore').write_text('*.log\n!keep.log\n\\#notes\n', encoding='utf-8')
+        rules = IgnoreRules()
+        rules.add_file('pkg/.gitignore', 'pkg/')
+        self.assertTrue(rules.ignored('pkg/sub/run.log', False))
+        self.assertFalse(rules.ignored('pkg/keep.log', False))
+        self.assertFalse(rules.ignored('other/run.log', False))
+        self.assertTrue(rules.ignored('pkg/#notes', False))
+
+
+if __name__ == '__main__':
+    unittest.main()
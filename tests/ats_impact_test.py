@@ -0,0 +1,189 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_impact_test.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines incremental test impact selection test cases.
+'''
+
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from ats_impact import plan_incremental
+from ats_coverage import run_coverage
+from tests.ats_base_test import ATSCoverageBaseTestCase
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__: list[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__: str = '5.0.0'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class ATSImpactTestCase(ATSCoverageBaseTestCase):
+    '''
+        Defines class ATSImpactTestCase with incremental selection tests.
+        Tests planning, test selection and merging of retained data.
+
+        It defines:
+
+            :attributes: None.
+            :methods:
+                | _forget_package - Drop imported dummy package modules.
+                | test_first_run_is_full - Test first incremental run selects all tests.
+                | test_changed_source_selects_covering_tests - Test changed source selects its tests only.
+                | test_unmapped_change_runs_full - Test unmapped new source forces a full run.
+                | test_failed_run_keeps_selection - Test failing tests stay selected until they pass.
+                | test_changed_base_test_selects_dependents - Test changed shared test module selects its importers.
+                | test_unparsable_test_runs_full - Test unreadable test dependencies force a full run.
+    '''
+
+    def _forget_package(self) -> None:
+        '''
+            Drop imported dummy package modules.
+
+            :exceptions: None.
+        '''
+        for name in list(sys.modules):
+            if name.startswith("dummy_package") or name.startswith("tests."):
+                sys.modules.pop(name, None)
+
+    def test_first_run_is_full(self) -> None:
+        '''
+            Test first incremental run selects all tests.
+
+            :exceptions: None.
+        '''
+        self.assertTrue(plan_incremental("dummy_package").full)
+        run_coverage("dummy_package", incremental=True)
+        plan = plan_incremental("dummy_package")
+        self.assertFalse(plan.full)
+        self.assertEqual(plan.tests, set())
+        self.assertEqual(plan.modules, set())
+
+    def test_changed_source_selects_covering_tests(self) -> None:
+        '''
+            Test changed source selects its tests only.
+
+            :exceptions: None.
+        '''
+        full = run_coverage("dummy_package", incremental=True)
+        (self.pkg_dir / "submodule.py").write_text(
+            "def add(a: int, b: int) -> int:\n    return b + a\n", encoding="utf-8"
+        )
+        plan = plan_incremental("dummy_package")
+        self.assertFalse(plan.full)
+        self.assertEqual(plan.tests, {"tests.dummy_test.DummyTest.test_add"})
+
+        self._forget_package()
+        merged = run_coverage("dummy_package", incremental=True)
+        self.assertEqual(merged["totals"], full["totals"])
+
+    def test_unmapped_change_runs_full(self) -> None:
+        '''
+            Test unmapped new source forces a full run.
+
+            :exceptions: None.
+        '''
+        run_coverage("dummy_package", incremental=True)
+        (self.pkg_dir / "new_module.py").write_text("VALUE = 1\n", encoding="utf-8")
+        plan = plan_incremental("dummy_package")
+        self.assertTrue(plan.full)
+        self.assertIn("new_module.py", plan.reason)
+
+    def test_failed_run_keeps_selection(self) -> None:
+        '''
+            Test failing tests stay selected until they pass.
+
+            :exceptions: None.
+        '''
+        run_coverage("dummy_package", incremental=True)
+        (self.pkg_dir / "submodule.py").write_text(
+            "def add(a: int, b: int) -> int:\n    return a - b\n", encoding="utf-8"
+        )
+        self._forget_package()
+        run_coverage("dummy_package", incremental=True)
+        self.assertEqual(plan_incremental("dummy_package").tests, {"tests.dummy_test.DummyTest.test_add"})
+        (self.pkg_dir / "submodule.py").write_text(
+            "def add(a: int, b: int) -> int:\n    return b + a\n", encoding="utf-8"
+        )
+        self._forget_package()
+        run_coverage("dummy_package", incremental=True)
+        self.assertEqual(plan_incremental("dummy_package").tests, set())
+
+    def test_changed_base_test_selects_dependents(self) -> None:
+        '''
+            Test changed shared test module selects its importers.
+
+            :exceptions: None.
+        '''
+        (self.test_dir / "common_test.py").write_text(
+            "import unittest\n"
+            "from dummy_package import hello\n\n"
+            "class CommonTestCase(unittest.TestCase):\n"
+            "    def test_common(self):\n"
+            "        self.assertEqual(hello(), 'world')\n",
+            encoding="utf-8"
+        )
+        (self.test_dir / "a_test.py").write_text(
+            "from tests.common_test import CommonTestCase\n\n"
+            "class ATest(CommonTestCase):\n"
+            "    def test_a(self):\n"
+            "        self.assertTrue(True)\n",
+            encoding="utf-8"
+        )
+        full = run_coverage("dummy_package", incremental=True)
+        (self.test_dir / "common_test.py").write_text(
+            "import unittest\n"
+            "from dummy_package import hello\n\n"
+            "class CommonTestCase(unittest.TestCase):\n"
+            "    def test_common(self):\n"
+            "        self.assertNotEqual(hello(), '')\n",
+            encoding="utf-8"
+        )
+        plan = plan_incremental("dummy_package")
+        self.assertFalse(plan.full)
+        self.assertEqual(plan.modules, {"tests.common_test", "tests.a_test"})
+        self.assertTrue(plan.selects_id("tests.a_test.ATest.test_common"))
+        self.assertFalse(plan.selects_id("tests.dummy_test.DummyTest.test_add"))
+
+        self._forget_package()
+        merged = run_coverage("dummy_package", incremental=True)
+        self.assertEqual(merged["totals"], full["totals"])
+
+    def test_unparsable_test_runs_full(self) -> None:
+        '''
+            Test unreadable test dependencies force a full run.
+
+            :exceptions: None.
+        '''
+        run_coverage("dummy_package", incremental=True)
+        (self.test_dir / "dummy_test.py").write_text("def broken(:\n", encoding="utf-8")
+        plan = plan_incremental("dummy_package")
+        self.assertTrue(plan.full)
+        self.assertIn("unknown", plan.reason)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_json_test.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines streaming summary loader test cases.
+'''
+
+from __future__ import annotations
+
+import json
+import sys
+import tracemalloc
+import unittest
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from ats_json import load_summaries
+from ats_updater import load_report
+from tests.ats_base_test import ATSCoverageBaseTestCase
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__: list[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__: str = '5.0.0'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+def make_report(path: str, num_lines: int, num_files: int = 10) -> None:
+    '''
+        Writes coverage JSON report with line lists and contexts.
+
+        :param path: Report file path.
+        :param num_lines: Executed and missing lines per file.
+        :param num_files: Files in the report.
+        :exceptions: None.
+    '''
+    lines: list[int] = list(range(1, num_lines + 1))
+    summary: dict[str, object] = {'num_statements': 2 * num_lines, 'missing_lines': num_lines}
+    report: dict[str, object] = {
+        'meta': {'format': 3, 'show_contexts': True},
+        'files': {
+            f'pkg/mod{index}.py': {
+                'executed_lines': lines, 'summary': summary, 'missing_lines': lines,
+                'contexts': {str(line): ['tests.a_test.A.test_"x"\\y'] for line in lines},
+                'functions': {'f': {'executed_lines': lines, 'summary': {'num_statements': 1}}},
+            }
+            for index in range(num_files)
+        },
+        'totals': {'num_statements': 2 * num_lines * num_files},
+    }
+
+    with open(path, 'w', encoding='utf-8') as report_file:
+        json.dump(report, report_file)
+
+
+class ATSJsonTestCase(ATSCoverageBaseTestCase):
+    '''
+        Defines class ATSJsonTestCase with streaming loader tests.
+        Tests extracted summaries, chunk boundaries, errors and peak memory.
+
+        It defines:
+
+            :attributes: None.
+            :methods:
+                | test_summaries_match_json_load - Test summaries equal those of a full parse.
+                | test_malformed_report - Test malformed reports raise ValueError.
+                | test_peak_memory_is_bounded - Test peak memory does not grow with lines per file.
+    '''
+
+    def test_summaries_match_json_load(self) -> None:
+        '''
+            Test summaries equal those of a full parse.
+
+            :exceptions: None.
+        '''
+        make_report('report.json', 30)
+        text: str = Path('report.json').read_text(encoding='utf-8')
+        full: dict[str, object] = json.loads(text)
+        expected: dict[str, object] = {
+            'meta': full['meta'], 'totals': full['totals'],
+            'files': {name: {'summary': data['summary']} for name, data in full['files'].items()},
+        }
+        self.assertEqual(load_report('report.json'), expected)
+
+        for size in (1, 2, 3, 7, 64):
+            with patch.dict(load_summaries.__globals__, {'CHUNK_SIZE': size}):
+                self.assertEqual(load_summaries(StringIO(text)), expected)
+
+        self.assertEqual(load_summaries(StringIO('{"files": {}}')), {'files': {}})
+
+    def test_malformed_report(self) -> None:
+        '''
+            Test malformed reports raise ValueError.
+
+            :exceptions: None.
+        '''
+        for text in ('', '[]', '{"files": {"a": {"summary": {}}', '{"totals" 1}', '{"a": "x', '{"a": 1,}'):
+            with self.assertRaises(ValueError):
+                load_summaries(StringIO(text))
+
+    def test_peak_memory_is_bounded(self) -> None:
+        '''
+            Test peak memory does not grow with lines per file.
+
+            :exceptions: None.
+        '''
+        peaks: list[int] = []
+
+        for num_lines in (1000, 20000):
+            make_report('report.json', num_lines)
+            tracemalloc.start()
+
+            try:
+                with patch.dict(load_summaries.__globals__, {'CHUNK_SIZE': 16 * 1024}):
+                    load_report('report.json')
+
+                peaks.append(tracemalloc.get_traced_memory()[1])
+            finally:
+                tracemalloc.stop()
+
+        self.assertGreater(Path('report.json').stat().st_size, 50 * peaks[1])
+        self.assertLess(peaks[1], 2 * peaks[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
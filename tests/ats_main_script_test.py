@@ -54,7 +54,7 @@ class ATSMainScriptTestCase(ATSCoverageBaseTestCase):
             :attributes: None.
             :methods:
                 | test_main_script_success - Test executing ats_coverage.py as __main__ with success.
-                | test_main_script_failure_load_report - Test executing ats_coverage.py as __main__ with load report failure.
+                | test_main_script_failure_empty_report - Test executing ats_coverage.py as __main__ with empty report.
                 | test_main_script_failure_run_coverage - Test executing ats_coverage.py as __main__ with run coverage raising TypeError.
                 | test_main_script_success_run_path - Test executing ats_coverage.py as __main__ successfully via run_path.
     '''
@@ -77,9 +77,9 @@ class ATSMainScriptTestCase(ATSCoverageBaseTestCase):
         res = subprocess.run(["python3", SCRIPT_PATH, "dummy_package"])
         self.assertEqual(res.returncode, 0)
 
-    def test_main_script_failure_load_report(self) -> None:
+    def test_main_script_failure_empty_report(self) -> None:
         '''
-            Test executing ats_coverage.py as __main__ with load report failure.
+            Test executing ats_coverage.py as __main__ with empty report.
 
             :exceptions: None.
         '''
@@ -93,7 +93,7 @@ class ATSMainScriptTestCase(ATSCoverageBaseTestCase):
             encoding="utf-8"
         )
         with patch("sys.argv", ["ats_coverage.py", "dummy_package"]):
-            with patch("ats_updater.load_report", return_value={}):
+            with patch("ats_report.build_reports", return_value={}):
                 with self.assertRaises(SystemExit) as cm:
                     run_path(SCRIPT_PATH, run_name="__main__")
                 self.assertEqual(cm.exception.code, 129)
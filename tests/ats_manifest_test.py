@@ -0,0 +1,230 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_manifest_test.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines cached test discovery manifest test cases.
+'''
+
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from ats_manifest import MANIFEST_FILE, DiscoveryManifest
+from ats_runner import iter_test_cases, split_by_module
+from tests.ats_base_test import ATSCoverageBaseTestCase
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__: list[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__: str = '5.0.0'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class ATSManifestTestCase(ATSCoverageBaseTestCase):
+    '''
+        Defines class ATSManifestTestCase with test manifest tests.
+        Tests suite equivalence with discovery, lazy loading and refresh.
+
+        It defines:
+
+            :attributes: None.
+            :methods:
+                | setUp - Add nested, inherited and broken test modules.
+                | _forget_tests - Drop imported test modules.
+                | _discovered_ids - Get test ids of fresh discovery.
+                | test_suite_matches_discovery - Test manifest suite equals discovery.
+                | test_unchanged_modules_load_lazily - Test unchanged modules are imported on run only.
+                | test_changed_base_rebuilds_subclass - Test changed base class refreshes inheriting module.
+                | test_selection_skips_modules - Test modules without selected tests are not imported.
+                | test_module_outcomes_match_discovery - Test failed and skipped modules report as in discovery.
+    '''
+
+    def setUp(self) -> None:
+        '''
+            Add nested, inherited and broken test modules.
+
+            :exceptions: None.
+        '''
+        super().setUp()
+        nested = self.test_dir / "nested"
+        nested.mkdir()
+        (nested / "__init__.py").write_text("", encoding="utf-8")
+        (nested / "base_test.py").write_text(
+            "import unittest\n\n"
+            "class BaseTest(unittest.TestCase):\n"
+            "    def test_base(self):\n"
+            "        pass\n",
+            encoding="utf-8"
+        )
+        (nested / "child_test.py").write_text(
+            "from tests.nested.base_test import BaseTest\n\n"
+            "class ChildTest(BaseTest):\n"
+            "    def test_child(self):\n"
+            "        pass\n",
+            encoding="utf-8"
+        )
+        (self.test_dir / "broken_test.py").write_text("import missing_module\n", encoding="utf-8")
+        (self.test_dir / "helper.py").write_text("VALUE = 1\n", encoding="utf-8")
+
+    def _forget_tests(self) -> None:
+        '''
+            Drop imported test modules.
+
+            :exceptions: None.
+        '''
+        for name in list(sys.modules):
+            if name == "tests" or name.startswith("tests.") or name.startswith("dummy_package"):
+                sys.modules.pop(name, None)
+
+    def _discovered_ids(self) -> list[str]:
+        '''
+            Get test ids of fresh discovery.
+
+            :return: Test ids in discovery order.
+            :exceptions: None.
+        '''
+        self._forget_tests()
+        tests = unittest.TestLoader().discover('tests', pattern='*_test.py', top_level_dir='.')
+
+        return [test.id() for test in iter_test_cases(tests)]
+
+    def test_suite_matches_discovery(self) -> None:
+        '''
+            Test manifest suite equals discovery.
+
+            :exceptions: None.
+        '''
+        manifest = DiscoveryManifest()
+        self.assertTrue(manifest.refresh())
+        self.assertTrue(Path(MANIFEST_FILE).is_file())
+        ids = [test.id() for test in iter_test_cases(manifest.suite())]
+        discovered = self._discovered_ids()
+        self.assertEqual(ids, discovered)
+        self.assertIn("unittest.loader._FailedTest.tests.broken_test", ids)
+        tests = unittest.TestLoader().discover('tests', pattern='*_test.py', top_level_dir='.')
+        self.assertEqual(manifest.modules(), split_by_module(tests))
+
+    def test_unchanged_modules_load_lazily(self) -> None:
+        '''
+            Test unchanged modules are imported on run only.
+
+            :exceptions: None.
+        '''
+        DiscoveryManifest().refresh()
+        self._forget_tests()
+        manifest = DiscoveryManifest()
+        self.assertTrue(manifest.refresh())
+        suite = manifest.suite()
+        self.assertNotIn("tests.dummy_test", sys.modules)
+        result = unittest.TestResult()
+        suite.run(result)
+        self.assertIn("tests.dummy_test", sys.modules)
+        self.assertEqual(result.testsRun, 7)
+        self.assertEqual(len(result.errors), 1)
+
+    def test_changed_base_rebuilds_subclass(self) -> None:
+        '''
+            Test changed base class refreshes inheriting module.
+
+            :exceptions: None.
+        '''
+        DiscoveryManifest().refresh()
+        (self.test_dir / "nested" / "base_test.py").write_text(
+            "import unittest\n\n"
+            "class BaseTest(unittest.TestCase):\n"
+            "    def test_base(self):\n"
+            "        pass\n"
+            "    def test_extra(self):\n"
+            "        pass\n",
+            encoding="utf-8"
+        )
+        self._forget_tests()
+        manifest = DiscoveryManifest()
+        manifest.refresh()
+        self.assertIn(
+            ["tests.nested.child_test", "tests.nested.child_test.ChildTest.test_extra"],
+            manifest.entries["tests/nested/child_test.py"]["tests"]
+        )
+        self.assertEqual(
+            [test.id() for test in iter_test_cases(manifest.suite())], self._discovered_ids()
+        )
+
+    def test_selection_skips_modules(self) -> None:
+        '''
+            Test modules without selected tests are not imported.
+
+            :exceptions: None.
+        '''
+        DiscoveryManifest().refresh()
+        self._forget_tests()
+        manifest = DiscoveryManifest()
+        manifest.refresh()
+        suite = manifest.suite(lambda module, test_id: module == "tests.dummy_test")
+        ids = [test.id() for test in iter_test_cases(suite)]
+        self.assertEqual(ids, ["tests.dummy_test.DummyTest.test_add", "tests.dummy_test.DummyTest.test_hello"])
+        self.assertNotIn("tests.nested.child_test", sys.modules)
+        self.assertEqual(
+            manifest.groups(lambda module, test_id: test_id.endswith("test_base")),
+            {
+                "tests.nested.base_test": ["tests.nested.base_test.BaseTest.test_base"] * 2,
+                "tests.nested.child_test": ["tests.nested.child_test.ChildTest.test_base"],
+            }
+        )
+
+
+    def test_module_outcomes_match_discovery(self) -> None:
+        '''
+            Test failed and skipped modules report as in discovery.
+
+            :exceptions: None.
+        '''
+        (self.test_dir / "skipped_test.py").write_text(
+            "import unittest\n\nraise unittest.SkipTest('no backend')\n", encoding="utf-8"
+        )
+        self._forget_tests()
+        manifest = DiscoveryManifest()
+
+        with patch("unittest.loader._make_failed_import_test", side_effect=AssertionError("private helper")), \
+                patch("unittest.loader._make_skipped_test", side_effect=AssertionError("private helper")):
+            manifest.refresh()
+            suite = manifest.suite()
+            ids = [test.id() for test in iter_test_cases(suite)]
+            names = [str(test) for test in iter_test_cases(suite)]
+            result = unittest.TestResult()
+            suite.run(result)
+
+        self._forget_tests()
+        tests = unittest.TestLoader().discover('tests', pattern='*_test.py', top_level_dir='.')
+        self.assertEqual(ids, [test.id() for test in iter_test_cases(tests)])
+        self.assertEqual(names, [str(test) for test in iter_test_cases(tests)])
+        self.assertIn("unittest.loader.ModuleSkipped.tests.skipped_test", ids)
+        self.assertEqual([reason for _, reason in result.skipped], ["no backend"])
+        self.assertEqual(len(result.errors), 1)
+        self.assertIn("Failed to import test module: tests.broken_test", result.errors[0][1])
+        self.assertIn("No module named 'missing_module'", result.errors[0][1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_parallel_test.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines parallel test execution and coverage combining test cases.
+'''
+
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from ats_runner import split_by_module, shard_modules
+from ats_coverage import run_coverage, combine_coverage, shard_data_file, load_report
+from tests.ats_base_test import ATSCoverageBaseTestCase
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__: list[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__: str = '5.0.0'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class ATSParallelTestCase(ATSCoverageBaseTestCase):
+    '''
+        Defines class ATSParallelTestCase with parallel execution tests.
+        Tests splitting the suite by module and combining worker data.
+
+        It defines:
+
+            :attributes: None.
+            :methods:
+                | setUp - Add a second test module to the temporary project.
+                | test_split_by_module - Test splitting discovered suite by test module.
+                | test_run_coverage_parallel_matches_serial - Test parallel run produces serial summaries.
+                | test_shard_modules - Test shards partition modules deterministically.
+                | test_combined_shards_match_serial - Test merged shard data produces serial summaries.
+    '''
+
+    def setUp(self) -> None:
+        '''
+            Add a second test module to the temporary project.
+
+            :exceptions: None.
+        '''
+        super().setUp()
+        (self.test_dir / "other_test.py").write_text(
+            "import unittest\n"
+            "from dummy_package.subdir.file import sub\n\n"
+            "class OtherTest(unittest.TestCase):\n"
+            "    def test_sub(self):\n"
+            "        self.assertIsNone(sub())\n",
+            encoding="utf-8"
+        )
+
+    def test_split_by_module(self) -> None:
+        '''
+            Test splitting discovered suite by test module.
+
+            :exceptions: None.
+        '''
+        tests = unittest.TestLoader().discover("tests", pattern="*_test.py", top_level_dir=".")
+        self.assertEqual(split_by_module(tests), ["tests.dummy_test", "tests.other_test"])
+
+    def test_run_coverage_parallel_matches_serial(self) -> None:
+        '''
+            Test parallel run produces serial summaries.
+
+            :exceptions: None.
+        '''
+        run_coverage("dummy_package")
+        serial = load_report("dummy_package.json")
+        run_coverage("dummy_package", jobs=2)
+        parallel = load_report("dummy_package.json")
+
+        self.assertEqual(
+            {name: data["summary"] for name, data in parallel["files"].items()},
+            {name: data["summary"] for name, data in serial["files"].items()}
+        )
+        self.assertEqual(parallel["totals"], serial["totals"])
+        self.assertEqual(list(Path(".").glob(".coverage.dummy_package.*")), [])
+
+    def test_shard_modules(self) -> None:
+        '''
+            Test shards partition modules deterministically.
+
+            :exceptions: None.
+        '''
+        names = [f"tests.m{index}_test" for index in range(7)]
+        shards = [shard_modules(list(reversed(names)), index, 3) for index in range(1, 4)]
+        self.assertEqual(sorted(name for shard in shards for name in shard), sorted(names))
+        self.assertEqual(shards, [shard_modules(names, index, 3) for index in range(1, 4)])
+        self.assertEqual([len(shard) for shard in shards], [3, 2, 2])
+
+    def test_combined_shards_match_serial(self) -> None:
+        '''
+            Test merged shard data produces serial summaries.
+
+            :exceptions: None.
+        '''
+        serial = run_coverage("dummy_package", reports={})
+        data_files = []
+
+        for index in (1, 2):
+            for name in list(sys.modules):
+                if name.startswith("dummy_package") or name.startswith("tests."):
+                    sys.modules.pop(name, None)
+
+            self.assertEqual(run_coverage("dummy_package", shard=(index, 2)), {})
+            data_files.append(shard_data_file("dummy_package", (index, 2)))
+
+        combined = combine_coverage("dummy_package", data_files, reports={})
+        self.assertEqual(combined, serial)
+        self.assertTrue(all(Path(data_file).is_file() for data_file in data_files))
+
+        with self.assertRaises(ValueError):
+            combine_coverage("dummy_package", ["missing.shard"])
+
+
+if __name__ == '__main__':
+    unittest.main()
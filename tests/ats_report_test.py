@@ -0,0 +1,197 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_report_test.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines shared analysis reporting stage test cases.
+'''
+
+from __future__ import annotations
+
+import sys
+import json
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from coverage import Coverage
+
+from ats_report import (
+    analyze_once, plan_reports, build_reports, SharedAnalysisCoverage, _shared_analysis_supported
+)
+from ats_coverage import run_coverage, summarize_data
+from tests.ats_base_test import ATSCoverageBaseTestCase
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__: list[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__: str = '5.0.0'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+OPTIONS: dict[str, object] = {
+    "source": ["dummy_package"], "config_file": ".coveragerc", "data_file": ".coverage.dummy_package"
+}
+
+
+class ATSReportTestCase(ATSCoverageBaseTestCase):
+    '''
+        Defines class ATSReportTestCase with reporting stage tests.
+        Tests that all report formats are built from one analysis.
+
+        It defines:
+
+            :attributes: None.
+            :methods:
+                | test_reports_match_direct_reports - Test shared analysis output equals direct report.
+                | test_writer_does_not_analyze_again - Test writers reuse precomputed analyses.
+                | test_plan_reports_requesters - Test report plan takes cli over config requests.
+                | test_build_reports_skips_unplanned - Test unplanned artifacts are not built.
+                | test_summary_matches_json_report - Test in-memory summary equals JSON summary.
+                | test_public_api_fallback - Test reports and summaries without private coverage hooks.
+    '''
+
+    def test_reports_match_direct_reports(self) -> None:
+        '''
+            Test shared analysis output equals direct report.
+
+            :exceptions: None.
+        '''
+        run_coverage("dummy_package")
+        self.assertTrue(Path("dummy_package.xml").is_file())
+        self.assertTrue(Path("htmlcov/index.html").is_file())
+        cov = Coverage(**OPTIONS)
+        cov.load()
+        cov.json_report(outfile="direct.json")
+        shared = json.loads(Path("dummy_package.json").read_text(encoding="utf-8"))
+        direct = json.loads(Path("direct.json").read_text(encoding="utf-8"))
+        self.assertEqual(shared["files"], direct["files"])
+        self.assertEqual(shared["totals"], direct["totals"])
+
+    def test_writer_does_not_analyze_again(self) -> None:
+        '''
+            Test writers reuse precomputed analyses.
+
+            :exceptions: None.
+        '''
+        run_coverage("dummy_package")
+        cov = Coverage(**OPTIONS)
+        cov.load()
+        analyses = analyze_once(cov)
+        writer = SharedAnalysisCoverage(analyses, **OPTIONS)
+        writer.load()
+
+        with patch.object(Coverage, "_analyze", side_effect=AssertionError("analyzed again")):
+            writer.json_report(outfile="again.json")
+            writer.xml_report(outfile="again.xml")
+
+        self.assertTrue(Path("again.json").is_file())
+
+    def test_plan_reports_requesters(self) -> None:
+        '''
+            Test report plan takes cli over config requests.
+
+            :exceptions: None.
+        '''
+        self.assertEqual(plan_reports(["html,term"], ["xml"]), {"term": ["cli"], "html": ["cli"]})
+        self.assertEqual(plan_reports(None, ["xml", "json"]), {"json": ["config"], "xml": ["config"]})
+        self.assertEqual(plan_reports(None, None), {"term": ["default"]})
+
+        with self.assertRaises(ValueError):
+            plan_reports(["pdf"], None)
+
+    def test_build_reports_skips_unplanned(self) -> None:
+        '''
+            Test unplanned artifacts are not built.
+
+            :exceptions: None.
+        '''
+        run_coverage("dummy_package", reports={"json": ["update_readme"]})
+        self.assertTrue(Path("dummy_package.json").is_file())
+        self.assertFalse(Path("dummy_package.xml").exists())
+        self.assertFalse(Path("htmlcov").exists())
+
+        cov = Coverage(**OPTIONS)
+        cov.load()
+
+        with patch("ats_report._write_report") as mock_write:
+            summary = build_reports(cov, "dummy_package", OPTIONS, {})
+            mock_write.assert_not_called()
+
+        self.assertIn("dummy_package/submodule.py", summary["files"])
+
+    def test_summary_matches_json_report(self) -> None:
+        '''
+            Test in-memory summary equals JSON summary.
+
+            :exceptions: None.
+        '''
+        summary = run_coverage("dummy_package", reports={"json": ["cli"]})
+        report = json.loads(Path("dummy_package.json").read_text(encoding="utf-8"))
+        self.assertEqual(list(summary["files"]), list(report["files"]))
+
+        for name, data in summary["files"].items():
+            for key, value in data["summary"].items():
+                self.assertEqual(value, report["files"][name]["summary"][key])
+
+        for key, value in summary["totals"].items():
+            self.assertEqual(value, report["totals"][key])
+
+    def test_public_api_fallback(self) -> None:
+        '''
+            Test reports and summaries without private coverage hooks.
+
+            :exceptions: None.
+        '''
+        self.assertTrue(_shared_analysis_supported())
+
+        with patch("ats_report.get_analysis_to_report", None):
+            self.assertFalse(_shared_analysis_supported())
+
+        with patch.object(Coverage, "_analyze", lambda self, morf: None):
+            self.assertFalse(_shared_analysis_supported())
+
+        runs = []
+
+        for shared_analysis in (True, False):
+            for name in list(sys.modules):
+                if name.startswith("dummy_package") or name.startswith("tests."):
+                    sys.modules.pop(name, None)
+
+            with patch("ats_report.SHARED_ANALYSIS", shared_analysis), \
+                    patch("ats_coverage.SHARED_ANALYSIS", shared_analysis):
+                runs.append((run_coverage("dummy_package", reports={"xml": ["cli"]}), summarize_data("dummy_package")))
+
+        (shared, shared_model), (fallback, fallback_model) = runs
+        self.assertTrue(Path("dummy_package.xml").is_file())
+        self.assertEqual(list(fallback["files"]), list(shared["files"]))
+
+        for name, data in shared["files"].items():
+            for key, value in data["summary"].items():
+                self.assertEqual(value, fallback["files"][name]["summary"][key])
+
+        for key, value in shared["totals"].items():
+            self.assertEqual(value, fallback["totals"][key])
+
+        self.assertEqual(list(fallback_model), list(shared_model))
+        self.assertEqual(fallback_model.total, shared_model.total)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_resolver_test.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines cached package root resolver test cases.
+'''
+
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from ats_resolver import PackageRootResolver
+from ats_updater import update_readme, update_index_coverage
+from tests.ats_base_test import ATSCoverageBaseTestCase
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__: list[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__: str = '5.0.0'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+DEPTH: int = 10
+FILES_PER_DIR: int = 20
+
+
+class ATSResolverTestCase(ATSCoverageBaseTestCase):
+    '''
+        Defines class ATSResolverTestCase with package root resolver tests.
+        Tests module paths and the number of stat calls for deep trees.
+
+        It defines:
+
+            :attributes: None.
+            :methods:
+                | _make_deep_package - Creates nested package with many modules.
+                | test_module_path - Test display module paths of report files.
+                | test_stat_calls_are_bounded - Test stat calls per directory, not per file and level.
+    '''
+
+    def _make_deep_package(self) -> dict[str, object]:
+        '''
+            Creates nested package with many modules.
+
+            :return: Coverage summary listing every module.
+            :exceptions: None.
+        '''
+        directory = Path("deep")
+        files: dict[str, object] = {}
+        summary = {"num_statements": 1, "missing_lines": 0, "percent_covered_display": "100"}
+
+        for depth in range(DEPTH):
+            directory.mkdir(parents=True, exist_ok=True)
+            (directory / "__init__.py").write_text("", encoding="utf-8")
+
+            for index in range(FILES_PER_DIR):
+                (directory / f"m{index}.py").write_text("", encoding="utf-8")
+                files[str(directory / f"m{index}.py")] = {"summary": summary}
+
+            directory = directory / f"level{depth}"
+
+        return {"files": files, "totals": summary}
+
+    def test_module_path(self) -> None:
+        '''
+            Test display module paths of report files.
+
+            :exceptions: None.
+        '''
+        resolver = PackageRootResolver()
+        (self.pkg_dir / "subdir" / "__init__.py").write_text("", encoding="utf-8")
+        self.assertEqual(
+            resolver.module_path("dummy_package/subdir/file.py"), "dummy_package/subdir/file.py"
+        )
+        self.assertEqual(resolver.module_path("dummy_package/submodule.py"), "dummy_package/submodule.py")
+        self.assertEqual(resolver.module_path("/some/other/file.py"), "")
+
+        with self.assertRaises(TypeError):
+            resolver.module_path(123)
+
+    def test_stat_calls_are_bounded(self) -> None:
+        '''
+            Test stat calls per directory, not per file and level.
+
+            :exceptions: None.
+        '''
+        coverage = self._make_deep_package()
+        Path("docs/source").mkdir(parents=True, exist_ok=True)
+        resolver = PackageRootResolver()
+
+        with patch("os.stat", wraps=os.stat) as mock_stat, \
+             patch("os.lstat", wraps=os.lstat) as mock_lstat:
+            update_readme(coverage, resolver=resolver)
+            readme_calls = mock_stat.call_count + mock_lstat.call_count
+            update_index_coverage(coverage, resolver=resolver)
+            total_calls = mock_stat.call_count + mock_lstat.call_count
+
+        files: int = DEPTH * FILES_PER_DIR
+        levels: int = DEPTH + len(Path.cwd().resolve().parts)
+        self.assertLessEqual(readme_calls, files + DEPTH * levels + 10)
+        self.assertLessEqual(total_calls - readme_calls, 5)
+        self.assertIn(
+            "`deep/level0/level1/m3.py`", self.readme_path.read_text(encoding="utf-8")
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_summary_test.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines compact summary model test cases.
+'''
+
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from ats_coverage import run_coverage, summarize_data
+from ats_summary import CoverageSummary
+from ats_updater import update_index_coverage, update_readme
+from tests.ats_base_test import ATSCoverageBaseTestCase
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__: list[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__: str = '5.0.0'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class ATSSummaryTestCase(ATSCoverageBaseTestCase):
+    '''
+        Defines class ATSSummaryTestCase with summary model tests.
+        Tests model contents and tables rendered from model and from dict.
+
+        It defines:
+
+            :attributes: None.
+            :methods:
+                | test_model_from_report - Test model keeps counts of every file and the totals.
+                | test_tables_match_dict_path - Test tables rendered from model equal those from dict.
+                | test_summarize_data - Test summaries from data file equal those of the run.
+    '''
+
+    def test_model_from_report(self) -> None:
+        '''
+            Test model keeps counts of every file and the totals.
+
+            :exceptions: None.
+        '''
+        summary: dict[str, object] = run_coverage('dummy_package', reports={})
+        model = CoverageSummary.from_report(summary)
+        self.assertEqual(len(model), len(summary['files']))
+        self.assertFalse(hasattr(model, '__dict__'))
+
+        for name, statements, missing, covered in model:
+            file_summary: dict[str, object] = summary['files'][name]['summary']
+            self.assertEqual(
+                (statements, missing, covered),
+                (file_summary['num_statements'], file_summary['missing_lines'],
+                 file_summary['percent_covered_display'])
+            )
+
+        totals: dict[str, object] = summary['totals']
+        self.assertEqual(
+            model.total,
+            (totals['num_statements'], totals['missing_lines'], totals['percent_covered_display'])
+        )
+
+        with self.assertRaises(KeyError):
+            CoverageSummary.from_report({'files': {}})
+
+    def test_tables_match_dict_path(self) -> None:
+        '''
+            Test tables rendered from model equal those from dict.
+
+            :exceptions: None.
+        '''
+        summary: dict[str, object] = run_coverage('dummy_package', reports={})
+        Path('docs').mkdir()
+        update_readme(summary)
+        update_index_coverage(summary, 'docs/table.csv')
+        readme: str = self.readme_path.read_text(encoding='utf-8')
+        table: str = Path('docs/table.csv').read_text(encoding='utf-8')
+        self.readme_path.write_text(self.readme_content, encoding='utf-8')
+        model = CoverageSummary.from_report(summary)
+        update_readme(model)
+        self.assertFalse(update_index_coverage(model, 'docs/table.csv'))
+        self.assertEqual(self.readme_path.read_text(encoding='utf-8'), readme)
+        self.assertIn('dummy_package/submodule.py', table)
+
+    def test_summarize_data(self) -> None:
+        '''
+            Test summaries from data file equal those of the run.
+
+            :exceptions: None.
+        '''
+        with self.assertRaises(ValueError):
+            summarize_data('dummy_package')
+
+        summary: dict[str, object] = run_coverage('dummy_package', reports={})
+        expected = CoverageSummary.from_report(summary)
+        model: CoverageSummary = summarize_data('dummy_package')
+        self.assertEqual(list(model), list(expected))
+        self.assertEqual(model.total, expected.total)
+        self.assertFalse(Path('dummy_package.json').exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
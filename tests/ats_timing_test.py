@@ -0,0 +1,210 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_timing_test.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines phase timing instrumentation test cases.
+'''
+
+from __future__ import annotations
+
+import sys
+import json
+import subprocess
+import unittest
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from coverage import CoverageData
+
+from ats_coverage import run_coverage
+from ats_timing import DurationLog, PhaseTimer
+from tests.ats_base_test import ATSCoverageBaseTestCase
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__: list[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__: str = '5.0.0'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+SCRIPT_PATH = str(Path(__file__).parent.parent / "ats_coverage.py")
+
+
+class ATSTimingTestCase(ATSCoverageBaseTestCase):
+    '''
+        Defines class ATSTimingTestCase with phase timing tests.
+        Tests phase recording, summary table and trace-event export.
+
+        It defines:
+
+            :attributes: None.
+            :methods:
+                | test_phase_timer_records_phases - Test nested phases are recorded and exported.
+                | test_main_writes_trace_events - Test command line run writes trace events per phase.
+                | test_merge_shifts_phases - Test phases of another timer are moved onto the timeline.
+                | test_duration_log_tables - Test slowest tests, module table and JSON of durations.
+                | test_run_coverage_writes_durations - Test serial and parallel runs record test durations.
+    '''
+
+    def test_phase_timer_records_phases(self) -> None:
+        '''
+            Test nested phases are recorded and exported.
+
+            :exceptions: None.
+        '''
+        timer = PhaseTimer()
+
+        with timer.phase("outer"):
+            with timer.phase("inner"):
+                sum(range(1000))
+
+        self.assertEqual([record[0] for record in timer.phases], ["inner", "outer"])
+        output = StringIO()
+        timer.write_summary(output)
+        self.assertIn("--- Phase timing ---", output.getvalue())
+        self.assertIn("Process peak RSS", output.getvalue())
+        timer.write_trace("trace.json")
+        events = json.loads(Path("trace.json").read_text(encoding="utf-8"))["traceEvents"]
+        outer = next(event for event in events if event["name"] == "outer")
+        inner = next(event for event in events if event["name"] == "inner")
+        self.assertEqual(outer["ph"], "X")
+        self.assertLessEqual(outer["ts"], inner["ts"])
+        self.assertGreaterEqual(outer["dur"], inner["dur"])
+        self.assertIn("cpu_ms", outer["args"])
+        self.assertIn("process_peak_rss_kb", outer["args"])
+        timer.reset()
+        self.assertEqual(timer.phases, [])
+
+    def test_main_writes_trace_events(self) -> None:
+        '''
+            Test command line run writes trace events per phase.
+
+            :exceptions: None.
+        '''
+        docs_dir = Path("docs/source")
+        docs_dir.mkdir(parents=True, exist_ok=True)
+        (docs_dir / "index.rst").write_text("Tool structure\n", encoding="utf-8")
+        res = subprocess.run(
+            ["python3", SCRIPT_PATH, "--trace-events", "trace.json", "dummy_package"],
+            capture_output=True, text=True, check=True
+        )
+        self.assertIn("--- Phase timing ---", res.stdout)
+        names = {
+            event["name"] for event in
+            json.loads(Path("trace.json").read_text(encoding="utf-8"))["traceEvents"]
+        }
+        self.assertTrue({
+            "discovery", "test run", "save", "analysis", "report term", "update_readme",
+            "generate_tree_lines", "update_index_coverage"
+        } <= names)
+
+    def test_merge_shifts_phases(self) -> None:
+        '''
+            Test phases of another timer are moved onto the timeline.
+
+            :exceptions: None.
+        '''
+        timer, other = PhaseTimer(), PhaseTimer()
+
+        with other.phase("worker"):
+            pass
+
+        timer.merge(other.phases, other.origin, "project: ")
+        name, start, *_ = timer.phases[0]
+        self.assertEqual(name, "project: worker")
+        self.assertAlmostEqual(start, other.phases[0][1] + other.origin - timer.origin)
+
+    def test_duration_log_tables(self) -> None:
+        '''
+            Test slowest tests, module table and JSON of durations.
+
+            :exceptions: None.
+        '''
+        log = DurationLog()
+        log.record("tests.a_test.A.test_fast", "tests.a_test", 0.01, 0.01)
+        log.record("tests.b_test.B.test_slow", "tests.b_test", 0.5, 0.2)
+        log.record("tests.a_test.A.test_mid", "tests.a_test", 0.3, 0.1)
+        self.assertEqual(
+            list(log.modules().items()),
+            [("tests.b_test", (1, 0.5, 0.2)), ("tests.a_test", (2, 0.31, 0.11))]
+        )
+        stream = StringIO()
+        log.write_slowest(stream, 2)
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(lines[1], "--- Slowest 2 of 3 tests ---")
+        self.assertTrue(lines[3].startswith("tests.b_test.B.test_slow"))
+        self.assertTrue(lines[4].startswith("tests.a_test.A.test_mid"))
+        self.assertEqual(len(lines), 5)
+        stream = StringIO()
+        log.write_modules(stream, "87")
+        self.assertIn("--- Test time per module (0.810s, 87% covered) ---", stream.getvalue())
+        self.assertIn("61.7%", stream.getvalue())
+        self.assertNotIn("Lines", stream.getvalue())
+        data = CoverageData(no_disk=True)
+        data.set_context("tests.a_test.A.test_fast")
+        data.add_lines({"/src/m.py": {1, 2, 3}})
+        data.set_context("tests.a_test.A.test_mid")
+        data.add_lines({"/src/m.py": {3, 4}, "/src/n.py": {1}})
+        data.set_context("tests.gone_test.G.test_old")
+        data.add_lines({"/src/n.py": {2}})
+        self.assertEqual(log.module_lines(data), {"tests.a_test": 5})
+        stream = StringIO()
+        log.write_modules(stream, "87", {"tests.a_test": 12})
+        lines = stream.getvalue().splitlines()
+        self.assertTrue(lines[2].endswith("Share    Lines"))
+        self.assertTrue(lines[3].startswith("tests.b_test") and lines[3].endswith(" 0"))
+        self.assertTrue(lines[4].startswith("tests.a_test") and lines[4].endswith(" 12"))
+        log.write_json("durations.json")
+        durations = json.loads(Path("durations.json").read_text(encoding="utf-8"))
+        self.assertEqual(len(durations["tests"]), 3)
+        self.assertEqual(durations["modules"]["tests.a_test"]["tests"], 2)
+        log.reset()
+        stream = StringIO()
+        log.write_slowest(stream, 10)
+        log.write_modules(stream)
+        self.assertEqual(stream.getvalue(), "")
+
+    def test_run_coverage_writes_durations(self) -> None:
+        '''
+            Test serial and parallel runs record test durations.
+
+            :exceptions: None.
+        '''
+        for jobs in (1, 2):
+            run_coverage("dummy_package", jobs=jobs)
+            durations = json.loads(Path(".ats_coverage/dummy_package.durations.json").read_text(encoding="utf-8"))
+            self.assertEqual(
+                sorted(test["id"] for test in durations["tests"]),
+                ["tests.dummy_test.DummyTest.test_add", "tests.dummy_test.DummyTest.test_hello"]
+            )
+            self.assertEqual(list(durations["modules"]), ["tests.dummy_test"])
+
+        output = StringIO()
+
+        with patch.dict(run_coverage.__globals__, {"stdout": output}):
+            run_coverage("dummy_package", contexts=True)
+
+        self.assertRegex(output.getvalue(), r"Share    Lines\ntests\.dummy_test +2 .* 2\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -21,6 +21,7 @@ Info
 
 from __future__ import annotations
 
+import os
 import sys
 import unittest
 from pathlib import Path
@@ -53,6 +54,10 @@ class ATSTreeGenerationTestCase(ATSCoverageBaseTestCase):
             :methods:
                 | test_generate_tree_lines_single_file_success - Test tree generation with single file.
                 | test_generate_tree_lines_single_file_non_dir - Test tree generation with single file when not a directory.
+                | test_generate_tree_lines_nested - Test sort order, connectors and hidden entries of nested tree.
+                | test_generate_tree_lines_deep - Test deep tree does not hit the recursion limit.
+                | test_generate_tree_lines_ignored - Test ignored directories are pruned without walking them.
+                | test_generate_tree_lines_limits - Test depth and entries per directory limits.
                 | test_update_structure_rst - Test update structure with RST file format.
                 | test_update_structure_rst_framework - Test update structure with RST framework structure.
                 | test_update_structure_read_os_error - Test update structure read handling of OSError.
@@ -86,6 +91,112 @@ class ATSTreeGenerationTestCase(ATSCoverageBaseTestCase):
         self.assertEqual(dirs, 0)
         self.assertEqual(files, 1)
 
+    def test_generate_tree_lines_nested(self) -> None:
+        '''
+            Test sort order, connectors and hidden entries of nested tree.
+
+            :exceptions: None.
+        '''
+        (self.pkg_subdir / "__pycache__").mkdir()
+        (self.pkg_subdir / ".hidden").write_text("", encoding="utf-8")
+        (self.pkg_subdir / "Alpha").mkdir()
+        (self.pkg_subdir / "Alpha" / "_beta.py").write_text("", encoding="utf-8")
+        lines, dirs, files = generate_tree_lines("dummy_package")
+        self.assertEqual(lines, [
+            "    dummy_package/\n",
+            "         ├── __init__.py\n",
+            "         ├── subdir/\n",
+            "         │\xa0\xa0 ├── Alpha/\n",
+            "         │\xa0\xa0 │\xa0\xa0 └── _beta.py\n",
+            "         │\xa0\xa0 └── file.py\n",
+            "         └── submodule.py\n",
+        ])
+        self.assertEqual((dirs, files), (3, 4))
+
+    def test_generate_tree_lines_deep(self) -> None:
+        '''
+            Test deep tree does not hit the recursion limit.
+
+            :exceptions: None.
+        '''
+        path = Path("deep")
+        path.mkdir()
+
+        for _ in range(150):
+            path = path / "d"
+            path.mkdir()
+
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(100)
+
+        try:
+            lines, dirs, files = generate_tree_lines("deep")
+        finally:
+            sys.setrecursionlimit(limit)
+
+        self.assertEqual((len(lines), dirs, files), (151, 151, 0))
+        self.assertEqual(lines[-1], "    " * 149 + "         └── d/\n")
+
+    def test_generate_tree_lines_ignored(self) -> None:
+        '''
+            Test ignored directories are pruned without walking them.
+
+            :exceptions: None.
+        '''
+        Path(".gitignore").write_text("build/\n*.log\n", encoding="utf-8")
+        (self.pkg_dir / "build" / "lib").mkdir(parents=True)
+        (self.pkg_dir / "run.log").write_text("", encoding="utf-8")
+        (self.pkg_subdir / ".gitignore").write_text("*.py\n!file.py\nextra.py\n", encoding="utf-8")
+        (self.pkg_subdir / "extra.py").write_text("", encoding="utf-8")
+        (self.pkg_subdir / "other.py").write_text("", encoding="utf-8")
+        listed: list[str] = []
+
+        def listing(path: str) -> object:
+            listed.append(path)
+            return os.scandir(path)
+
+        with patch("ats_tree.scandir", listing):
+            lines, dirs, files = generate_tree_lines("dummy_package", {"excludes": ["submodule.py"]})
+
+        self.assertEqual(lines, [
+            "    dummy_package/\n",
+            "         ├── __init__.py\n",
+            "         └── subdir/\n",
+            "             └── file.py\n",
+        ])
+        self.assertEqual((dirs, files), (2, 2))
+        self.assertEqual(listed, ["dummy_package", os.path.join("dummy_package", "subdir")])
+        self.assertEqual(len(generate_tree_lines("dummy_package", {"gitignore": False})[0]), 10)
+
+    def test_generate_tree_lines_limits(self) -> None:
+        '''
+            Test depth and entries per directory limits.
+
+            :exceptions: None.
+        '''
+        (self.pkg_subdir / "deeper").mkdir()
+        (self.pkg_subdir / "zeta").mkdir()
+
+        for index in range(1500):
+            (self.pkg_subdir / f"mod{index}.py").write_text("", encoding="utf-8")
+
+        lines, dirs, files = generate_tree_lines(
+            "dummy_package", {"max_depth": 1, "max_entries_per_dir": 2}
+        )
+        self.assertEqual(lines, [
+            "    dummy_package/\n",
+            "         ├── __init__.py\n",
+            "         ├── subdir/\n",
+            "         └── … 1 more file\n",
+        ])
+        self.assertEqual((dirs, files), (2, 1))
+        lines = generate_tree_lines("dummy_package", {"max_entries_per_dir": 2})[0]
+        self.assertEqual(lines[3:6], [
+            "         │\xa0\xa0 ├── deeper/\n",
+            "         │\xa0\xa0 ├── file.py\n",
+            "         │\xa0\xa0 └── … 1 more directory, 1,500 more files\n",
+        ])
+
     def test_update_structure_rst(self) -> None:
         '''
             Test update structure with RST file format.
@@ -0,0 +1,256 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_update_docs_test.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines single pass document update pipeline test cases.
+'''
+
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+from collections import Counter
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from ats_sections import replace_markdown_sections, replace_rst_sections
+from ats_updater import (
+    update_docs,
+    update_index_coverage,
+    update_readme,
+    update_structure,
+    write_atomic,
+)
+from tests.ats_base_test import ATSCoverageBaseTestCase
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__: list[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__: str = '5.0.0'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+COVERAGE: dict[str, object] = {
+    'files': {
+        'dummy_package/submodule.py': {
+            'summary': {'num_statements': 2, 'missing_lines': 1, 'percent_covered_display': '50'}
+        }
+    },
+    'totals': {'num_statements': 2, 'missing_lines': 1, 'percent_covered_display': '50'},
+}
+INDEX_CONTENT: str = (
+    'Title\n'
+    '=====\n\n'
+    '📁 Tool structure\n'
+    '-----------------\n\n'
+    'Tool structure\n\n'
+    '.. code-block:: bash\n\n'
+    '     existing structure\n\n'
+    'Next Section\n'
+    '------------\n'
+)
+
+
+class ATSUpdateDocsTestCase(ATSCoverageBaseTestCase):
+    '''
+        Defines class ATSUpdateDocsTestCase with document pipeline tests.
+        Tests heading recognition and single atomic write of changed documents.
+
+        It defines:
+
+            :attributes: None.
+            :methods:
+                | test_update_docs_matches_separate_updates - Test pipeline output equals separate updates.
+                | test_each_document_read_and_written_once - Test each document is read once and written once.
+                | test_unchanged_documents_not_written - Test unchanged documents keep their modification time.
+                | test_failed_write_keeps_document - Test failed write keeps the old document and no temporary file.
+                | test_symlinked_document_kept - Test write through a symlink replaces its target and keeps the link.
+                | test_markdown_headings_in_fences_ignored - Test fenced code does not start sections.
+                | test_rst_section_ends_at_next_heading - Test code-block of a later section is kept.
+                | test_update_docs_without_structure - Test structure sections are kept when layout is unchanged.
+    '''
+
+    def setUp(self) -> None:
+        '''
+            Set up documents of the project.
+
+            :exceptions: None.
+        '''
+        super().setUp()
+        Path('docs/source').mkdir(parents=True)
+        Path('docs/source/index.rst').write_text(INDEX_CONTENT, encoding='utf-8')
+
+    def _documents(self) -> list[str]:
+        '''
+            Reads README.md, index.rst and coverage_table.csv.
+
+            :return: Contents of the documents.
+            :exceptions: None.
+        '''
+        return [
+            Path(path).read_text(encoding='utf-8') for path in
+            ('README.md', 'docs/source/index.rst', 'docs/source/coverage_table.csv')
+        ]
+
+    def test_update_docs_matches_separate_updates(self) -> None:
+        '''
+            Test pipeline output equals separate updates.
+
+            :exceptions: None.
+        '''
+        update_readme(COVERAGE)
+        update_structure('dummy_package', 'README.md')
+        update_index_coverage(COVERAGE)
+        update_structure('dummy_package', 'docs/source/index.rst')
+        separate = self._documents()
+        self.readme_path.write_text(self.readme_content, encoding='utf-8')
+        Path('docs/source/index.rst').write_text(INDEX_CONTENT, encoding='utf-8')
+        update_docs('dummy_package', COVERAGE)
+        self.assertEqual(self._documents(), separate)
+        self.assertIn('`dummy_package/submodule.py` | 2 | 1 | 50%|', separate[0])
+        self.assertIn('         ├── subdir/\n', separate[1])
+        self.assertTrue(separate[1].endswith('files\n\nNext Section\n------------\n'))
+
+    def test_each_document_read_and_written_once(self) -> None:
+        '''
+            Test each document is read once and written once.
+
+            :exceptions: None.
+        '''
+        opened: Counter[tuple[str, str]] = Counter()
+
+        def counting_open(file: str | int, mode: str = 'r', **kwargs: object) -> object:
+            opened[(Path(file).name if isinstance(file, str) else 'temporary', mode)] += 1
+            return open(file, mode, **kwargs)
+
+        with patch.dict(update_docs.__globals__, {'open': counting_open}):
+            changed = update_docs('dummy_package', COVERAGE)
+
+        self.assertEqual(opened, Counter({
+            ('README.md', 'r'): 1, ('index.rst', 'r'): 1, ('temporary', 'wb'): 4
+        }))
+        self.assertEqual(changed, [
+            'README.md', 'docs/source/index.rst', 'docs/source/coverage_table.csv'
+        ])
+
+    def test_unchanged_documents_not_written(self) -> None:
+        '''
+            Test unchanged documents keep their modification time.
+
+            :exceptions: None.
+        '''
+        update_docs('dummy_package', COVERAGE)
+        paths = ['README.md', 'docs/source/index.rst', 'docs/source/coverage_table.csv']
+
+        for path in paths:
+            os.utime(path, ns=(1, 1))
+
+        self.assertEqual(update_docs('dummy_package', COVERAGE), [])
+        self.assertEqual([os.stat(path).st_mtime_ns for path in paths], [1, 1, 1])
+        self.assertEqual(sorted(os.listdir('docs/source')), ['coverage_table.csv', 'index.rst'])
+
+        coverage = dict(COVERAGE, totals={
+            'num_statements': 2, 'missing_lines': 0, 'percent_covered_display': '100'
+        })
+        self.assertEqual(
+            update_docs('dummy_package', coverage, structure=False),
+            ['README.md', 'docs/source/coverage_table.csv']
+        )
+        self.assertEqual(os.stat('docs/source/index.rst').st_mtime_ns, 1)
+
+    def test_failed_write_keeps_document(self) -> None:
+        '''
+            Test failed write keeps the old document and no temporary file.
+
+            :exceptions: None.
+        '''
+        self.assertFalse(write_atomic('docs/source', 'content\n'))
+
+        with patch.dict(write_atomic.__globals__, {'replace': Mock(side_effect=OSError('Mocked'))}):
+            self.assertFalse(write_atomic('README.md', 'content\n'))
+
+        self.assertEqual(self.readme_path.read_text(encoding='utf-8'), self.readme_content)
+        self.assertEqual(sorted(os.listdir('.')), ['README.md', 'docs', 'dummy_package', 'tests'])
+        os.chmod('README.md', 0o600)
+        self.assertTrue(write_atomic('README.md', 'content\n'))
+        self.assertEqual(os.stat('README.md').st_mode & 0o777, 0o600)
+
+    def test_symlinked_document_kept(self) -> None:
+        '''
+            Test write through a symlink replaces its target and keeps the link.
+
+            :exceptions: None.
+        '''
+        target = Path('docs/README.md')
+        self.readme_path.replace(target)
+        os.symlink(os.path.join('docs', 'README.md'), 'README.md')
+        self.assertTrue(write_atomic('README.md', 'content\n'))
+        self.assertTrue(os.path.islink('README.md'))
+        self.assertEqual(target.read_text(encoding='utf-8'), 'content\n')
+        self.assertEqual(sorted(os.listdir('docs')), ['README.md', 'source'])
+        self.assertEqual(sorted(os.listdir('.')), ['README.md', 'docs', 'dummy_package', 'tests'])
+
+    def test_markdown_headings_in_fences_ignored(self) -> None:
+        '''
+            Test fenced code does not start sections.
+
+            :exceptions: None.
+        '''
+        lines = [
+            '## 📊 Code coverage ##\n', '```bash\n', '# Install\n', '```\n', '<details>\n',
+            '<summary>Coverage</summary>\n', 'old\n', '</details>\n', '# Code coverage example\n',
+            '<summary>Other</summary>\n',
+        ]
+        blocks = {'Code coverage': (lambda: ['new\n'], ['\n'])}
+        self.assertEqual(replace_markdown_sections(lines, blocks), [
+            '## 📊 Code coverage ##\n', '```bash\n', '# Install\n', '```\n', '<details>\n',
+            '<summary>Coverage</summary>\n', 'new\n', '\n', '</details>\n',
+            '# Code coverage example\n', '<summary>Other</summary>\n',
+        ])
+
+    def test_rst_section_ends_at_next_heading(self) -> None:
+        '''
+            Test code-block of a later section is kept.
+
+            :exceptions: None.
+        '''
+        lines = [
+            'Tool structure\n', '~~~~~~~~~~~~~~\n', '\n', 'No tree yet.\n', '\n', 'Usage\n',
+            '~~~~~\n', '\n', '.. code-block:: bash\n', '\n', '    run\n',
+        ]
+        self.assertEqual(replace_rst_sections(lines, {'Tool structure': lambda: ['tree\n']}), lines)
+
+    def test_update_docs_without_structure(self) -> None:
+        '''
+            Test structure sections are kept when layout is unchanged.
+
+            :exceptions: None.
+        '''
+        Path('docs/source/index.rst').unlink()
+        update_docs('dummy_package', COVERAGE, structure=False)
+        readme: str = self.readme_path.read_text(encoding='utf-8')
+        self.assertIn('existing structure line 1\n', readme)
+        self.assertNotIn('existing coverage line 1\n', readme)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,253 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    ats_watch_test.py
+Copyright
+    Copyright (C) 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    ats_coverage is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    ats_coverage is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines resident watch mode test cases.
+'''
+
+from __future__ import annotations
+
+import sys
+import unittest
+from io import StringIO
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+import ats_commands
+from ats_watch import CoverageWatcher
+from tests.ats_base_test import ATSCoverageBaseTestCase
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/ats_coverage'
+__credits__: list[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/ats_coverage/blob/dev/LICENSE'
+__version__: str = '5.0.0'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class ATSWatchTestCase(ATSCoverageBaseTestCase):
+    '''
+        Defines class ATSWatchTestCase with watch mode tests.
+        Tests change polling, module reload and affected test reruns.
+
+        It defines:
+
+            :attributes: None.
+            :methods:
+                | test_changes_detects_edits - Test polling reports edited and added files.
+                | test_edit_reruns_affected_tests - Test edit reloads module and reruns its tests.
+                | test_from_imports_follow_edit - Test from-import bindings refer to the edited module.
+                | test_edit_keeps_unrelated_modules - Test edit drops only the changed module and its importers.
+                | test_watch_survives_broken_edit - Test first poll runs nothing and a broken edit keeps watching.
+                | test_interrupt_stops_watch_only - Test Ctrl+C ends a watch with 0 and propagates in other runs.
+                | test_unknown_core_fails_before_watching - Test unknown core is rejected before polling starts.
+    '''
+
+    def test_changes_detects_edits(self) -> None:
+        '''
+            Test polling reports edited and added files.
+
+            :exceptions: None.
+        '''
+        watcher = CoverageWatcher("dummy_package")
+        changed, layout = watcher.changes()
+        self.assertIn(str((self.pkg_dir / "submodule.py").resolve()), changed)
+        self.assertTrue(layout)
+        self.assertEqual(watcher.changes(), (set(), False))
+
+        (self.pkg_dir / "submodule.py").write_text("VALUE = 10\n", encoding="utf-8")
+        changed, layout = watcher.changes()
+        self.assertEqual(changed, {str((self.pkg_dir / "submodule.py").resolve())})
+        self.assertFalse(layout)
+
+        (self.pkg_dir / "extra.py").write_text("VALUE = 1\n", encoding="utf-8")
+        self.assertTrue(watcher.changes()[1])
+
+    def test_edit_reruns_affected_tests(self) -> None:
+        '''
+            Test edit reloads module and reruns its tests.
+
+            :exceptions: None.
+        '''
+        watcher = CoverageWatcher("dummy_package")
+        output = StringIO()
+
+        with patch("ats_watch.stdout", output), patch("ats_watch.stderr", StringIO()):
+            first = watcher.run_once(*watcher.changes())
+            (self.pkg_dir / "submodule.py").write_text(
+                "def add(a: int, b: int) -> int:\n    return b + a\n\n\n"
+                "def unused() -> None:\n    return None\n",
+                encoding="utf-8"
+            )
+            second = watcher.run_once(*watcher.changes())
+
+        self.assertIn("2 tests run", output.getvalue())
+        self.assertIn("1 tests run", output.getvalue())
+        summary = second["files"]["dummy_package/submodule.py"]["summary"]
+        self.assertEqual(summary["num_statements"], 4)
+        self.assertEqual(summary["missing_lines"], 1)
+        self.assertEqual(
+            second["files"]["dummy_package/__init__.py"], first["files"]["dummy_package/__init__.py"]
+        )
+        self.assertIn("`dummy_package/submodule.py` | 4 | 1 |", self.readme_path.read_text(encoding="utf-8"))
+
+    def test_from_imports_follow_edit(self) -> None:
+        '''
+            Test from-import bindings refer to the edited module.
+
+            :exceptions: None.
+        '''
+        (self.pkg_dir / "calc.py").write_text(
+            "from dummy_package.submodule import add\n\n\ndef double(a: int) -> int:\n    return add(a, a)\n",
+            encoding="utf-8"
+        )
+        (self.test_dir / "calc_test.py").write_text(
+            "import unittest\nfrom dummy_package.calc import double\n\n"
+            "class CalcTest(unittest.TestCase):\n"
+            "    def test_double(self):\n"
+            "        self.assertEqual(double(2), 4)\n",
+            encoding="utf-8"
+        )
+        watcher = CoverageWatcher("dummy_package")
+        loader = MagicMock()
+        loader.return_value.discover.side_effect = AssertionError("test modules rediscovered")
+
+        with patch("ats_watch.stdout", StringIO()), patch("ats_watch.stderr", StringIO()), \
+                patch("ats_watch.TestLoader", loader):
+            watcher.run_once(*watcher.changes())
+            (self.pkg_dir / "submodule.py").write_text(
+                "def add(a: int, b: int) -> int:\n    return b + a\n", encoding="utf-8"
+            )
+            watcher.run_once(*watcher.changes())
+
+        self.assertIs(sys.modules["dummy_package.calc"].add, sys.modules["dummy_package.submodule"].add)
+        self.assertEqual(sys.modules["dummy_package.submodule"].add.__code__.co_code, compile(
+            "def add(a, b):\n    return b + a\n", "", "exec"
+        ).co_consts[0].co_code)
+        loader.return_value.discover.assert_not_called()
+
+    def test_edit_keeps_unrelated_modules(self) -> None:
+        '''
+            Test edit drops only the changed module and its importers.
+
+            :exceptions: None.
+        '''
+        (self.pkg_dir / "calc.py").write_text(
+            "from .submodule import add\n\n\ndef double(a: int) -> int:\n    return add(a, a)\n",
+            encoding="utf-8"
+        )
+        (self.test_dir / "calc_test.py").write_text(
+            "import unittest\nfrom dummy_package.calc import double\nfrom dummy_package.subdir.file import sub\n\n"
+            "class CalcTest(unittest.TestCase):\n"
+            "    def test_double(self):\n"
+            "        self.assertEqual(double(2), 4)\n"
+            "    def test_sub(self):\n"
+            "        self.assertIsNone(sub())\n",
+            encoding="utf-8"
+        )
+        watcher = CoverageWatcher("dummy_package")
+
+        with patch("ats_watch.stdout", StringIO()), patch("ats_watch.stderr", StringIO()):
+            watcher.run_once(*watcher.changes())
+            loaded = {name: sys.modules[name] for name in ("dummy_package", "dummy_package.subdir.file")}
+            calc = sys.modules["dummy_package.calc"]
+            (self.pkg_dir / "submodule.py").write_text(
+                "def add(a: int, b: int) -> int:\n    return b + a\n", encoding="utf-8"
+            )
+            summary = watcher.run_once(*watcher.changes())
+
+        for name, module in loaded.items():
+            self.assertIs(sys.modules[name], module)
+
+        self.assertIsNot(sys.modules["dummy_package.calc"], calc)
+        self.assertEqual(summary["files"]["dummy_package/calc.py"]["summary"]["missing_lines"], 0)
+        self.assertEqual(summary["files"]["dummy_package/subdir/file.py"]["summary"]["missing_lines"], 0)
+
+    def test_watch_survives_broken_edit(self) -> None:
+        '''
+            Test first poll runs nothing and a broken edit keeps watching.
+
+            :exceptions: None.
+        '''
+        submodule = self.pkg_dir / "submodule.py"
+        edits = [
+            "def broken(:\n",
+            "def add(a: int, b: int) -> int:\n    return b + a\n"
+        ]
+
+        def edit(_interval: float) -> None:
+            if not edits:
+                raise KeyboardInterrupt
+            submodule.write_text(edits.pop(0), encoding="utf-8")
+
+        output, errors = StringIO(), StringIO()
+
+        with patch("ats_watch.stdout", output), patch("ats_watch.stderr", errors), \
+                patch("ats_watch.sleep", edit), self.assertRaises(KeyboardInterrupt):
+            CoverageWatcher("dummy_package").run_forever()
+
+        self.assertEqual(output.getvalue().count("--- Test Report ---"), 2)
+        self.assertIn("--- Watch: run failed, waiting for the next change ---", output.getvalue())
+        self.assertIn("ats_coverage: watch run failed:", errors.getvalue())
+        self.assertIn("`dummy_package/submodule.py` | 2 | 0 |", self.readme_path.read_text(encoding="utf-8"))
+
+    def test_interrupt_stops_watch_only(self) -> None:
+        '''
+            Test Ctrl+C ends a watch with 0 and propagates in other runs.
+
+            :exceptions: None.
+        '''
+        output = StringIO()
+
+        with patch.object(ats_commands, "CoverageWatcher") as watcher, patch.object(ats_commands, "stdout", output):
+            watcher.return_value.run_forever.side_effect = KeyboardInterrupt
+
+            with self.assertRaises(SystemExit) as stopped:
+                ats_commands.main(["--watch", "dummy_package"])
+
+        self.assertEqual(stopped.exception.code, 0)
+        self.assertIn("--- Watch stopped ---", output.getvalue())
+
+        with patch.object(ats_commands, "run_coverage", side_effect=KeyboardInterrupt), \
+                self.assertRaises(KeyboardInterrupt):
+            ats_commands.main(["--no-cache", "dummy_package"])
+
+    def test_unknown_core_fails_before_watching(self) -> None:
+        '''
+            Test unknown core is rejected before polling starts.
+
+            :exceptions: None.
+        '''
+        with self.assertRaisesRegex(ValueError, "Unknown core bogus"):
+            CoverageWatcher("dummy_package", core="bogus")
+
+        Path(".coveragerc").write_text("[ats_coverage]\ncore = bogus\n", encoding="utf-8")
+        errors = StringIO()
+
+        with patch.object(ats_commands, "stderr", errors), self.assertRaises(SystemExit) as failed:
+            ats_commands.main(["--watch", "dummy_package"])
+
+        self.assertEqual(failed.exception.code, 128)
+        self.assertIn("Unknown core bogus", errors.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()